@@ -0,0 +1,98 @@
+"""initial schema
+
+Esquema original de la API (professors, students, courses, enrollments).
+Las bases de datos creadas antes de usar Alembic pueden marcarse con
+``alembic stamp 0001`` y aplicar desde ahí las migraciones siguientes.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "professors",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("tittle", sa.String(), nullable=True),
+        sa.Column("contratation_date", sa.Date(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_professors_id", "professors", ["id"])
+    op.create_index("ix_professors_email", "professors", ["email"], unique=True)
+
+    op.create_table(
+        "students",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("birthdate", sa.Date(), nullable=True),
+        sa.Column("degree", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_students_id", "students", ["id"])
+    op.create_index("ix_students_email", "students", ["email"], unique=True)
+
+    op.create_table(
+        "courses",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("code", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("professor_id", sa.Integer(), nullable=True),
+        sa.Column("maximum_capacity", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["professor_id"], ["professors.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_courses_id", "courses", ["id"])
+    op.create_index("ix_courses_code", "courses", ["code"], unique=True)
+
+    op.create_table(
+        "enrollments",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("course_id", sa.Integer(), nullable=False),
+        sa.Column("student_id", sa.Integer(), nullable=False),
+        sa.Column("inscription_date", sa.DateTime(), nullable=True),
+        sa.Column("state", sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(["course_id"], ["courses.id"]),
+        sa.ForeignKeyConstraint(["student_id"], ["students.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("course_id", "student_id", name="uq_course_student"),
+    )
+    op.create_index("ix_enrollments_id", "enrollments", ["id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_enrollments_id", table_name="enrollments")
+    op.drop_table("enrollments")
+    op.drop_index("ix_courses_code", table_name="courses")
+    op.drop_index("ix_courses_id", table_name="courses")
+    op.drop_table("courses")
+    op.drop_index("ix_students_email", table_name="students")
+    op.drop_index("ix_students_id", table_name="students")
+    op.drop_table("students")
+    op.drop_index("ix_professors_email", table_name="professors")
+    op.drop_index("ix_professors_id", table_name="professors")
+    op.drop_table("professors")
@@ -0,0 +1,52 @@
+"""seat counter and enrollment timestamps
+
+- courses.seats_taken: contador de cupos ocupados (se rellena desde
+  las inscripciones existentes).
+- enrollments.created_at / updated_at: requeridos por EnrollmentRead.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("courses") as batch_op:
+        batch_op.add_column(
+            sa.Column("seats_taken", sa.Integer(), nullable=False, server_default="0")
+        )
+
+    with op.batch_alter_table("enrollments") as batch_op:
+        batch_op.add_column(sa.Column("created_at", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+
+    op.execute(
+        "UPDATE courses SET seats_taken = ("
+        " SELECT COUNT(*) FROM enrollments"
+        " WHERE enrollments.course_id = courses.id AND enrollments.state = 'inscrito'"
+        ")"
+    )
+    op.execute("UPDATE enrollments SET created_at = inscription_date, updated_at = inscription_date")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("enrollments") as batch_op:
+        batch_op.drop_column("updated_at")
+        batch_op.drop_column("created_at")
+
+    with op.batch_alter_table("courses") as batch_op:
+        batch_op.drop_column("seats_taken")
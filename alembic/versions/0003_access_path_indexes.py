@@ -0,0 +1,41 @@
+"""access path indexes
+
+Índices para los caminos de acceso de los controladores:
+
+- ix_enrollments_student_course (student_id, course_id):
+  list_courses_of_student, borrado en cascada de un estudiante y
+  liberación de sus cupos. uq_course_student empieza por course_id,
+  así que no sirve para filtrar solo por student_id.
+- ix_enrollments_course_state (course_id, state):
+  inscripciones activas por curso (reconciliación de cupos).
+- ix_courses_professor_id: cursos de un profesor (borrado en cascada).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_enrollments_student_course", "enrollments", ["student_id", "course_id"])
+    op.create_index("ix_enrollments_course_state", "enrollments", ["course_id", "state"])
+    op.create_index("ix_courses_professor_id", "courses", ["professor_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_courses_professor_id", table_name="courses")
+    op.drop_index("ix_enrollments_course_state", table_name="enrollments")
+    op.drop_index("ix_enrollments_student_course", table_name="enrollments")
@@ -0,0 +1,39 @@
+"""enrollment query indexes
+
+Índices de GET /enrollments para los filtros que no cubrían los
+índices existentes:
+
+- ix_enrollments_state_id (state, id): filtro por estado con la
+  paginación keyset (id > cursor ORDER BY id) resuelta en el índice.
+- ix_enrollments_inscription_date: filtros por rango de fechas.
+
+course_id y student_id usan ix_enrollments_course_state e
+ix_enrollments_student_course (0003).
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_enrollments_state_id", "enrollments", ["state", "id"])
+    op.create_index("ix_enrollments_inscription_date", "enrollments", ["inscription_date"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_enrollments_inscription_date", table_name="enrollments")
+    op.drop_index("ix_enrollments_state_id", table_name="enrollments")
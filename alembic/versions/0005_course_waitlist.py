@@ -0,0 +1,47 @@
+"""course waitlist
+
+Tabla waitlist_entries: cola FIFO por curso para los estudiantes que
+encuentran el curso lleno. El orden es el id; la cabeza de la cola se
+busca con ix_waitlist_course_id (course_id, id) y se promueve al
+liberarse un cupo.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "waitlist_entries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("course_id", sa.Integer(), nullable=False),
+        sa.Column("student_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["course_id"], ["courses.id"]),
+        sa.ForeignKeyConstraint(["student_id"], ["students.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("course_id", "student_id", name="uq_waitlist_course_student"),
+    )
+    op.create_index("ix_waitlist_course_id", "waitlist_entries", ["course_id", "id"])
+    op.create_index("ix_waitlist_student_id", "waitlist_entries", ["student_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_waitlist_student_id", table_name="waitlist_entries")
+    op.drop_index("ix_waitlist_course_id", table_name="waitlist_entries")
+    op.drop_table("waitlist_entries")
@@ -0,0 +1,79 @@
+"""search index
+
+Búsqueda de texto en estudiantes, profesores y cursos
+(ver app/core/search.py):
+
+- SQLite: tablas virtuales FTS5 students_fts, professors_fts y
+  courses_fts (rowid = id de la entidad), llenadas con las filas
+  existentes. Las mantienen los controladores.
+- PostgreSQL: columna search_vector (tsvector generado) con índice GIN
+  en cada tabla; la mantiene la base.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# tabla -> [(columna del índice, columna de la tabla)]
+SEARCH_COLUMNS = {
+    "students": [("name", "name"), ("email", "email")],
+    "professors": [("name", "name"), ("email", "email"), ("title", "tittle")],
+    "courses": [("code", "code"), ("name", "name"), ("description", "description")],
+}
+
+
+def _vector_expression(columns) -> str:
+    parts = []
+    for position, (name, column) in enumerate(columns):
+        value = f"coalesce({column}, '')"
+        if name == "email":
+            value = f"translate({value}, '@.', '  ')"
+        parts.append(f"setweight(to_tsvector('simple', {value}), '{'ABC'[min(position, 2)]}')")
+    return " || ".join(parts)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    for table, columns in SEARCH_COLUMNS.items():
+        if dialect == "sqlite":
+            names = ", ".join(name for name, _ in columns)
+            sources = ", ".join(column for _, column in columns)
+            op.execute(
+                f"CREATE VIRTUAL TABLE {table}_fts USING fts5("
+                f"{names}, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+            )
+            op.execute(f"INSERT INTO {table}_fts (rowid, {names}) SELECT id, {sources} FROM {table}")
+
+        elif dialect == "postgresql":
+            op.execute(
+                f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+                f"GENERATED ALWAYS AS ({_vector_expression(columns)}) STORED"
+            )
+            op.execute(f"CREATE INDEX ix_{table}_search_vector ON {table} USING gin (search_vector)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    for table in SEARCH_COLUMNS:
+        if dialect == "sqlite":
+            op.execute(f"DROP TABLE {table}_fts")
+
+        elif dialect == "postgresql":
+            op.execute(f"DROP INDEX ix_{table}_search_vector")
+            op.execute(f"ALTER TABLE {table} DROP COLUMN search_vector")
@@ -0,0 +1,79 @@
+from typing import List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.controllers.course_controller import CourseController
+from app.database.config import settings
+from app.schemas.course_schema import CourseCreate
+
+
+# -------------------------------------------------------------
+# VERSIÓN ASÍNCRONA DEL CONTROLADOR DE CURSOS
+# -------------------------------------------------------------
+# Cada método ejecuta la lógica de CourseController sobre la
+# conexión asíncrona mediante AsyncSession.run_sync(). El I/O contra
+# la base de datos se espera en el event loop (asyncpg / aiosqlite)
+# y las reglas de negocio viven en un solo lugar (OCP + DIP): no hay
+# una segunda copia de las validaciones que mantener.
+# -------------------------------------------------------------
+
+
+class AsyncCourseController:
+
+    @staticmethod
+    async def create(db: AsyncSession, payload: CourseCreate):
+        """Creates a new course record."""
+        return await db.run_sync(CourseController.create, payload)
+
+    @staticmethod
+    async def list_all(
+        db: AsyncSession,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """Returns a page of courses ordered by id."""
+        return await db.run_sync(CourseController.list_all, limit, after, fields)
+
+    @staticmethod
+    async def list_versions(db: AsyncSession, limit: int = settings.DEFAULT_PAGE_SIZE, after: Optional[str] = None):
+        """(id, updated_at) pairs of the list_all page."""
+        return await db.run_sync(CourseController.list_versions, limit, after)
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, course_id: int, fields: Optional[Tuple[str, ...]] = None):
+        """Gets a course by ID."""
+        return await db.run_sync(CourseController.get_by_id, course_id, fields)
+
+    @staticmethod
+    async def get_version(db: AsyncSession, course_id: int):
+        """(id, updated_at) of a course for conditional GETs."""
+        return await db.run_sync(CourseController.get_version, course_id)
+
+    @staticmethod
+    async def get_expanded_versions(db: AsyncSession, course_id: int, relations: Tuple[str, ...]):
+        """(kind, id, updated_at) of a course and its expanded rows."""
+        return await db.run_sync(CourseController.get_expanded_versions, course_id, relations)
+
+    @staticmethod
+    async def get_expanded(
+        db: AsyncSession,
+        course_id: int,
+        relations: Tuple[str, ...],
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """Gets a course with its expanded relations."""
+        return await db.run_sync(CourseController.get_expanded, course_id, relations, fields)
+
+    @staticmethod
+    async def get_many(db: AsyncSession, ids: List[int], fields: Optional[Tuple[str, ...]] = None):
+        """Gets the courses with the given ids, in input order."""
+        return await db.run_sync(CourseController.get_many, ids, fields)
+
+    @staticmethod
+    async def update(db: AsyncSession, course_id: int, payload: CourseCreate, if_match: Optional[str] = None):
+        """Updates an existing course."""
+        return await db.run_sync(CourseController.update, course_id, payload, if_match)
+
+    @staticmethod
+    async def delete(db: AsyncSession, course_id: int):
+        """Deletes a course."""
+        return await db.run_sync(CourseController.delete, course_id)
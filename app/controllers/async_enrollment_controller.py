@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.controllers.enrollment_controller import EnrollmentController
+from app.database.config import settings
+from app.schemas.enrollment_schema import EnrollmentCreate, EnrollmentBulkItem
+
+
+# -------------------------------------------------------------
+# VERSIÓN ASÍNCRONA DEL CONTROLADOR DE INSCRIPCIONES
+# -------------------------------------------------------------
+# Cada método ejecuta la lógica de EnrollmentController sobre la
+# conexión asíncrona mediante AsyncSession.run_sync(). El I/O contra
+# la base de datos se espera en el event loop (asyncpg / aiosqlite)
+# y las reglas de negocio viven en un solo lugar (OCP + DIP): no hay
+# una segunda copia de las validaciones que mantener.
+# -------------------------------------------------------------
+
+
+class AsyncEnrollmentController:
+
+    @staticmethod
+    async def enroll_student(db: AsyncSession, course_id: int, payload: EnrollmentCreate):
+        return await db.run_sync(EnrollmentController.enroll_student, course_id, payload)
+
+    @staticmethod
+    async def bulk_enroll(db: AsyncSession, items: List[EnrollmentBulkItem]):
+        return await db.run_sync(EnrollmentController.bulk_enroll, items)
+
+    @staticmethod
+    async def unenroll_student(db: AsyncSession, course_id: int, student_id: int):
+        return await db.run_sync(EnrollmentController.unenroll_student, course_id, student_id)
+
+    @staticmethod
+    async def list_students_in_course(
+        db: AsyncSession,
+        course_id: int,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None
+    ):
+        return await db.run_sync(EnrollmentController.list_students_in_course, course_id, limit, after)
+
+    @staticmethod
+    async def course_roster_versions(
+        db: AsyncSession,
+        course_id: int,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None
+    ):
+        return await db.run_sync(EnrollmentController.course_roster_versions, course_id, limit, after)
+
+    @staticmethod
+    async def list_courses_of_student(
+        db: AsyncSession,
+        student_id: int,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None
+    ):
+        return await db.run_sync(EnrollmentController.list_courses_of_student, student_id, limit, after)
+
+    @staticmethod
+    async def student_schedule_versions(
+        db: AsyncSession,
+        student_id: int,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None
+    ):
+        return await db.run_sync(EnrollmentController.student_schedule_versions, student_id, limit, after)
+
+    @staticmethod
+    async def list_enrollments(
+        db: AsyncSession,
+        course_id: Optional[int] = None,
+        student_id: Optional[int] = None,
+        state: Optional[str] = None,
+        inscribed_from: Optional[datetime] = None,
+        inscribed_to: Optional[datetime] = None,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None
+    ):
+        return await db.run_sync(
+            EnrollmentController.list_enrollments,
+            course_id, student_id, state, inscribed_from, inscribed_to, limit, after
+        )
+
+    @staticmethod
+    async def enrollment_versions(
+        db: AsyncSession,
+        course_id: Optional[int] = None,
+        student_id: Optional[int] = None,
+        state: Optional[str] = None,
+        inscribed_from: Optional[datetime] = None,
+        inscribed_to: Optional[datetime] = None,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None
+    ):
+        return await db.run_sync(
+            EnrollmentController.enrollment_versions,
+            course_id, student_id, state, inscribed_from, inscribed_to, limit, after
+        )
+
+    @staticmethod
+    async def count_enrollments(
+        db: AsyncSession,
+        course_id: Optional[int] = None,
+        student_id: Optional[int] = None,
+        state: Optional[str] = None,
+        inscribed_from: Optional[datetime] = None,
+        inscribed_to: Optional[datetime] = None
+    ):
+        return await db.run_sync(
+            EnrollmentController.count_enrollments,
+            course_id, student_id, state, inscribed_from, inscribed_to
+        )
@@ -0,0 +1,79 @@
+from typing import List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.controllers.professor_controller import ProfessorController
+from app.database.config import settings
+from app.schemas.professor_schema import ProfessorCreate
+
+
+# -------------------------------------------------------------
+# VERSIÓN ASÍNCRONA DEL CONTROLADOR DE PROFESORES
+# -------------------------------------------------------------
+# Cada método ejecuta la lógica de ProfessorController sobre la
+# conexión asíncrona mediante AsyncSession.run_sync(). El I/O contra
+# la base de datos se espera en el event loop (asyncpg / aiosqlite)
+# y las reglas de negocio viven en un solo lugar (OCP + DIP): no hay
+# una segunda copia de las validaciones que mantener.
+# -------------------------------------------------------------
+
+
+class AsyncProfessorController:
+
+    @staticmethod
+    async def create(db: AsyncSession, payload: ProfessorCreate):
+        """Creates a new professor record."""
+        return await db.run_sync(ProfessorController.create, payload)
+
+    @staticmethod
+    async def list_all(
+        db: AsyncSession,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """Returns a page of professors ordered by id."""
+        return await db.run_sync(ProfessorController.list_all, limit, after, fields)
+
+    @staticmethod
+    async def list_versions(db: AsyncSession, limit: int = settings.DEFAULT_PAGE_SIZE, after: Optional[str] = None):
+        """(id, updated_at) pairs of the list_all page."""
+        return await db.run_sync(ProfessorController.list_versions, limit, after)
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, professor_id: int, fields: Optional[Tuple[str, ...]] = None):
+        """Gets a professor by ID."""
+        return await db.run_sync(ProfessorController.get_by_id, professor_id, fields)
+
+    @staticmethod
+    async def get_version(db: AsyncSession, professor_id: int):
+        """(id, updated_at) of a professor for conditional GETs."""
+        return await db.run_sync(ProfessorController.get_version, professor_id)
+
+    @staticmethod
+    async def get_expanded_versions(db: AsyncSession, professor_id: int, relations: Tuple[str, ...]):
+        """(kind, id, updated_at) of a professor and its expanded rows."""
+        return await db.run_sync(ProfessorController.get_expanded_versions, professor_id, relations)
+
+    @staticmethod
+    async def get_expanded(
+        db: AsyncSession,
+        professor_id: int,
+        relations: Tuple[str, ...],
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """Gets a professor with its expanded relations."""
+        return await db.run_sync(ProfessorController.get_expanded, professor_id, relations, fields)
+
+    @staticmethod
+    async def get_many(db: AsyncSession, ids: List[int], fields: Optional[Tuple[str, ...]] = None):
+        """Gets the professors with the given ids, in input order."""
+        return await db.run_sync(ProfessorController.get_many, ids, fields)
+
+    @staticmethod
+    async def update(db: AsyncSession, professor_id: int, payload: ProfessorCreate, if_match: Optional[str] = None):
+        """Updates an existing professor."""
+        return await db.run_sync(ProfessorController.update, professor_id, payload, if_match)
+
+    @staticmethod
+    async def delete(db: AsyncSession, professor_id: int):
+        """Deletes a professor."""
+        return await db.run_sync(ProfessorController.delete, professor_id)
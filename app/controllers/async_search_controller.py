@@ -0,0 +1,26 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.controllers.search_controller import SearchController
+from app.database.config import settings
+
+
+# -------------------------------------------------------------
+# VERSIÓN ASÍNCRONA DEL CONTROLADOR DE BÚSQUEDA
+# -------------------------------------------------------------
+# Misma lógica que SearchController ejecutada con AsyncSession.run_sync().
+# -------------------------------------------------------------
+
+
+class AsyncSearchController:
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        entity: str,
+        query: str,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        filters: Optional[dict] = None,
+        facets: bool = True,
+    ):
+        return await db.run_sync(SearchController.search, entity, query, limit, after, filters, facets)
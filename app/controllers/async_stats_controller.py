@@ -0,0 +1,30 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.controllers.stats_controller import StatsController
+from app.database.config import settings
+
+
+# -------------------------------------------------------------
+# VERSIÓN ASÍNCRONA DEL CONTROLADOR DE RESÚMENES
+# -------------------------------------------------------------
+# Misma lógica que StatsController ejecutada con AsyncSession.run_sync().
+# -------------------------------------------------------------
+
+
+class AsyncStatsController:
+
+    @staticmethod
+    async def course_stats(db: AsyncSession, limit: int = settings.DEFAULT_PAGE_SIZE, after: Optional[str] = None):
+        return await db.run_sync(StatsController.course_stats, limit, after)
+
+    @staticmethod
+    async def course_stats_versions(db: AsyncSession, limit: int = settings.DEFAULT_PAGE_SIZE, after: Optional[str] = None):
+        return await db.run_sync(StatsController.course_stats_versions, limit, after)
+
+    @staticmethod
+    async def course_stats_by_id(db: AsyncSession, course_id: int):
+        return await db.run_sync(StatsController.course_stats_by_id, course_id)
+
+    @staticmethod
+    async def professor_stats(db: AsyncSession, limit: int = settings.DEFAULT_PAGE_SIZE, after: Optional[str] = None):
+        return await db.run_sync(StatsController.professor_stats, limit, after)
@@ -0,0 +1,79 @@
+from typing import List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.controllers.student_controller import StudentController
+from app.database.config import settings
+from app.schemas.student_schema import StudentCreate
+
+
+# -------------------------------------------------------------
+# VERSIÓN ASÍNCRONA DEL CONTROLADOR DE ESTUDIANTES
+# -------------------------------------------------------------
+# Cada método ejecuta la lógica de StudentController sobre la
+# conexión asíncrona mediante AsyncSession.run_sync(). El I/O contra
+# la base de datos se espera en el event loop (asyncpg / aiosqlite)
+# y las reglas de negocio viven en un solo lugar (OCP + DIP): no hay
+# una segunda copia de las validaciones que mantener.
+# -------------------------------------------------------------
+
+
+class AsyncStudentController:
+
+    @staticmethod
+    async def create(db: AsyncSession, payload: StudentCreate):
+        """Creates a new student record."""
+        return await db.run_sync(StudentController.create, payload)
+
+    @staticmethod
+    async def list_all(
+        db: AsyncSession,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """Returns a page of students ordered by id."""
+        return await db.run_sync(StudentController.list_all, limit, after, fields)
+
+    @staticmethod
+    async def list_versions(db: AsyncSession, limit: int = settings.DEFAULT_PAGE_SIZE, after: Optional[str] = None):
+        """(id, updated_at) pairs of the list_all page."""
+        return await db.run_sync(StudentController.list_versions, limit, after)
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, student_id: int, fields: Optional[Tuple[str, ...]] = None):
+        """Gets a student by ID."""
+        return await db.run_sync(StudentController.get_by_id, student_id, fields)
+
+    @staticmethod
+    async def get_version(db: AsyncSession, student_id: int):
+        """(id, updated_at) of a student for conditional GETs."""
+        return await db.run_sync(StudentController.get_version, student_id)
+
+    @staticmethod
+    async def get_expanded_versions(db: AsyncSession, student_id: int, relations: Tuple[str, ...]):
+        """(kind, id, updated_at) of a student and its expanded rows."""
+        return await db.run_sync(StudentController.get_expanded_versions, student_id, relations)
+
+    @staticmethod
+    async def get_expanded(
+        db: AsyncSession,
+        student_id: int,
+        relations: Tuple[str, ...],
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """Gets a student with its expanded relations."""
+        return await db.run_sync(StudentController.get_expanded, student_id, relations, fields)
+
+    @staticmethod
+    async def get_many(db: AsyncSession, ids: List[int], fields: Optional[Tuple[str, ...]] = None):
+        """Gets the students with the given ids, in input order."""
+        return await db.run_sync(StudentController.get_many, ids, fields)
+
+    @staticmethod
+    async def update(db: AsyncSession, student_id: int, payload: StudentCreate, if_match: Optional[str] = None):
+        """Updates an existing student."""
+        return await db.run_sync(StudentController.update, student_id, payload, if_match)
+
+    @staticmethod
+    async def delete(db: AsyncSession, student_id: int):
+        """Deletes a student."""
+        return await db.run_sync(StudentController.delete, student_id)
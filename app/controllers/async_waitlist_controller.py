@@ -0,0 +1,25 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.controllers.waitlist_controller import WaitlistController
+
+
+# -------------------------------------------------------------
+# VERSIÓN ASÍNCRONA DEL CONTROLADOR DE LISTA DE ESPERA
+# -------------------------------------------------------------
+# Misma lógica que WaitlistController ejecutada con
+# AsyncSession.run_sync() (ver async_enrollment_controller.py).
+# -------------------------------------------------------------
+
+
+class AsyncWaitlistController:
+
+    @staticmethod
+    async def join(db: AsyncSession, course_id: int, student_id: int):
+        return await db.run_sync(WaitlistController.join, course_id, student_id)
+
+    @staticmethod
+    async def status(db: AsyncSession, course_id: int, student_id: int):
+        return await db.run_sync(WaitlistController.status, course_id, student_id)
+
+    @staticmethod
+    async def leave(db: AsyncSession, course_id: int, student_id: int):
+        return await db.run_sync(WaitlistController.leave, course_id, student_id)
@@ -1,7 +1,24 @@
+from typing import List, Optional, Tuple
+from sqlalchemy import delete, exists, func, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from app.controllers.enrollment_controller import EnrollmentController
+from app.core.batch import batch_result, fetch_by_ids
+from app.core.cache import cache_key, entity_cache
+from app.core.conditional import entity_etag, etag_matches
+from app.core.expand import expand_options, expanded_versions
+from app.core.fieldsets import load_fields, select_fields
+from app.core.integrity import is_foreign_key_violation, is_unique_violation
+from app.core.pagination import keyset_page, keyset_versions
+from app.core.search import SearchIndex
+from app.database.config import settings
+from app.database.connection import begin_write
+from app.database.replicas import read_source
 from app.models.course_model import CourseModel
+from app.models.enrollment_model import EnrollmentModel, ENROLLED_STATE
 from app.models.professor_model import ProfessorModel
-from app.schemas.course_schema import CourseCreate
+from app.models.waitlist_model import WaitlistEntryModel
+from app.schemas.course_schema import CourseCreate, CourseRead
 
 
 # -------------------------------------------------------------
@@ -40,74 +57,215 @@ from app.schemas.course_schema import CourseCreate
 # -------------------------------------------------------------
 
 
+def _course_values(payload: CourseCreate) -> dict:
+    """Column values of a course write."""
+    return {
+        "code": payload.code,
+        "name": payload.name,
+        "description": payload.description,
+        "professor_id": payload.professor_id,
+        "maximum_capacity": payload.maximum_capacity,
+    }
+
+
+def _professor_exists(professor_id: Optional[int]) -> tuple:
+    """WHERE criteria requiring the professor to exist (none without professor)."""
+    if professor_id is None:
+        return ()
+    return (exists().where(ProfessorModel.id == professor_id),)
+
+
+def _has_waitlist(course_id: int):
+    """
+    EXISTS over the waitlist of a course, as a RETURNING column. Compara
+    con el parámetro y no con courses.id: dentro de RETURNING las
+    columnas van sin tabla y "id" sería el de waitlist_entries.
+    """
+    return exists().where(WaitlistEntryModel.course_id == course_id).label("has_waitlist")
+
+
 class CourseController:
 
     @staticmethod
     def create(db: Session, payload: CourseCreate):
         """Creates a new course."""
 
-        # Validar código único
-        existing = db.query(CourseModel).filter(CourseModel.code == payload.code).first()
-        if existing:
-            return "code_exists"
-
-        # Validar profesor si se envía profesor_id
-        if payload.professor_id is not None:
-            prof = db.query(ProfessorModel).filter(ProfessorModel.id == payload.professor_id).first()
-            if not prof:
+        # Un solo INSERT ... SELECT ... RETURNING: el SELECT solo produce
+        # la fila si el profesor existe (sin depender de PRAGMA
+        # foreign_keys) y el índice UNIQUE de code detecta el código
+        # repetido (sin SELECT previos)
+        values = _course_values(payload)
+        row = select(
+            *(literal(value, type_=getattr(CourseModel, key).type) for key, value in values.items())
+        ).where(*_professor_exists(payload.professor_id))
+        try:
+            course = db.scalar(
+                insert(CourseModel)
+                .from_select(list(values), row)
+                .returning(CourseModel)
+            )
+        except IntegrityError as error:
+            db.rollback()
+            if is_unique_violation(error, "code"):
+                return "code_exists"
+            if is_foreign_key_violation(error):
                 return "professor_not_found"
+            raise
 
-        course = CourseModel(
-            code=payload.code,
-            name=payload.name,
-            description=payload.description,
-            professor_id=payload.professor_id,
-            maximum_capacity=payload.maximum_capacity,
-        )
+        if course is None:
+            db.rollback()
+            return "professor_not_found"
 
-        db.add(course)
+        # RETURNING ya trajo la fila completa: se separa de la sesión para
+        # que el commit no la expire (sin db.refresh())
+        SearchIndex.put(db, "courses", course)
+        db.expunge(course)
         db.commit()
-        db.refresh(course)
         return course
 
     @staticmethod
-    def list_all(db: Session):
-        """Returns all courses."""
-        return db.query(CourseModel).all()
+    def list_all(
+        db: Session,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """Returns a page of courses ordered by id (keyset pagination)."""
+        query = db.query(CourseModel)
+        if fields:
+            # Solo las columnas pedidas (más id y updated_at)
+            query = select_fields(query, CourseModel, fields)
+        return keyset_page(query, CourseModel.id, limit, after)
 
     @staticmethod
-    def get_by_id(db: Session, course_id: int):
-        """Returns a course by ID."""
-        return db.query(CourseModel).filter(CourseModel.id == course_id).first()
+    def list_versions(db: Session, limit: int = settings.DEFAULT_PAGE_SIZE, after: Optional[str] = None):
+        """(id, updated_at) pairs of the same page as list_all (conditional GET)."""
+        return keyset_versions(db.query(CourseModel), CourseModel.id, CourseModel.updated_at, limit, after)
 
     @staticmethod
-    def update(db: Session, course_id: int, payload: CourseCreate):
-        """Updates a course."""
+    def get_by_id(db: Session, course_id: int, fields: Optional[Tuple[str, ...]] = None):
+        """Returns a course by ID (read-through cache)."""
 
-        course = db.query(CourseModel).filter(CourseModel.id == course_id).first()
-        if not course:
-            return None
+        key = cache_key("courses", course_id)
+        if fields:
+            # Campos parciales: la entidad completa en caché sirve; si no
+            # está, se leen solo esas columnas (la fila parcial no se cachea)
+            cached = entity_cache.lookup(key, read_source(db))
+            if cached is not None:
+                return cached
+            return (
+                select_fields(db.query(CourseModel), CourseModel, fields)
+                .filter(CourseModel.id == course_id)
+                .first()
+            )
 
-        # Validar código único si cambia
-        if payload.code != course.code:
-            existing = db.query(CourseModel).filter(CourseModel.code == payload.code).first()
-            if existing:
-                return "code_in_use"
+        def load():
+            course = db.query(CourseModel).filter(CourseModel.id == course_id).first()
+            return CourseRead.model_validate(course).model_dump(mode="json") if course else None
+
+        return entity_cache.get_or_load(key, load, read_source(db))
+
+    @staticmethod
+    def get_version(db: Session, course_id: int):
+        """
+        (id, updated_at) of a course for conditional GETs: the cached Read
+        dict or a two-column query, never the full row. None when missing.
+        """
+        cached = entity_cache.lookup(cache_key("courses", course_id), read_source(db))
+        if cached is not None:
+            return cached
+        return db.query(CourseModel.id, CourseModel.updated_at).filter(CourseModel.id == course_id).first()
+
+    @staticmethod
+    def get_expanded_versions(db: Session, course_id: int, relations: Tuple[str, ...]):
+        """(kind, id, updated_at) of a course and its expanded rows (one query per relation)."""
+        return expanded_versions(db, "courses", course_id, relations)
+
+    @staticmethod
+    def get_expanded(
+        db: Session,
+        course_id: int,
+        relations: Tuple[str, ...],
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """
+        Gets a course with the `relations` of ?expand= loaded eagerly
+        (one query per collection, none per row). Not cached: the nested
+        rows change with other entities.
+        """
+        query = db.query(CourseModel).options(*expand_options("courses", relations))
+        if fields:
+            query = query.options(load_fields(CourseModel, fields))
+        return query.filter(CourseModel.id == course_id).first()
+
+    @staticmethod
+    def get_many(db: Session, ids: List[int], fields: Optional[Tuple[str, ...]] = None):
+        """
+        Returns the courses with the given ids in input order ({"items",
+        "missing"}), with one IN query per chunk instead of one lookup per id.
+        """
+        query = db.query(CourseModel)
+        if fields:
+            query = select_fields(query, CourseModel, fields)
+        return batch_result(ids, fetch_by_ids(query, CourseModel.id, ids))
+
+    @staticmethod
+    def update(db: Session, course_id: int, payload: CourseCreate, if_match: Optional[str] = None):
+        """
+        Updates a course.
+        Con if_match (cabecera If-Match) devuelve "precondition_failed"
+        si el curso cambió desde que el cliente lo leyó.
+        """
+
+        if if_match is not None:
+            current = (
+                db.query(CourseModel)
+                .filter(CourseModel.id == course_id)
+                .with_for_update()
+                .first()
+            )
+            if not current:
+                return None
+            if not etag_matches(if_match, entity_etag("courses", current.id, current.updated_at)):
+                return "precondition_failed"
 
-        # Validar profesor si se envía
-        if payload.professor_id is not None:
-            prof = db.query(ProfessorModel).filter(ProfessorModel.id == payload.professor_id).first()
-            if not prof:
+        # Un solo UPDATE ... RETURNING; el EXISTS del WHERE descarta el
+        # profesor inexistente y el índice UNIQUE el código repetido. El
+        # RETURNING dice además si el curso tiene lista de espera
+        try:
+            row = db.execute(
+                update(CourseModel)
+                .where(CourseModel.id == course_id, *_professor_exists(payload.professor_id))
+                .values(**_course_values(payload))
+                .returning(CourseModel, _has_waitlist(course_id))
+                .execution_options(populate_existing=True)
+            ).first()
+        except IntegrityError as error:
+            db.rollback()
+            if is_unique_violation(error, "code"):
+                return "code_in_use"
+            if is_foreign_key_violation(error):
                 return "professor_not_found"
+            raise
 
-        course.code = payload.code
-        course.name = payload.name
-        course.description = payload.description
-        course.professor_id = payload.professor_id
-        course.maximum_capacity = payload.maximum_capacity
+        if row is None:
+            # Ninguna fila: o no existe el curso o no existe el profesor
+            found = db.scalar(select(CourseModel.id).where(CourseModel.id == course_id))
+            db.rollback()
+            return "professor_not_found" if found is not None else None
 
+        course, waiting = row
+        has_room = course.maximum_capacity is None or course.seats_taken < course.maximum_capacity
+        if waiting and has_room:
+            # Capacidad ampliada con cola: los cupos nuevos son de la cabeza
+            # de la lista de espera, en la misma transacción
+            if EnrollmentController.promote_waitlist(db, course_id):
+                db.refresh(course)
+
+        SearchIndex.put(db, "courses", course)
+        db.expunge(course)
         db.commit()
-        db.refresh(course)
+        entity_cache.invalidate(cache_key("courses", course_id))
         return course
 
     @staticmethod
@@ -117,6 +275,97 @@ class CourseController:
         if not course:
             return None
 
+        db.execute(delete(WaitlistEntryModel).where(WaitlistEntryModel.course_id == course_id))
+        SearchIndex.remove(db, "courses", [course_id])
         db.delete(course)
         db.commit()
+        entity_cache.invalidate(cache_key("courses", course_id))
         return True
+
+    @staticmethod
+    def reconcile_seat_counters(db: Session, dry_run: bool = False):
+        """
+        Recomputes courses.seats_taken from the enrollments table.
+
+        Returns the list of drifted courses as dicts
+        {"course_id", "seats_taken", "actual"}. With dry_run=True the
+        counters are only reported, not fixed.
+        """
+
+        if not dry_run:
+            begin_write(db)
+
+        actual = (
+            select(func.count(EnrollmentModel.id))
+            .where(
+                EnrollmentModel.course_id == CourseModel.id,
+                EnrollmentModel.state == ENROLLED_STATE
+            )
+            .correlate(CourseModel)
+            .scalar_subquery()
+        )
+
+        drifted = [
+            {"course_id": row.id, "seats_taken": row.seats_taken, "actual": row.actual}
+            for row in
+            db.query(CourseModel.id, CourseModel.seats_taken, actual.label("actual"))
+            .filter(CourseModel.seats_taken != actual)
+            .order_by(CourseModel.id)
+            .all()
+        ]
+
+        if drifted and not dry_run:
+            # Un solo UPDATE: el recálculo y la escritura ocurren en la misma
+            # sentencia, así no se pisan inscripciones concurrentes.
+            db.execute(
+                update(CourseModel)
+                .where(CourseModel.seats_taken != actual)
+                .values(seats_taken=actual)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            entity_cache.invalidate(*(cache_key("courses", row["course_id"]) for row in drifted))
+
+        return drifted
+
+    @staticmethod
+    def rebuild_seat_counters(db: Session):
+        """
+        Recomputes every courses.seats_taken from a single GROUP BY over
+        enrollments (full rebuild, e.g. after a bulk load outside the API).
+        Returns the number of courses whose counter changed.
+        """
+
+        begin_write(db)
+
+        active = (
+            select(EnrollmentModel.course_id, func.count(EnrollmentModel.id).label("actual"))
+            .where(EnrollmentModel.state == ENROLLED_STATE)
+            .group_by(EnrollmentModel.course_id)
+            .subquery()
+        )
+
+        # UPDATE ... FROM con el agregado (PostgreSQL, SQLite >= 3.33)
+        changed = db.execute(
+            update(CourseModel)
+            .where(CourseModel.id == active.c.course_id, CourseModel.seats_taken != active.c.actual)
+            .values(seats_taken=active.c.actual)
+            .returning(CourseModel.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+
+        # Cursos sin inscripciones activas (no aparecen en el agregado)
+        changed += db.execute(
+            update(CourseModel)
+            .where(
+                CourseModel.seats_taken != 0,
+                CourseModel.id.not_in(select(EnrollmentModel.course_id).where(EnrollmentModel.state == ENROLLED_STATE))
+            )
+            .values(seats_taken=0)
+            .returning(CourseModel.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+
+        db.commit()
+        entity_cache.invalidate(*(cache_key("courses", course_id) for course_id in changed))
+        return len(changed)
@@ -1,8 +1,17 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+from sqlalchemy import and_, delete, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from app.core.cache import cache_key, entity_cache
+from app.core.integrity import is_foreign_key_violation, is_unique_violation
+from app.core.pagination import keyset_page, keyset_versions
+from app.database.config import settings
 from app.models.course_model import CourseModel
 from app.models.student_model import StudentModel
-from app.models.enrollment_model import EnrollmentModel
-from app.schemas.enrollment_schema import EnrollmentCreate
+from app.models.enrollment_model import EnrollmentModel, ENROLLED_STATE
+from app.models.waitlist_model import WaitlistEntryModel
+from app.schemas.enrollment_schema import EnrollmentCreate, EnrollmentBulkItem
 
 # -------------------------------------------------------------
 # APLICACIÓN PRINCIPIOS SOLID EN ESTE CONTROLADOR
@@ -40,6 +49,18 @@ from app.schemas.enrollment_schema import EnrollmentCreate
 # -------------------------------------------------------------
 
 
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Las fechas se guardan como UTC sin zona: normaliza los filtros con zona."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _is_duplicate_enrollment(error: IntegrityError) -> bool:
+    """True when `error` violates uq_course_student (SQLite names the columns, PostgreSQL the constraint)."""
+    return is_unique_violation(error, "student_id") or is_unique_violation(error, "course_student")
+
+
 class EnrollmentController:
 
     @staticmethod
@@ -55,31 +76,26 @@ class EnrollmentController:
         if not student:
             return "student_not_found"
 
-        # Validar inscripción duplicada
+        # Validar inscripción duplicada (uq_course_student no distingue estados)
         existing = (
             db.query(EnrollmentModel)
             .filter(
                 EnrollmentModel.course_id == course_id,
-                EnrollmentModel.student_id == payload.student_id,
-                EnrollmentModel.status == "active"
+                EnrollmentModel.student_id == payload.student_id
             )
             .first()
         )
         if existing:
             return "already_enrolled"
 
-        # Validar cupos
-        if course.maximum_capacity is not None:
-            active_count = (
-                db.query(EnrollmentModel)
-                .filter(
-                    EnrollmentModel.course_id == course_id,
-                    EnrollmentModel.status == "active"
-                )
-                .count()
-            )
-            if active_count >= course.maximum_capacity:
-                return "capacity_full"
+        # Con otros estudiantes en la lista de espera, los cupos libres son
+        # suyos (FIFO): la inscripción directa no se adelanta a la cola
+        if EnrollmentController._others_waiting(db, course_id, payload.student_id):
+            return "waitlist_pending"
+
+        # Reclamar un cupo de forma atómica (sin COUNT y sin carreras)
+        if not EnrollmentController._claim_seats(db, course_id, 1):
+            return "capacity_full"
 
         enrollment = EnrollmentModel(
             course_id=course_id,
@@ -87,10 +103,274 @@ class EnrollmentController:
         )
 
         db.add(enrollment)
-        db.commit()
+        # Si estaba en la lista de espera del curso, deja de estarlo
+        db.execute(
+            delete(WaitlistEntryModel).where(
+                WaitlistEntryModel.course_id == course_id,
+                WaitlistEntryModel.student_id == payload.student_id
+            )
+        )
+        try:
+            db.commit()
+        except IntegrityError as error:
+            # El rollback también devuelve el cupo reclamado arriba
+            db.rollback()
+            if _is_duplicate_enrollment(error):
+                # Otra petición concurrente inscribió el mismo par
+                return "already_enrolled"
+            if is_foreign_key_violation(error):
+                # El curso o el estudiante se borró durante la petición
+                if db.query(CourseModel.id).filter(CourseModel.id == course_id).first() is None:
+                    return "course_not_found"
+                return "student_not_found"
+            raise
+
+        # seats_taken / updated_at del curso cambiaron
+        entity_cache.invalidate(cache_key("courses", course_id))
         db.refresh(enrollment)
         return enrollment
 
+    @staticmethod
+    def _others_waiting(db: Session, course_id: int, student_id: int) -> bool:
+        """True when another student is on the course waitlist."""
+        return db.query(
+            select(WaitlistEntryModel.id)
+            .where(WaitlistEntryModel.course_id == course_id, WaitlistEntryModel.student_id != student_id)
+            .exists()
+        ).scalar()
+
+    @staticmethod
+    def _claim_seats(db: Session, course_id: int, seats: int):
+        """
+        Claims `seats` seats of a course with a single conditional UPDATE:
+
+            UPDATE courses SET seats_taken = seats_taken + :seats
+            WHERE id = :id AND (maximum_capacity IS NULL
+                                OR seats_taken + :seats <= maximum_capacity)
+            RETURNING seats_taken, maximum_capacity
+
+        La base de datos evalúa la condición y el incremento en la misma
+        sentencia, así dos peticiones concurrentes nunca sobrevenden el curso.
+        Returns the updated (seats_taken, maximum_capacity) row, or None
+        when there is not enough room.
+        """
+        return db.execute(
+            update(CourseModel)
+            .where(
+                CourseModel.id == course_id,
+                or_(
+                    CourseModel.maximum_capacity.is_(None),
+                    CourseModel.seats_taken + seats <= CourseModel.maximum_capacity
+                )
+            )
+            .values(seats_taken=CourseModel.seats_taken + seats)
+            .returning(CourseModel.seats_taken, CourseModel.maximum_capacity)
+            .execution_options(synchronize_session=False)
+        ).first()
+
+    @staticmethod
+    def _release_seats(db: Session, course_id: int, seats: int = 1):
+        """Gives back `seats` seats of a course (never below zero)."""
+        db.execute(
+            update(CourseModel)
+            .where(CourseModel.id == course_id, CourseModel.seats_taken >= seats)
+            .values(seats_taken=CourseModel.seats_taken - seats)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def bulk_enroll(db: Session, items: List[EnrollmentBulkItem]):
+        """
+        Enrolls many (student_id, course_id) pairs in a single transaction.
+
+        Todas las validaciones se resuelven con consultas por conjuntos
+        (listas IN) en lugar de 4-5 consultas por inscripción:
+          1. cursos existentes + cupos        (1 consulta)
+          2. estudiantes existentes           (1 consulta)
+          3. pares ya inscritos               (1 consulta)
+          4. cursos con lista de espera       (1 consulta)
+          5. reclamo de cupos                 (1 UPDATE condicional por curso)
+          6. inserción multi-fila             (1 INSERT ... RETURNING)
+
+        Si una inscripción concurrente gana la carrera por un par, el
+        INSERT se deshace hasta un SAVEPOINT y se reintenta sin ese par,
+        que queda como "already_enrolled".
+
+        Returns one result per input item, in input order, with
+        status "enrolled" or the same error codes as enroll_student().
+        """
+
+        course_ids = {item.course_id for item in items}
+        student_ids = {item.student_id for item in items}
+
+        courses = {
+            row.id: row for row in
+            db.query(CourseModel.id, CourseModel.maximum_capacity, CourseModel.seats_taken)
+            .filter(CourseModel.id.in_(course_ids))
+            .all()
+        }
+
+        found_students = {
+            row.id for row in
+            db.query(StudentModel.id).filter(StudentModel.id.in_(student_ids)).all()
+        }
+
+        # Filtro por ambas listas IN; el cruce exacto se hace en memoria
+        enrolled_pairs = set(
+            db.query(EnrollmentModel.course_id, EnrollmentModel.student_id)
+            .filter(
+                EnrollmentModel.course_id.in_(course_ids),
+                EnrollmentModel.student_id.in_(student_ids)
+            )
+            .all()
+        )
+
+        # Por curso con cola, el menor y el mayor student_id en espera: si
+        # ambos son el del par, nadie más espera (ver enroll_student)
+        waiting = {
+            row.course_id: (row.first, row.last) for row in
+            db.query(
+                WaitlistEntryModel.course_id,
+                func.min(WaitlistEntryModel.student_id).label("first"),
+                func.max(WaitlistEntryModel.student_id).label("last"),
+            )
+            .filter(WaitlistEntryModel.course_id.in_(course_ids))
+            .group_by(WaitlistEntryModel.course_id)
+            .all()
+        }
+
+        results = []
+        candidates = {}
+        for item in items:
+            pair = (item.course_id, item.student_id)
+            result = {"course_id": item.course_id, "student_id": item.student_id, "enrollment_id": None}
+
+            if item.course_id not in courses:
+                result["status"] = "course_not_found"
+            elif item.student_id not in found_students:
+                result["status"] = "student_not_found"
+            elif pair in enrolled_pairs:
+                result["status"] = "already_enrolled"
+            elif item.course_id in waiting and waiting[item.course_id] != (item.student_id, item.student_id):
+                result["status"] = "waitlist_pending"
+            else:
+                result["status"] = "enrolled"
+                enrolled_pairs.add(pair)
+                candidates.setdefault(item.course_id, []).append(result)
+
+            results.append(result)
+
+        # Un reclamo de cupos por curso. Si otra transacción ocupó cupos
+        # entre la lectura y el UPDATE, se relee el contador y se reintenta
+        # con los que todavía caben.
+        accepted = []
+        for course_id, pending in candidates.items():
+            course = courses[course_id]
+            fits = len(pending)
+            if course.maximum_capacity is not None:
+                fits = max(0, min(fits, course.maximum_capacity - course.seats_taken))
+
+            while fits > 0 and not EnrollmentController._claim_seats(db, course_id, fits):
+                course = (
+                    db.query(CourseModel.maximum_capacity, CourseModel.seats_taken)
+                    .filter(CourseModel.id == course_id)
+                    .first()
+                )
+                if course is None:
+                    break
+                fits -= 1
+                if course.maximum_capacity is not None:
+                    fits = max(0, min(fits, course.maximum_capacity - course.seats_taken))
+
+            if course is None:
+                # El curso se borró después de la primera lectura
+                for result in pending:
+                    result["status"] = "course_not_found"
+                continue
+
+            for result in pending[fits:]:
+                result["status"] = "capacity_full"
+            accepted.extend(pending[:fits])
+
+        rows = []
+        while accepted:
+            try:
+                # SAVEPOINT: un par duplicado sólo deshace el INSERT, no los cupos reclamados
+                with db.begin_nested():
+                    rows = db.execute(
+                        insert(EnrollmentModel).returning(
+                            EnrollmentModel.id,
+                            EnrollmentModel.course_id,
+                            EnrollmentModel.student_id,
+                            sort_by_parameter_order=True
+                        ),
+                        [{"course_id": r["course_id"], "student_id": r["student_id"]} for r in accepted]
+                    ).all()
+                break
+            except IntegrityError as error:
+                # Otra petición concurrente inscribió alguno de los pares entre
+                # la lectura y el INSERT: se marcan como ya inscritos, se
+                # devuelven sus cupos y se reintenta con el resto.
+                remaining = EnrollmentController._drop_enrolled(db, accepted) if _is_duplicate_enrollment(error) else None
+                if remaining is None:
+                    raise
+                accepted = remaining
+
+        if accepted:
+            for result, row in zip(accepted, rows):
+                result["enrollment_id"] = row.id
+
+            # Los inscritos salen de las listas de espera de esos cursos: un
+            # DELETE con un término por curso (uq_waitlist_course_student);
+            # (course_id, student_id) IN (VALUES ...) recorre la tabla en SQLite
+            students_by_course = {}
+            for r in accepted:
+                students_by_course.setdefault(r["course_id"], []).append(r["student_id"])
+            db.execute(
+                delete(WaitlistEntryModel).where(or_(*(
+                    and_(WaitlistEntryModel.course_id == course_id, WaitlistEntryModel.student_id.in_(students))
+                    for course_id, students in students_by_course.items()
+                )))
+            )
+
+        db.commit()
+        entity_cache.invalidate(*(cache_key("courses", course_id) for course_id in candidates))
+
+        enrolled = len(accepted)
+        return {"enrolled": enrolled, "failed": len(results) - enrolled, "results": results}
+
+    @staticmethod
+    def _drop_enrolled(db: Session, accepted: List[dict]) -> List[dict]:
+        """
+        Marks the `accepted` results whose pair is already enrolled as
+        "already_enrolled", gives back their seats and returns the rest
+        (None when none of them is enrolled).
+        """
+        enrolled_pairs = set(
+            db.query(EnrollmentModel.course_id, EnrollmentModel.student_id)
+            .filter(
+                EnrollmentModel.course_id.in_({r["course_id"] for r in accepted}),
+                EnrollmentModel.student_id.in_({r["student_id"] for r in accepted})
+            )
+            .all()
+        )
+
+        released = {}
+        remaining = []
+        for result in accepted:
+            if (result["course_id"], result["student_id"]) in enrolled_pairs:
+                result["status"] = "already_enrolled"
+                released[result["course_id"]] = released.get(result["course_id"], 0) + 1
+            else:
+                remaining.append(result)
+
+        if not released:
+            return None
+
+        for course_id, seats in released.items():
+            EnrollmentController._release_seats(db, course_id, seats)
+        return remaining
+
     @staticmethod
     def unenroll_student(db: Session, course_id: int, student_id: int):
 
@@ -106,24 +386,264 @@ class EnrollmentController:
         if not enrollment:
             return None
 
+        if enrollment.state == ENROLLED_STATE:
+            EnrollmentController._release_seats(db, course_id)
+            # El cupo liberado pasa a la cabeza de la lista de espera en la
+            # misma transacción
+            EnrollmentController.promote_waitlist(db, course_id)
+
         db.delete(enrollment)
         db.commit()
+        entity_cache.invalidate(cache_key("courses", course_id))
         return True
 
     @staticmethod
-    def list_students_in_course(db: Session, course_id: int):
+    def promote_waitlist(db: Session, course_id: int):
+        """
+        Moves students from the head of the course waitlist into the
+        course while seats can be claimed, inside the caller's
+        transaction (the caller commits).
 
-        course = db.query(CourseModel).filter(CourseModel.id == course_id).first()
+        Cada promoción: la cabeza de la cola (ix_waitlist_course_id, una
+        búsqueda en el índice), el reclamo condicional del cupo, el
+        DELETE de la entrada y el INSERT de la inscripción. El resto de la
+        cola no se toca: las posiciones se calculan contando, no se
+        guardan.
+
+        Returns {student_id: enrollment_id} of the promoted students,
+        in queue order.
+        """
+        promoted = {}
+        while True:
+            head = EnrollmentController._waitlist_head(db, course_id)
+            claimed = head is not None and EnrollmentController._claim_seats(db, course_id, 1)
+            if not claimed:
+                break
+
+            # Con el cupo reclamado (fila del curso bloqueada) otra
+            # transacción ya no puede promover en este curso; si la cabeza
+            # leída se fue o la promovió otra antes, se toma la siguiente.
+            while head is not None and db.execute(
+                delete(WaitlistEntryModel).where(WaitlistEntryModel.id == head.id)
+            ).rowcount == 0:
+                head = EnrollmentController._waitlist_head(db, course_id)
+
+            if head is None:
+                EnrollmentController._release_seats(db, course_id)
+                break
+
+            promoted[head.student_id] = db.execute(
+                insert(EnrollmentModel)
+                .values(course_id=course_id, student_id=head.student_id)
+                .returning(EnrollmentModel.id)
+            ).scalar_one()
+
+            # Curso lleno otra vez: no hace falta leer la siguiente cabeza
+            if claimed.maximum_capacity is not None and claimed.seats_taken >= claimed.maximum_capacity:
+                break
+
+        return promoted
+
+    @staticmethod
+    def _waitlist_head(db: Session, course_id: int):
+        """(id, student_id) of the first waitlist entry of a course, or None."""
+        return db.execute(
+            select(WaitlistEntryModel.id, WaitlistEntryModel.student_id)
+            .where(WaitlistEntryModel.course_id == course_id)
+            .order_by(WaitlistEntryModel.id)
+            .limit(1)
+        ).first()
+
+    @staticmethod
+    def _course_roster_query(db: Session, course_id: int):
+        """Students of a course, or None when the course does not exist."""
+
+        # Solo se verifica la existencia: no se carga el curso ni sus relaciones
+        course = db.query(CourseModel.id).filter(CourseModel.id == course_id).first()
         if not course:
-            return "course_not_found"
+            return None
 
-        return [e.student for e in course.enrollments]
+        # Un solo JOIN trae los estudiantes de la página (sin cargas
+        # perezosas de course.enrollments ni de e.student por fila).
+        return (
+            db.query(StudentModel)
+            .join(EnrollmentModel, EnrollmentModel.student_id == StudentModel.id)
+            .filter(EnrollmentModel.course_id == course_id)
+        )
 
     @staticmethod
-    def list_courses_of_student(db: Session, student_id: int):
+    def _student_schedule_query(db: Session, student_id: int):
+        """Courses of a student, or None when the student does not exist."""
 
-        student = db.query(StudentModel).filter(StudentModel.id == student_id).first()
+        student = db.query(StudentModel.id).filter(StudentModel.id == student_id).first()
         if not student:
+            return None
+
+        # Un solo JOIN trae los cursos de la página (sin cargas perezosas
+        # por inscripción).
+        return (
+            db.query(CourseModel)
+            .join(EnrollmentModel, EnrollmentModel.course_id == CourseModel.id)
+            .filter(EnrollmentModel.student_id == student_id)
+        )
+
+    @staticmethod
+    def list_students_in_course(
+        db: Session,
+        course_id: int,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None
+    ):
+
+        query = EnrollmentController._course_roster_query(db, course_id)
+        if query is None:
+            return "course_not_found"
+
+        # Paginación keyset sobre el id del estudiante
+        return keyset_page(query, StudentModel.id, limit, after)
+
+    @staticmethod
+    def course_roster_versions(
+        db: Session,
+        course_id: int,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None
+    ):
+        """(id, updated_at) pairs of the list_students_in_course page (conditional GET)."""
+
+        query = EnrollmentController._course_roster_query(db, course_id)
+        if query is None:
+            return "course_not_found"
+
+        return keyset_versions(query, StudentModel.id, StudentModel.updated_at, limit, after)
+
+    @staticmethod
+    def list_courses_of_student(
+        db: Session,
+        student_id: int,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None
+    ):
+
+        query = EnrollmentController._student_schedule_query(db, student_id)
+        if query is None:
             return "student_not_found"
 
-        return [e.course for e in student.enrollments]
+        # Paginación keyset sobre el id del curso
+        return keyset_page(query, CourseModel.id, limit, after)
+
+    @staticmethod
+    def student_schedule_versions(
+        db: Session,
+        student_id: int,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None
+    ):
+        """(id, updated_at) pairs of the list_courses_of_student page (conditional GET)."""
+
+        query = EnrollmentController._student_schedule_query(db, student_id)
+        if query is None:
+            return "student_not_found"
+
+        return keyset_versions(query, CourseModel.id, CourseModel.updated_at, limit, after)
+
+    # ---------------------------------------------------------
+    # CONSULTA DE INSCRIPCIONES CON FILTROS (GET /enrollments)
+    # ---------------------------------------------------------
+    # Caminos de acceso (todos por índice):
+    #   course_id (+ state)   -> ix_enrollments_course_state
+    #   student_id            -> ix_enrollments_student_course
+    #   state                 -> ix_enrollments_state_id (ya ordenado por id)
+    #   rango de fechas       -> ix_enrollments_inscription_date
+    # ---------------------------------------------------------
+    @staticmethod
+    def _enrollments_query(
+        db: Session,
+        course_id: Optional[int] = None,
+        student_id: Optional[int] = None,
+        state: Optional[str] = None,
+        inscribed_from: Optional[datetime] = None,
+        inscribed_to: Optional[datetime] = None
+    ):
+        """Enrollments matching the filters, or "invalid_date_range"."""
+
+        inscribed_from, inscribed_to = _naive_utc(inscribed_from), _naive_utc(inscribed_to)
+        if inscribed_from is not None and inscribed_to is not None and inscribed_from > inscribed_to:
+            return "invalid_date_range"
+
+        query = db.query(EnrollmentModel)
+        if course_id is not None:
+            query = query.filter(EnrollmentModel.course_id == course_id)
+        if student_id is not None:
+            query = query.filter(EnrollmentModel.student_id == student_id)
+        if state is not None:
+            query = query.filter(EnrollmentModel.state == state)
+        if inscribed_from is not None:
+            query = query.filter(EnrollmentModel.inscription_date >= inscribed_from)
+        if inscribed_to is not None:
+            query = query.filter(EnrollmentModel.inscription_date < inscribed_to)
+        return query
+
+    @staticmethod
+    def list_enrollments(
+        db: Session,
+        course_id: Optional[int] = None,
+        student_id: Optional[int] = None,
+        state: Optional[str] = None,
+        inscribed_from: Optional[datetime] = None,
+        inscribed_to: Optional[datetime] = None,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None
+    ):
+        """
+        Returns a page of enrollments matching the filters, ordered by id.
+        inscribed_to is exclusive.
+        """
+
+        query = EnrollmentController._enrollments_query(
+            db, course_id, student_id, state, inscribed_from, inscribed_to
+        )
+        if isinstance(query, str):
+            return query
+
+        return keyset_page(query, EnrollmentModel.id, limit, after)
+
+    @staticmethod
+    def enrollment_versions(
+        db: Session,
+        course_id: Optional[int] = None,
+        student_id: Optional[int] = None,
+        state: Optional[str] = None,
+        inscribed_from: Optional[datetime] = None,
+        inscribed_to: Optional[datetime] = None,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None
+    ):
+        """(id, updated_at) pairs of the list_enrollments page (conditional GET)."""
+
+        query = EnrollmentController._enrollments_query(
+            db, course_id, student_id, state, inscribed_from, inscribed_to
+        )
+        if isinstance(query, str):
+            return query
+
+        return keyset_versions(query, EnrollmentModel.id, EnrollmentModel.updated_at, limit, after)
+
+    @staticmethod
+    def count_enrollments(
+        db: Session,
+        course_id: Optional[int] = None,
+        student_id: Optional[int] = None,
+        state: Optional[str] = None,
+        inscribed_from: Optional[datetime] = None,
+        inscribed_to: Optional[datetime] = None
+    ):
+        """Number of enrollments matching the filters (a single COUNT)."""
+
+        query = EnrollmentController._enrollments_query(
+            db, course_id, student_id, state, inscribed_from, inscribed_to
+        )
+        if isinstance(query, str):
+            return query
+
+        return {"count": query.with_entities(func.count(EnrollmentModel.id)).scalar()}
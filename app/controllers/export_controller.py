@@ -0,0 +1,84 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.database.config import settings
+from app.models.course_model import CourseModel
+from app.models.enrollment_model import EnrollmentModel
+from app.models.professor_model import ProfessorModel
+from app.models.student_model import StudentModel
+
+
+# -------------------------------------------------------------
+# CONTROLADOR DE EXPORTACIÓN
+# -------------------------------------------------------------
+# Exporta tablas completas sin materializarlas en memoria:
+#
+# - Se usa un SELECT de Core (filas, no objetos ORM) para que la
+#   sesión no acumule entidades en el identity map.
+# - yield_per activa el cursor del lado del servidor (stream_results)
+#   y entrega las filas en lotes de EXPORT_CHUNK_SIZE.
+#
+# Cada método devuelve (columnas, lotes). Los lotes son un generador
+# perezoso: la consulta se ejecuta recién cuando la respuesta empieza
+# a enviarse, y la memoria se mantiene plana sin importar el tamaño.
+# -------------------------------------------------------------
+
+
+class ExportController:
+
+    @staticmethod
+    def _batches(db: Session, statement, chunk_size: int):
+        result = db.execute(statement.execution_options(yield_per=chunk_size))
+        for batch in result.partitions():
+            yield batch
+
+    @staticmethod
+    def _export_table(db: Session, model, chunk_size: int):
+        table = model.__table__
+        statement = select(table).order_by(table.c.id)
+        columns = [column.name for column in table.columns]
+        return columns, ExportController._batches(db, statement, chunk_size)
+
+    @staticmethod
+    def export_students(db: Session, chunk_size: int = settings.EXPORT_CHUNK_SIZE):
+        """Streams every student row."""
+        return ExportController._export_table(db, StudentModel, chunk_size)
+
+    @staticmethod
+    def export_professors(db: Session, chunk_size: int = settings.EXPORT_CHUNK_SIZE):
+        """Streams every professor row."""
+        return ExportController._export_table(db, ProfessorModel, chunk_size)
+
+    @staticmethod
+    def export_courses(db: Session, chunk_size: int = settings.EXPORT_CHUNK_SIZE):
+        """Streams every course row."""
+        return ExportController._export_table(db, CourseModel, chunk_size)
+
+    @staticmethod
+    def export_enrollments(db: Session, chunk_size: int = settings.EXPORT_CHUNK_SIZE):
+        """Streams every enrollment row."""
+        return ExportController._export_table(db, EnrollmentModel, chunk_size)
+
+    @staticmethod
+    def export_course_roster(db: Session, course_id: int, chunk_size: int = settings.EXPORT_CHUNK_SIZE):
+        """Streams the students of a course together with their enrollment data."""
+
+        course = db.query(CourseModel.id).filter(CourseModel.id == course_id).first()
+        if not course:
+            return "course_not_found"
+
+        statement = (
+            select(
+                StudentModel.id.label("student_id"),
+                StudentModel.name,
+                StudentModel.email,
+                StudentModel.degree,
+                EnrollmentModel.id.label("enrollment_id"),
+                EnrollmentModel.state,
+                EnrollmentModel.inscription_date,
+            )
+            .join(EnrollmentModel, EnrollmentModel.student_id == StudentModel.id)
+            .where(EnrollmentModel.course_id == course_id)
+            .order_by(StudentModel.id)
+        )
+        columns = list(statement.selected_columns.keys())
+        return columns, ExportController._batches(db, statement, chunk_size)
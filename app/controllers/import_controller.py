@@ -0,0 +1,159 @@
+from datetime import datetime
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.core.cache import entity_cache
+from app.core.importing import chunked
+from app.core.search import SearchIndex
+from app.database.config import settings
+from app.database.connection import begin_write
+from app.models.professor_model import ProfessorModel
+from app.models.student_model import StudentModel
+from app.schemas.professor_schema import ProfessorCreate
+from app.schemas.student_schema import StudentCreate
+
+
+# -------------------------------------------------------------
+# CONTROLADOR DE IMPORTACIÓN MASIVA
+# -------------------------------------------------------------
+# Importa estudiantes y profesores por lotes:
+#
+#   1. valida cada fila con el mismo schema que usa POST (StudentCreate /
+#      ProfessorCreate) y acumula los errores por número de fila,
+#   2. consulta en un solo SELECT ... IN qué correos del lote ya existen
+#      (solo para reportar created / updated / skipped),
+#   3. escribe el lote con un único INSERT multi-fila con ON CONFLICT
+#      (email) DO UPDATE / DO NOTHING,
+#   4. hace commit por lote.
+#
+# En lugar de un SELECT + INSERT + COMMIT + refresh por fila.
+# -------------------------------------------------------------
+
+ON_CONFLICT_MODES = ("update", "skip")
+
+
+def _student_values(payload: StudentCreate) -> dict:
+    return {
+        "name": payload.name,
+        "email": payload.email,
+        "birthdate": payload.birthdate,
+        "degree": payload.degree,
+    }
+
+
+def _professor_values(payload: ProfessorCreate) -> dict:
+    return {
+        "name": payload.name,
+        "email": payload.email,
+        "tittle": payload.title,
+        "contratation_date": payload.contratation_date,
+    }
+
+
+# entidad -> (modelo, schema de validación, mapeo schema -> columnas)
+IMPORTERS = {
+    "students": (StudentModel, StudentCreate, _student_values),
+    "professors": (ProfessorModel, ProfessorCreate, _professor_values),
+}
+
+
+class ImportController:
+
+    @staticmethod
+    def _upsert_statement(db: Session, model, rows, on_conflict: str):
+        """Multi-row INSERT with the dialect's ON CONFLICT (email) clause."""
+
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            insert = postgresql.insert
+        elif dialect == "sqlite":
+            insert = sqlite.insert
+        else:
+            raise NotImplementedError(f"Bulk import upsert is not supported on {dialect}")
+
+        statement = insert(model).values(rows)
+
+        if on_conflict == "skip":
+            return statement.on_conflict_do_nothing(index_elements=["email"])
+
+        updated = {key: statement.excluded[key] for key in rows[0] if key != "email"}
+        updated["updated_at"] = datetime.utcnow()
+        return statement.on_conflict_do_update(index_elements=["email"], set_=updated)
+
+    @staticmethod
+    def import_rows(
+        db: Session,
+        entity: str,
+        rows,
+        chunk_size: int = settings.IMPORT_CHUNK_SIZE,
+        on_conflict: str = "update"
+    ):
+        """
+        Imports an iterable of (row_number, data, error) tuples
+        (see app.core.importing) into `entity` ("students" | "professors").
+
+        Returns a report dict with the counters and a per-row error list.
+        Each chunk is committed on its own, so a failure in a later chunk
+        does not undo the earlier ones.
+        """
+
+        model, schema, to_values = IMPORTERS[entity]
+        report = {"processed": 0, "created": 0, "updated": 0, "skipped": 0, "failed": 0, "errors": []}
+
+        for chunk in chunked(rows, chunk_size):
+            valid = {}
+            for row_number, data, error in chunk:
+                report["processed"] += 1
+
+                if error is None:
+                    try:
+                        values = to_values(schema.model_validate(data))
+                    except ValidationError as exc:
+                        error = "; ".join(
+                            f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}"
+                            for e in exc.errors()
+                        )
+
+                if error is not None:
+                    report["failed"] += 1
+                    report["errors"].append({"row": row_number, "error": error})
+                    continue
+
+                # El mismo correo repetido en el lote: gana la última fila
+                if values["email"] in valid:
+                    previous_row, _ = valid[values["email"]]
+                    report["skipped"] += 1
+                    report["errors"].append({
+                        "row": previous_row,
+                        "error": f"email: duplicated in file, superseded by row {row_number}"
+                    })
+                valid[values["email"]] = (row_number, values)
+
+            if not valid:
+                continue
+
+            # Cada lote es su propia transacción de escritura (BEGIN IMMEDIATE en SQLite)
+            begin_write(db)
+            existing = {
+                email for (email,) in
+                db.query(model.email).filter(model.email.in_(list(valid))).all()
+            }
+            batch = [values for _, values in valid.values()]
+
+            db.execute(ImportController._upsert_statement(db, model, batch, on_conflict))
+            # Filas creadas o actualizadas del lote: un INSERT ... SELECT al índice
+            SearchIndex.index(db, entity, model.email.in_(list(valid)))
+            db.commit()
+
+            # El upsert resuelve por email, no por id: se descarta la
+            # entidad completa de la caché cuando hubo actualizaciones.
+            if existing and on_conflict == "update":
+                entity_cache.clear(entity)
+
+            report["created"] += len(valid) - len(existing)
+            if on_conflict == "skip":
+                report["skipped"] += len(existing)
+            else:
+                report["updated"] += len(existing)
+
+        return report
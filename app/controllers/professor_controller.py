@@ -1,6 +1,21 @@
-from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from sqlalchemy import delete, insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+from app.core.batch import batch_result, fetch_by_ids
+from app.core.cache import cache_key, entity_cache
+from app.core.conditional import entity_etag, etag_matches
+from app.core.expand import expand_options, expanded_versions
+from app.core.fieldsets import load_fields, select_fields
+from app.core.integrity import is_unique_violation
+from app.core.pagination import keyset_page, keyset_versions
+from app.core.search import SearchIndex
+from app.database.config import settings
+from app.database.replicas import read_source
+from app.models.course_model import CourseModel
 from app.models.professor_model import ProfessorModel
-from app.schemas.professor_schema import ProfessorCreate
+from app.models.waitlist_model import WaitlistEntryModel
+from app.schemas.professor_schema import ProfessorCreate, ProfessorRead
 
 
 # -------------------------------------------------------------
@@ -74,63 +89,182 @@ class ProfessorController:
         - OCP: si mañana agrego validaciones extras, no rompo dependencias.
         """
 
-        # Validar correo único
-        existing = db.query(ProfessorModel).filter(ProfessorModel.email == payload.email).first()
-        if existing:
-            return "email_exists"
+        # Un solo INSERT ... RETURNING: el índice UNIQUE de email detecta
+        # el duplicado (sin SELECT previo ni carrera entre dos altas)
+        try:
+            prof = db.scalar(
+                insert(ProfessorModel)
+                .values(
+                    name=payload.name,
+                    email=payload.email,
+                    tittle=payload.title,
+                    contratation_date=payload.contratation_date,
+                )
+                .returning(ProfessorModel)
+            )
+        except IntegrityError as error:
+            db.rollback()
+            if is_unique_violation(error, "email"):
+                return "email_exists"
+            raise
 
-        prof = ProfessorModel(
-            name=payload.name,
-            email=payload.email,
-            tittle=payload.tittle,
-            contratation_date=payload.contratation_date,
-        )
-
-        db.add(prof)
+        # RETURNING ya trajo la fila completa: se separa de la sesión para
+        # que el commit no la expire (sin db.refresh())
+        SearchIndex.put(db, "professors", prof)
+        db.expunge(prof)
         db.commit()
-        db.refresh(prof)
         return prof
 
     @staticmethod
-    def list_all(db: Session):
+    def list_all(
+        db: Session,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """
+        Returns a page of professors ordered by id.
+
+        Usa paginación por cursor (keyset) sobre el id indexado:
+        el costo de cada página no depende de su profundidad.
+        """
+        query = db.query(ProfessorModel)
+        if fields:
+            # Solo las columnas pedidas (más id y updated_at)
+            query = select_fields(query, ProfessorModel, fields)
+        return keyset_page(query, ProfessorModel.id, limit, after)
+
+    @staticmethod
+    def list_versions(db: Session, limit: int = settings.DEFAULT_PAGE_SIZE, after: Optional[str] = None):
         """
-        Returns all professors.
+        Returns only the (id, updated_at) pairs of the page list_all()
+        would return: the cheap lookup behind conditional GETs.
         """
-        return db.query(ProfessorModel).all()
+        return keyset_versions(db.query(ProfessorModel), ProfessorModel.id, ProfessorModel.updated_at, limit, after)
 
     @staticmethod
-    def get_by_id(db: Session, professor_id: int):
+    def get_by_id(db: Session, professor_id: int, fields: Optional[Tuple[str, ...]] = None):
         """
         Gets a professor by ID.
         """
-        return db.query(ProfessorModel).filter(ProfessorModel.id == professor_id).first()
+
+        key = cache_key("professors", professor_id)
+        if fields:
+            # Campos parciales: la entidad completa en caché sirve; si no
+            # está, se leen solo esas columnas (la fila parcial no se cachea)
+            cached = entity_cache.lookup(key, read_source(db))
+            if cached is not None:
+                return cached
+            return (
+                select_fields(db.query(ProfessorModel), ProfessorModel, fields)
+                .filter(ProfessorModel.id == professor_id)
+                .first()
+            )
+
+        def load():
+            prof = db.query(ProfessorModel).filter(ProfessorModel.id == professor_id).first()
+            return ProfessorRead.model_validate(prof).model_dump(mode="json") if prof else None
+
+        # Read-through: solo se consulta la base de datos en un fallo de caché
+        return entity_cache.get_or_load(key, load, read_source(db))
+
+    @staticmethod
+    def get_version(db: Session, professor_id: int):
+        """
+        (id, updated_at) of a professor for conditional GETs: the cached Read
+        dict or a two-column query, never the full row. None when missing.
+        """
+        cached = entity_cache.lookup(cache_key("professors", professor_id), read_source(db))
+        if cached is not None:
+            return cached
+        return db.query(ProfessorModel.id, ProfessorModel.updated_at).filter(ProfessorModel.id == professor_id).first()
+
+    @staticmethod
+    def get_expanded_versions(db: Session, professor_id: int, relations: Tuple[str, ...]):
+        """(kind, id, updated_at) of a professor and its expanded rows (one query per relation)."""
+        return expanded_versions(db, "professors", professor_id, relations)
 
     @staticmethod
-    def update(db: Session, professor_id: int, payload: ProfessorCreate):
+    def get_expanded(
+        db: Session,
+        professor_id: int,
+        relations: Tuple[str, ...],
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """
+        Gets a professor with the `relations` of ?expand= loaded eagerly
+        (one query per collection, none per row). Not cached: the nested
+        rows change with other entities.
+        """
+        query = db.query(ProfessorModel).options(*expand_options("professors", relations))
+        if fields:
+            query = query.options(load_fields(ProfessorModel, fields))
+        return query.filter(ProfessorModel.id == professor_id).first()
+
+    @staticmethod
+    def get_many(db: Session, ids: List[int], fields: Optional[Tuple[str, ...]] = None):
+        """
+        Returns the professors with the given ids in input order ({"items",
+        "missing"}), with one IN query per chunk instead of one lookup per id.
+        """
+        query = db.query(ProfessorModel)
+        if fields:
+            query = select_fields(query, ProfessorModel, fields)
+        return batch_result(ids, fetch_by_ids(query, ProfessorModel.id, ids))
+
+    @staticmethod
+    def update(db: Session, professor_id: int, payload: ProfessorCreate, if_match: Optional[str] = None):
         """
         Updates an existing professor.
 
         SOLID aplicado:
         - LSP: este método funciona igual con cualquier objeto DB Session.
+
+        if_match: valor de la cabecera If-Match. Si no coincide con la
+        versión actual devuelve "precondition_failed" (412).
         """
 
-        prof = db.query(ProfessorModel).filter(ProfessorModel.id == professor_id).first()
-        if not prof:
-            return None
+        if if_match is not None:
+            current = (
+                db.query(ProfessorModel)
+                .filter(ProfessorModel.id == professor_id)
+                .with_for_update()
+                .first()
+            )
+            if not current:
+                return None
+            if not etag_matches(if_match, entity_etag("professors", current.id, current.updated_at)):
+                return "precondition_failed"
 
-        # Validar correo único si cambia
-        if payload.email != prof.email:
-            existing = db.query(ProfessorModel).filter(ProfessorModel.email == payload.email).first()
-            if existing:
+        # Un solo UPDATE ... RETURNING; el correo repetido lo detecta el
+        # índice UNIQUE
+        try:
+            prof = db.scalar(
+                update(ProfessorModel)
+                .where(ProfessorModel.id == professor_id)
+                .values(
+                    name=payload.name,
+                    email=payload.email,
+                    tittle=payload.title,
+                    contratation_date=payload.contratation_date,
+                )
+                .returning(ProfessorModel)
+                .execution_options(populate_existing=True)
+            )
+        except IntegrityError as error:
+            db.rollback()
+            if is_unique_violation(error, "email"):
                 return "email_in_use"
+            raise
 
-        prof.name = payload.name
-        prof.email = payload.email
-        prof.tittle = payload.tittle
-        prof.contratation_date = payload.contratation_date
+        if prof is None:
+            db.rollback()
+            return None
 
+        SearchIndex.put(db, "professors", prof)
+        db.expunge(prof)
         db.commit()
-        db.refresh(prof)
+        entity_cache.invalidate(cache_key("professors", professor_id))
         return prof
 
     @staticmethod
@@ -142,10 +276,28 @@ class ProfessorController:
         - DIP: dependencia contraída hacia este método, no hacia SQLAlchemy.
         """
 
-        prof = db.query(ProfessorModel).filter(ProfessorModel.id == professor_id).first()
+        # El borrado en cascada recorre cursos e inscripciones: se cargan
+        # con selectinload (2 consultas IN) en vez de una consulta por curso.
+        prof = (
+            db.query(ProfessorModel)
+            .options(selectinload(ProfessorModel.courses).selectinload(CourseModel.enrollments))
+            .filter(ProfessorModel.id == professor_id)
+            .first()
+        )
         if not prof:
             return None
 
+        course_ids = [course.id for course in prof.courses]
+
+        # Las colas de espera de sus cursos no están en la cascada del ORM
+        if course_ids:
+            db.execute(delete(WaitlistEntryModel).where(WaitlistEntryModel.course_id.in_(course_ids)))
+        SearchIndex.remove(db, "professors", [professor_id])
+        SearchIndex.remove(db, "courses", course_ids)
         db.delete(prof)
         db.commit()
+        entity_cache.invalidate(
+            cache_key("professors", professor_id),
+            *(cache_key("courses", course_id) for course_id in course_ids)
+        )
         return True
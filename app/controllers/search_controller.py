@@ -0,0 +1,185 @@
+from typing import Optional
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.orm import Session
+from app.core.pagination import decode_rank_cursor, encode_rank_cursor
+from app.core.search import SEARCH_SPECS, match_clause, parse_terms
+from app.database.config import settings
+from app.models.course_model import CourseModel
+from app.models.professor_model import ProfessorModel
+from app.models.student_model import StudentModel
+
+# -------------------------------------------------------------
+# BÚSQUEDA DE TEXTO (ver app/core/search.py)
+# -------------------------------------------------------------
+# Resultados por relevancia paginados por cursor (puntaje, id): cada
+# página vuelve a evaluar la coincidencia y sigue después del último
+# resultado, sin OFFSET. La página se elige sobre el índice (rowid y
+# puntaje) y solo las filas de esa página se leen de la tabla.
+#
+# El orden es global: el motor puntúa todas las coincidencias (bm25 /
+# ts_rank_cd) y se queda con las limit + 1 mejores (ORDER BY ... LIMIT,
+# un top-k que no ordena el resto). El costo crece con el número de
+# coincidencias, no con el tamaño de la tabla: las consultas selectivas
+# tardan milisegundos y las muy amplias ("va" entre un millón de
+# estudiantes) cientos; afinar la consulta es lo que las acelera.
+#
+# Filtros y facetas por entidad. Las facetas cuentan todas las
+# coincidencias (con los filtros aplicados) por valor de cada filtro y
+# solo se calculan en la primera página. Con más de
+# SEARCH_FACET_MAX_MATCHES coincidencias (un sondeo LIMIT 1 OFFSET n
+# sobre el índice, sin puntaje) se omiten y la respuesta lo indica con
+# facets_omitted=true, en lugar de contar una parte.
+# -------------------------------------------------------------
+
+# Cupos libres: sin límite de capacidad o con asientos sin ocupar
+_SEATS_AVAILABLE = or_(
+    CourseModel.maximum_capacity.is_(None),
+    CourseModel.seats_taken < CourseModel.maximum_capacity
+)
+
+# entidad -> filtro -> condición para un valor
+FILTERS = {
+    "students": {
+        "degree": lambda value: StudentModel.degree == value,
+    },
+    "professors": {
+        "title": lambda value: ProfessorModel.tittle == value,
+    },
+    "courses": {
+        "professor_id": lambda value: CourseModel.professor_id == value,
+        "has_seats": lambda value: _SEATS_AVAILABLE if value else ~_SEATS_AVAILABLE,
+    },
+}
+
+# entidad -> faceta -> expresión agrupada
+FACETS = {
+    "students": {
+        "degree": StudentModel.degree,
+    },
+    "professors": {
+        "title": ProfessorModel.tittle,
+    },
+    "courses": {
+        "professor_id": CourseModel.professor_id,
+        "has_seats": case((_SEATS_AVAILABLE, "true"), else_="false"),
+    },
+}
+
+# Valores por faceta (los más frecuentes)
+FACET_LIMIT = 10
+
+
+class SearchController:
+
+    @staticmethod
+    def search(
+        db: Session,
+        entity: str,
+        query: str,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        filters: Optional[dict] = None,
+        facets: bool = True,
+    ):
+        """
+        Ranked search over `entity` ("students" | "professors" | "courses").
+
+        Returns a dict {"items", "next_cursor", "limit", "facets",
+        "facets_omitted"} or "empty_query" / "invalid_cursor".
+        """
+
+        terms = parse_terms(query)
+        if not terms:
+            return "empty_query"
+
+        cursor = None
+        if after is not None:
+            cursor = decode_rank_cursor(after)
+            if cursor is None:
+                return "invalid_cursor"
+
+        model = SEARCH_SPECS[entity].model
+        source, id_column, match, score = match_clause(db, entity, terms)
+        conditions = [match] + [
+            FILTERS[entity][name](value)
+            for name, value in (filters or {}).items() if value is not None
+        ]
+
+        # En SQLite la coincidencia está en la tabla FTS5; los filtros
+        # necesitan las columnas de la entidad
+        if source is not model.__table__ and len(conditions) > 1:
+            source = source.join(model.__table__, model.__table__.c.id == id_column)
+
+        ranked = select(id_column.label("id"), score.label("score")).select_from(source).where(*conditions)
+        if cursor is not None:
+            last_score, last_id = cursor
+            ranked = ranked.where(or_(score > last_score, and_(score == last_score, id_column > last_id)))
+
+        # Una fila extra para saber si existe una página siguiente
+        ranked = ranked.order_by(score, id_column).limit(limit + 1).subquery()
+        rows = (
+            db.query(model, ranked.c.score)
+            .join(ranked, model.id == ranked.c.id)
+            .order_by(ranked.c.score, ranked.c.id)
+            .all()
+        )
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_rank_cursor(rows[-1].score, rows[-1][0].id)
+
+        result = {
+            "items": [row[0] for row in rows],
+            "next_cursor": next_cursor,
+            "limit": limit,
+            "facets": [],
+            "facets_omitted": False,
+        }
+        if facets and after is None:
+            if SearchController._exceeds(db, source, id_column, conditions, settings.SEARCH_FACET_MAX_MATCHES):
+                result["facets_omitted"] = True
+            else:
+                result["facets"] = SearchController._facets(db, entity, terms, conditions)
+        return result
+
+    @staticmethod
+    def _exceeds(db: Session, source, id_column, conditions, count: int) -> bool:
+        """True when more than `count` rows match (one index probe, no scoring)."""
+        return db.execute(
+            select(id_column)
+            .select_from(source)
+            .where(*conditions)
+            .limit(1)
+            .offset(count)
+        ).first() is not None
+
+    @staticmethod
+    def _facets(db: Session, entity: str, terms, conditions):
+        """Result counts per value of each facet of `entity`."""
+
+        model = SEARCH_SPECS[entity].model
+        source, id_column, _, _ = match_clause(db, entity, terms)
+        if source is not model.__table__:
+            source = source.join(model.__table__, model.__table__.c.id == id_column)
+
+        facets = []
+        for name, expression in FACETS[entity].items():
+            value = expression.label("value")
+            count = func.count().label("count")
+            rows = db.execute(
+                select(value, count)
+                .select_from(source)
+                .where(*conditions)
+                .group_by(expression)
+                .order_by(count.desc(), value)
+                .limit(FACET_LIMIT)
+            ).all()
+            facets.append({
+                "field": name,
+                "values": [
+                    {"value": None if row.value is None else str(row.value), "count": row.count}
+                    for row in rows
+                ],
+            })
+        return facets
@@ -0,0 +1,76 @@
+from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.core.pagination import keyset_page, keyset_versions
+from app.database.config import settings
+from app.models.course_model import CourseModel
+from app.models.professor_model import ProfessorModel
+
+
+# -------------------------------------------------------------
+# RESÚMENES PARA DASHBOARDS (OCUPACIÓN Y CARGA)
+# -------------------------------------------------------------
+# El resumen por curso ya está precalculado: courses.seats_taken se
+# actualiza en la misma transacción que cada inscripción (UPDATE
+# condicional en enroll/bulk, liberación en unenroll y en el borrado
+# de estudiantes) y desaparece con el curso al borrarlo. Por eso estas
+# lecturas cuestan O(cursos) y nunca recorren enrollments:
+#
+#   - course_stats:     una página de courses (inscritos, cupo, % ocupación)
+#   - professor_stats:  professors LEFT JOIN courses agrupado por profesor
+#
+# Si el contador se desvía (cambios por fuera de la API) se recalcula
+# con `python -m app.jobs.reconcile_seats --rebuild`.
+# -------------------------------------------------------------
+
+
+class StatsController:
+
+    @staticmethod
+    def _course_stats_query(db: Session):
+        return db.query(
+            CourseModel.id,
+            CourseModel.code,
+            CourseModel.name,
+            CourseModel.professor_id,
+            CourseModel.seats_taken.label("enrolled"),
+            CourseModel.maximum_capacity.label("capacity"),
+            # Solo para el ETag de la página (no se serializa)
+            CourseModel.updated_at,
+        )
+
+    @staticmethod
+    def course_stats(db: Session, limit: int = settings.DEFAULT_PAGE_SIZE, after: Optional[str] = None):
+        """Page of per-course fill rates ordered by course id."""
+        return keyset_page(StatsController._course_stats_query(db), CourseModel.id, limit, after)
+
+    @staticmethod
+    def course_stats_versions(db: Session, limit: int = settings.DEFAULT_PAGE_SIZE, after: Optional[str] = None):
+        """
+        (id, updated_at) pairs of the course_stats page (conditional GET).
+        Cada cambio de seats_taken actualiza courses.updated_at.
+        """
+        return keyset_versions(db.query(CourseModel), CourseModel.id, CourseModel.updated_at, limit, after)
+
+    @staticmethod
+    def course_stats_by_id(db: Session, course_id: int):
+        """Fill rate of one course, or None when it does not exist."""
+        return StatsController._course_stats_query(db).filter(CourseModel.id == course_id).first()
+
+    @staticmethod
+    def professor_stats(db: Session, limit: int = settings.DEFAULT_PAGE_SIZE, after: Optional[str] = None):
+        """
+        Page of professors with their course count and total students.
+        Suma los contadores de cada curso (ix_courses_professor_id).
+        """
+        query = (
+            db.query(
+                ProfessorModel.id,
+                ProfessorModel.name,
+                func.count(CourseModel.id).label("course_count"),
+                func.coalesce(func.sum(CourseModel.seats_taken), 0).label("total_students"),
+            )
+            .outerjoin(CourseModel, CourseModel.professor_id == ProfessorModel.id)
+            .group_by(ProfessorModel.id, ProfessorModel.name)
+        )
+        return keyset_page(query, ProfessorModel.id, limit, after)
@@ -1,6 +1,23 @@
+from typing import List, Optional, Tuple
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from app.controllers.enrollment_controller import EnrollmentController
+from app.core.batch import batch_result, fetch_by_ids
+from app.core.cache import cache_key, entity_cache
+from app.core.conditional import entity_etag, etag_matches
+from app.core.expand import expand_options, expanded_versions
+from app.core.fieldsets import load_fields, select_fields
+from app.core.integrity import is_unique_violation
+from app.core.pagination import keyset_page, keyset_versions
+from app.core.search import SearchIndex
+from app.database.config import settings
+from app.database.replicas import read_source
+from app.models.course_model import CourseModel
+from app.models.enrollment_model import EnrollmentModel, ENROLLED_STATE
 from app.models.student_model import StudentModel
-from app.schemas.student_schema import StudentCreate
+from app.models.waitlist_model import WaitlistEntryModel
+from app.schemas.student_schema import StudentCreate, StudentRead
 
 
 # -------------------------------------------------------------
@@ -48,56 +65,172 @@ class StudentController:
         Aplicación SRP: este método solo hace creación.
         """
 
-        # Validar correo único
-        existing = db.query(StudentModel).filter(StudentModel.email == payload.email).first()
-        if existing:
-            return "email_exists"
+        # Un solo INSERT ... RETURNING: el índice UNIQUE de email detecta
+        # el duplicado (sin SELECT previo ni carrera entre dos altas)
+        try:
+            student = db.scalar(
+                insert(StudentModel)
+                .values(
+                    name=payload.name,
+                    email=payload.email,
+                    birthdate=payload.birthdate,
+                    degree=payload.degree,
+                )
+                .returning(StudentModel)
+            )
+        except IntegrityError as error:
+            db.rollback()
+            if is_unique_violation(error, "email"):
+                return "email_exists"
+            raise
 
-        student = StudentModel(
-            name=payload.name,
-            email=payload.email,
-            birthdate=payload.birthdate,
-            degree=payload.degree,
-        )
-
-        db.add(student)
+        # RETURNING ya trajo la fila completa: se separa de la sesión para
+        # que el commit no la expire (sin db.refresh())
+        SearchIndex.put(db, "students", student)
+        db.expunge(student)
         db.commit()
-        db.refresh(student)
         return student
 
     @staticmethod
-    def list_all(db: Session):
-        """Returns all students."""
+    def list_all(
+        db: Session,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """Returns a page of students ordered by id (keyset pagination)."""
 
-        return db.query(StudentModel).all()
+        query = db.query(StudentModel)
+        if fields:
+            # Solo las columnas pedidas (más id y updated_at)
+            query = select_fields(query, StudentModel, fields)
+        return keyset_page(query, StudentModel.id, limit, after)
 
     @staticmethod
-    def get_by_id(db: Session, student_id: int):
-        """Gets a student by ID."""
+    def list_versions(db: Session, limit: int = settings.DEFAULT_PAGE_SIZE, after: Optional[str] = None):
+        """(id, updated_at) pairs of the same page as list_all (conditional GET)."""
 
-        return db.query(StudentModel).filter(StudentModel.id == student_id).first()
+        return keyset_versions(db.query(StudentModel), StudentModel.id, StudentModel.updated_at, limit, after)
 
     @staticmethod
-    def update(db: Session, student_id: int, payload: StudentCreate):
-        """Updates a student."""
+    def get_by_id(db: Session, student_id: int, fields: Optional[Tuple[str, ...]] = None):
+        """
+        Gets a student by ID.
+        Read-through: se consulta la caché antes que la base de datos.
+        """
 
-        student = db.query(StudentModel).filter(StudentModel.id == student_id).first()
-        if not student:
-            return None
+        key = cache_key("students", student_id)
+        if fields:
+            # Campos parciales: la entidad completa en caché sirve; si no
+            # está, se leen solo esas columnas (la fila parcial no se cachea)
+            cached = entity_cache.lookup(key, read_source(db))
+            if cached is not None:
+                return cached
+            return (
+                select_fields(db.query(StudentModel), StudentModel, fields)
+                .filter(StudentModel.id == student_id)
+                .first()
+            )
+
+        def load():
+            student = db.query(StudentModel).filter(StudentModel.id == student_id).first()
+            return StudentRead.model_validate(student).model_dump(mode="json") if student else None
+
+        return entity_cache.get_or_load(key, load, read_source(db))
 
-        # Validar correo único si cambia
-        if payload.email != student.email:
-            existing = db.query(StudentModel).filter(StudentModel.email == payload.email).first()
-            if existing:
+    @staticmethod
+    def get_version(db: Session, student_id: int):
+        """
+        (id, updated_at) of a student for conditional GETs: the cached Read
+        dict or a two-column query, never the full row. None when missing.
+        """
+        cached = entity_cache.lookup(cache_key("students", student_id), read_source(db))
+        if cached is not None:
+            return cached
+        return db.query(StudentModel.id, StudentModel.updated_at).filter(StudentModel.id == student_id).first()
+
+    @staticmethod
+    def get_expanded_versions(db: Session, student_id: int, relations: Tuple[str, ...]):
+        """(kind, id, updated_at) of a student and its expanded rows (one query per relation)."""
+        return expanded_versions(db, "students", student_id, relations)
+
+    @staticmethod
+    def get_expanded(
+        db: Session,
+        student_id: int,
+        relations: Tuple[str, ...],
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """
+        Gets a student with the `relations` of ?expand= loaded eagerly
+        (one query per collection, none per row). Not cached: the nested
+        rows change with other entities.
+        """
+        query = db.query(StudentModel).options(*expand_options("students", relations))
+        if fields:
+            query = query.options(load_fields(StudentModel, fields))
+        return query.filter(StudentModel.id == student_id).first()
+
+    @staticmethod
+    def get_many(db: Session, ids: List[int], fields: Optional[Tuple[str, ...]] = None):
+        """
+        Returns the students with the given ids in input order ({"items",
+        "missing"}), with one IN query per chunk instead of one lookup per id.
+        """
+        query = db.query(StudentModel)
+        if fields:
+            query = select_fields(query, StudentModel, fields)
+        return batch_result(ids, fetch_by_ids(query, StudentModel.id, ids))
+
+    @staticmethod
+    def update(db: Session, student_id: int, payload: StudentCreate, if_match: Optional[str] = None):
+        """
+        Updates a student.
+        Con if_match (cabecera If-Match) solo actualiza si la versión
+        actual coincide; si no, devuelve "precondition_failed".
+        """
+
+        if if_match is not None:
+            current = (
+                db.query(StudentModel)
+                .filter(StudentModel.id == student_id)
+                .with_for_update()
+                .first()
+            )
+            if not current:
+                return None
+            if not etag_matches(if_match, entity_etag("students", current.id, current.updated_at)):
+                return "precondition_failed"
+
+        # Un solo UPDATE ... RETURNING; el correo repetido lo detecta el
+        # índice UNIQUE
+        try:
+            student = db.scalar(
+                update(StudentModel)
+                .where(StudentModel.id == student_id)
+                .values(
+                    name=payload.name,
+                    email=payload.email,
+                    birthdate=payload.birthdate,
+                    degree=payload.degree,
+                )
+                .returning(StudentModel)
+                .execution_options(populate_existing=True)
+            )
+        except IntegrityError as error:
+            db.rollback()
+            if is_unique_violation(error, "email"):
                 return "email_in_use"
+            raise
 
-        student.name = payload.name
-        student.email = payload.email
-        student.birthdate = payload.birthdate
-        student.degree = payload.degree
+        if student is None:
+            db.rollback()
+            return None
 
+        SearchIndex.put(db, "students", student)
+        db.expunge(student)
         db.commit()
-        db.refresh(student)
+        entity_cache.invalidate(cache_key("students", student_id))
         return student
 
     @staticmethod
@@ -108,6 +241,33 @@ class StudentController:
         if not student:
             return None
 
+        # Las inscripciones se borran en cascada: liberar sus cupos
+        active_courses = (
+            select(EnrollmentModel.course_id)
+            .where(
+                EnrollmentModel.student_id == student_id,
+                EnrollmentModel.state == ENROLLED_STATE
+            )
+        )
+        released = db.execute(
+            update(CourseModel)
+            .where(CourseModel.id.in_(active_courses), CourseModel.seats_taken > 0)
+            .values(seats_taken=CourseModel.seats_taken - 1)
+            .returning(CourseModel.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+
+        # Sale de las listas de espera; los cupos liberados pasan a la
+        # cabeza de la cola de cada curso
+        db.execute(delete(WaitlistEntryModel).where(WaitlistEntryModel.student_id == student_id))
+        for course_id in released:
+            EnrollmentController.promote_waitlist(db, course_id)
+
+        SearchIndex.remove(db, "students", [student_id])
         db.delete(student)
         db.commit()
+        entity_cache.invalidate(
+            cache_key("students", student_id),
+            *(cache_key("courses", course_id) for course_id in released)
+        )
         return True
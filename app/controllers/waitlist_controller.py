@@ -0,0 +1,133 @@
+from sqlalchemy import delete, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.controllers.enrollment_controller import EnrollmentController
+from app.core.cache import cache_key, entity_cache
+from app.models.course_model import CourseModel
+from app.models.enrollment_model import EnrollmentModel
+from app.models.student_model import StudentModel
+from app.models.waitlist_model import WaitlistEntryModel
+
+# -------------------------------------------------------------
+# LISTA DE ESPERA (cola FIFO por curso)
+# -------------------------------------------------------------
+# En lugar de reintentar enroll_student en bucle ante
+# "capacity_full", el cliente se une a la cola del curso y consulta
+# su posición. Cuando se libera un cupo, unenroll_student (o
+# CourseController.update al ampliar la capacidad) promueve la cabeza de
+# la cola en la misma transacción (EnrollmentController.promote_waitlist),
+# y enroll_student no deja inscribirse directamente mientras otros esperan.
+#
+# La posición no se guarda: es el número de entradas del curso con
+# id <= al de la entrada (un conteo sobre ix_waitlist_course_id), así
+# salir o ser promovido nunca renumera la cola.
+# -------------------------------------------------------------
+
+
+class WaitlistController:
+
+    @staticmethod
+    def join(db: Session, course_id: int, student_id: int):
+        """
+        Adds the student to the course waitlist. If a seat is free (and
+        nobody is ahead in the queue) the student is enrolled right away.
+        """
+
+        course = db.query(CourseModel.id).filter(CourseModel.id == course_id).first()
+        if not course:
+            return "course_not_found"
+
+        student = db.query(StudentModel.id).filter(StudentModel.id == student_id).first()
+        if not student:
+            return "student_not_found"
+
+        enrolled = (
+            db.query(EnrollmentModel.id)
+            .filter(EnrollmentModel.course_id == course_id, EnrollmentModel.student_id == student_id)
+            .first()
+        )
+        if enrolled:
+            return "already_enrolled"
+
+        entry = WaitlistEntryModel(course_id=course_id, student_id=student_id)
+        db.add(entry)
+        try:
+            db.flush()
+        except IntegrityError:
+            # uq_waitlist_course_student: ya estaba en la cola
+            db.rollback()
+            return "already_waitlisted"
+
+        # Cupos libres (curso sin lleno o capacidad ampliada): se llenan
+        # desde la cabeza, que puede ser este mismo estudiante
+        promoted = EnrollmentController.promote_waitlist(db, course_id)
+
+        result = {"course_id": course_id, "student_id": student_id, "joined_at": entry.created_at}
+        if student_id in promoted:
+            result.update(status="enrolled", enrollment_id=promoted[student_id])
+        else:
+            result.update(status="waiting", position=WaitlistController._position(db, course_id, entry.id))
+
+        db.commit()
+        if promoted:
+            entity_cache.invalidate(cache_key("courses", course_id))
+        return result
+
+    @staticmethod
+    def status(db: Session, course_id: int, student_id: int):
+        """
+        Position of the student in the course waitlist, "enrolled" once
+        promoted, or "not_waitlisted".
+        """
+
+        entry = (
+            db.query(WaitlistEntryModel.id, WaitlistEntryModel.created_at)
+            .filter(WaitlistEntryModel.course_id == course_id, WaitlistEntryModel.student_id == student_id)
+            .first()
+        )
+        result = {"course_id": course_id, "student_id": student_id}
+
+        if entry:
+            result.update(
+                status="waiting",
+                position=WaitlistController._position(db, course_id, entry.id),
+                joined_at=entry.created_at
+            )
+            return result
+
+        # Ya no está en la cola: ¿fue promovido?
+        enrollment = (
+            db.query(EnrollmentModel.id)
+            .filter(EnrollmentModel.course_id == course_id, EnrollmentModel.student_id == student_id)
+            .first()
+        )
+        if not enrollment:
+            return "not_waitlisted"
+
+        result.update(status="enrolled", enrollment_id=enrollment.id)
+        return result
+
+    @staticmethod
+    def leave(db: Session, course_id: int, student_id: int):
+        """Removes the student from the course waitlist. None if not waiting."""
+
+        removed = db.execute(
+            delete(WaitlistEntryModel).where(
+                WaitlistEntryModel.course_id == course_id,
+                WaitlistEntryModel.student_id == student_id
+            )
+        ).rowcount
+        if not removed:
+            db.rollback()
+            return None
+
+        db.commit()
+        return True
+
+    @staticmethod
+    def _position(db: Session, course_id: int, entry_id: int) -> int:
+        """1-based place of a waitlist entry (entries of the course with id <= entry_id)."""
+        return db.query(func.count(WaitlistEntryModel.id)).filter(
+            WaitlistEntryModel.course_id == course_id,
+            WaitlistEntryModel.id <= entry_id
+        ).scalar()
@@ -0,0 +1,82 @@
+"""
+Lectura por lista de ids (``GET /courses/?ids=3,1,7``).
+
+El front end arma tarjetas de cursos / estudiantes a partir de ids que
+ya conoce; en vez de un ``GET /courses/{id}`` (y una sesión) por
+tarjeta, una sola petición resuelve toda la lista:
+
+- los ids se leen con un ``WHERE id IN (...)`` por cada BATCH_CHUNK_SIZE
+  ids distintos (una sola consulta en listas normales; las largas no
+  superan el límite de parámetros del motor);
+- la respuesta sigue el orden de entrada: ``items`` trae ``null`` en la
+  posición de cada id que no existe y ``missing`` los lista.
+
+Como en los listados, ``fields=`` restringe las columnas y el par
+ETag / Last-Modified sale de las filas leídas (304 con If-None-Match).
+"""
+
+from typing import Dict, List
+
+from fastapi import Request, Response
+
+from app.core.conditional import batch_validators, conditional_get
+from app.core.serialization import encoded_response
+from app.database.config import settings
+
+
+IDS_DESCRIPTION = (
+    "Comma separated ids to fetch in one request, e.g. 3,1,7 (limit and after are ignored). "
+    "Returns {items, missing}: items in input order, null for ids that do not exist"
+)
+
+# Mayor id representable (BIGINT con signo)
+MAX_ID = 2 ** 63 - 1
+
+
+def parse_ids(raw: str):
+    """
+    Ids of a comma separated list in input order (duplicates kept), or
+    "invalid_ids" / "too_many_ids".
+    """
+    parts = [part.strip() for part in raw.split(",") if part.strip()]
+    # Solo dígitos ASCII ("²" y otros dígitos Unicode pasan isdigit())
+    if not parts or not all(part.isascii() and part.isdecimal() for part in parts):
+        return "invalid_ids"
+    if len(parts) > settings.MAX_BATCH_IDS:
+        return "too_many_ids"
+
+    ids = [int(part) for part in parts]
+    # Fuera de un BIGINT el motor rechaza el parámetro (500)
+    if any(entity_id > MAX_ID for entity_id in ids):
+        return "invalid_ids"
+    return ids
+
+
+def fetch_by_ids(query, id_column, ids: List[int]) -> dict:
+    """
+    Rows of `query` whose `id_column` is in `ids`, keyed by id, with one
+    IN query per BATCH_CHUNK_SIZE distinct ids.
+    """
+    distinct = list(dict.fromkeys(ids))
+    size = settings.BATCH_CHUNK_SIZE
+    found = {}
+    for start in range(0, len(distinct), size):
+        for row in query.filter(id_column.in_(distinct[start:start + size])).all():
+            found[row.id] = row
+    return found
+
+
+def batch_result(ids: List[int], found: Dict[int, object]) -> dict:
+    """{"items", "missing"} in the order of `ids`."""
+    return {
+        "items": [found.get(entity_id) for entity_id in ids],
+        "missing": [entity_id for entity_id in dict.fromkeys(ids) if entity_id not in found],
+    }
+
+
+def batch_response(request: Request, response: Response, entity: str, ids: List[int], batch: dict, response_type):
+    """304 when the client copy is current; otherwise `batch` encoded as `response_type`."""
+    not_modified = conditional_get(request, response, batch_validators(entity, ids, batch))
+    if not_modified:
+        return not_modified
+    return encoded_response(response, response_type, batch)
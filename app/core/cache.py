@@ -0,0 +1,299 @@
+import functools
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import anyio
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+from app.database.config import settings
+from app.database.replicas import PINNED, REPLICA
+
+
+# -------------------------------------------------------------
+# CACHÉ DE ENTIDADES (READ-THROUGH)
+# -------------------------------------------------------------
+# GET /students/{id}, /courses/{id} y /professors/{id} se resuelven
+# primero contra esta caché; solo en un fallo se abre la consulta por
+# clave primaria. Los valores guardados son el schema Read ya
+# serializado (dict JSON), nunca objetos ORM ligados a una sesión.
+#
+# Backends (settings.CACHE_BACKEND):
+#   - "memory": LRU en proceso con TTL y tamaño máximo (por defecto)
+#   - "redis":  Redis o compatible; compartido entre workers
+#   - "none":   desactivada (siempre falla, no guarda nada)
+#
+# Los controladores invalidan las claves después de cada commit que
+# modifica la entidad (update/delete, inscripciones, importaciones).
+# Las lecturas de réplicas no llenan la caché y las de clientes dentro
+# de su ventana read-your-writes no la consultan (ver replicas.py).
+# Con "memory" la invalidación es local al proceso: con varios workers
+# los demás pueden servir el valor anterior hasta que venza el TTL.
+# -------------------------------------------------------------
+
+
+def cache_key(entity: str, entity_id) -> str:
+    """Key of one entity, e.g. "students:42"."""
+    return f"{entity}:{entity_id}"
+
+
+def _blocking_call(method, *args, **kwargs):
+    """
+    Calls a blocking (network) method. Inside AsyncSession.run_sync the
+    controllers run on the event loop: the call goes to a worker thread
+    (anyio.to_thread) and is awaited from the greenlet, like the driver
+    awaits its own I/O.
+    """
+    if in_greenlet():
+        return await_only(anyio.to_thread.run_sync(functools.partial(method, *args, **kwargs)))
+    return method(*args, **kwargs)
+
+
+class _CacheBase:
+    """Counters and the read-through helper shared by every backend."""
+
+    backend = "base"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        # Se incrementa en cada invalidación: una carga que empezó antes
+        # de una escritura no debe dejar en caché el valor anterior.
+        self._generation = 0
+
+    def get(self, key: str):
+        raise NotImplementedError
+
+    def set(self, key: str, value):
+        raise NotImplementedError
+
+    def _delete(self, keys):
+        raise NotImplementedError
+
+    def _clear(self, prefix: Optional[str]):
+        raise NotImplementedError
+
+    def invalidate(self, *keys: str):
+        """Drops the given keys (no-op for keys that are not cached)."""
+        if not keys:
+            return
+        with self._lock:
+            self._generation += 1
+            self._invalidations += len(keys)
+        self._delete(keys)
+
+    def clear(self, entity: Optional[str] = None):
+        """Drops every key of `entity` (or the whole cache)."""
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+        self._clear(f"{entity}:" if entity else None)
+
+    def lookup(self, key: str, source: Optional[str] = None):
+        """get(), skipped (None) for sessions pinned to the primary."""
+        if source == PINNED:
+            return None
+        return self.get(key)
+
+    def get_or_load(self, key: str, load: Callable[[], Optional[dict]], source: Optional[str] = None):
+        """
+        Returns the cached value of `key` or calls load() and caches its
+        result. None (entity not found) is returned but never cached.
+
+        `source` is the read_source() of the session load() reads from:
+        rows read from a REPLICA may predate the last invalidation and
+        are not cached; PINNED sessions skip the lookup and refresh the
+        entry from the primary.
+        """
+        value = self.lookup(key, source)
+        if value is not None:
+            return value
+
+        generation = self._generation
+        value = load()
+        if value is not None and source != REPLICA and generation == self._generation:
+            self.set(key, value)
+        return value
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": self.backend,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+class MemoryCache(_CacheBase):
+    """
+    In-process LRU cache with a per-entry TTL.
+
+    OrderedDict en orden de uso: un acierto mueve la clave al final y,
+    al superar max_entries, se desaloja la primera (la menos usada).
+    Las entradas vencidas se descartan al leerlas y cuentan como desalojo.
+    """
+
+    backend = "memory"
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+                self._evictions += 1
+            self._misses += 1
+            return None
+
+    def set(self, key: str, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _delete(self, keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def _clear(self, prefix: Optional[str]):
+        with self._lock:
+            if prefix is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        data = super().stats()
+        with self._lock:
+            data["entries"] = len(self._entries)
+        data["max_entries"] = self.max_entries
+        data["ttl_seconds"] = self.ttl_seconds
+        return data
+
+
+class RedisCache(_CacheBase):
+    """
+    Redis-compatible backend (Redis, Valkey, KeyDB...).
+
+    El TTL lo aplica Redis (SET ... EX) y el desalojo LRU depende de su
+    política maxmemory; los aciertos y fallos se cuentan en el proceso.
+    Con USE_ASYNC_DB las llamadas corren en un hilo (_blocking_call),
+    fuera del event loop. Requiere el paquete opcional `redis`.
+    """
+
+    backend = "redis"
+
+    def __init__(self, url: str, ttl_seconds: float, namespace: str = "academic"):
+        super().__init__()
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package (pip install redis)") from exc
+
+        self._client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get(self, key: str):
+        raw = _blocking_call(self._client.get, self._key(key))
+        self._count(raw is not None)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value):
+        _blocking_call(self._client.set, self._key(key), json.dumps(value), ex=max(1, int(self.ttl_seconds)))
+
+    def _delete(self, keys):
+        _blocking_call(self._client.delete, *(self._key(key) for key in keys))
+
+    def _clear(self, prefix: Optional[str]):
+        _blocking_call(self._clear_pattern, self._key(f"{prefix or ''}*"))
+
+    def _clear_pattern(self, pattern: str):
+        batch = []
+        for key in self._client.scan_iter(match=pattern, count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                self._client.delete(*batch)
+                batch.clear()
+        if batch:
+            self._client.delete(*batch)
+
+    def stats(self) -> dict:
+        data = super().stats()
+        # Desalojos por maxmemory y vencimientos por TTL los lleva el servidor
+        info = self._client.info("stats")
+        data["evictions"] = info.get("evicted_keys", 0)
+        data["expired"] = info.get("expired_keys", 0)
+        return data
+
+
+class NullCache(_CacheBase):
+    """Disabled cache: every lookup is a miss and nothing is stored."""
+
+    backend = "none"
+
+    def get(self, key: str):
+        self._count(False)
+        return None
+
+    def set(self, key: str, value):
+        pass
+
+    def _delete(self, keys):
+        pass
+
+    def _clear(self, prefix: Optional[str]):
+        pass
+
+
+def build_cache(backend: Optional[str] = None):
+    """Builds the cache backend selected in settings.CACHE_BACKEND."""
+
+    backend = (backend or settings.CACHE_BACKEND).lower()
+
+    if backend == "memory":
+        return MemoryCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+
+    if backend == "redis":
+        return RedisCache(settings.CACHE_REDIS_URL, settings.CACHE_TTL_SECONDS)
+
+    if backend == "none":
+        return NullCache()
+
+    raise ValueError(f"Unknown CACHE_BACKEND: {backend!r} (expected memory, redis or none)")
+
+
+entity_cache = build_cache()
@@ -0,0 +1,194 @@
+"""
+Peticiones condicionales (ETag / Last-Modified).
+
+Los validadores se derivan de ``updated_at``:
+
+- Entidad:    ETag débil = hash(entidad, id, updated_at)
+              Last-Modified = updated_at
+- Colección:  ETag débil = hash de los pares (id, updated_at) de la
+              página y de si existe una página siguiente
+- Lote (?ids=): ETag débil = hash de los ids pedidos y de los pares
+              (id, updated_at) encontrados
+- Expandido (?expand=): ETag débil = hash de la entidad y de cada fila
+              anidada
+
+Colecciones, lotes y expandidos no llevan Last-Modified: borrar una
+fila no cambia el max(updated_at) de las restantes, así que un
+``If-Modified-Since`` respondería 304 con una copia vieja. Su ETag sí
+cubre qué filas están.
+
+Las rutas responden 304 con ``If-None-Match`` / ``If-Modified-Since``
+a partir de la consulta barata de versiones (pares id, updated_at, sin
+cargar ni serializar las filas completas) y los PUT aceptan
+``If-Match`` como precondición optimista (412 si el recurso cambió).
+
+Las comparaciones son débiles (RFC 9110 §8.8.3.2): todas las ETags que
+emite la API son débiles.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Tuple
+
+from fastapi import Request, Response
+
+
+Validators = Tuple[str, Optional[datetime]]
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    """updated_at as a naive UTC datetime (ORM value or cached ISO string)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _weak_etag(*parts) -> str:
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def _field(item, name):
+    return item[name] if isinstance(item, dict) else getattr(item, name)
+
+
+def entity_etag(entity: str, entity_id, updated_at) -> str:
+    """Weak ETag of one row."""
+    updated_at = _as_datetime(updated_at)
+    return _weak_etag(entity, entity_id, updated_at.isoformat() if updated_at else "")
+
+
+def entity_validators(entity: str, item) -> Validators:
+    """(ETag, Last-Modified) of an ORM object or a cached Read dict."""
+    updated_at = _as_datetime(_field(item, "updated_at"))
+    return entity_etag(entity, _field(item, "id"), updated_at), updated_at
+
+
+def versions_validators(entity: str, window: dict) -> Validators:
+    """(ETag, None) of a keyset_versions() window."""
+    versions = [(entity_id, _as_datetime(updated_at)) for entity_id, updated_at in window["versions"]]
+    parts = [f"{entity_id}@{updated_at.isoformat() if updated_at else ''}" for entity_id, updated_at in versions]
+    return _weak_etag(f"{entity}:page", window["has_more"], *parts), None
+
+
+def page_validators(entity: str, page: dict) -> Validators:
+    """
+    (ETag, None) of a keyset_page() result. Produces the same values as
+    versions_validators() over the same window.
+    """
+    window = {
+        "versions": [(_field(item, "id"), _field(item, "updated_at")) for item in page["items"]],
+        "has_more": page["next_cursor"] is not None,
+    }
+    return versions_validators(entity, window)
+
+
+def batch_validators(entity: str, ids, batch: dict) -> Validators:
+    """
+    (ETag, None) of a batch_result(): the requested ids plus the
+    (id, updated_at) of every row found.
+    """
+    stamps = [
+        (_field(item, "id"), _as_datetime(_field(item, "updated_at")))
+        for item in batch["items"] if item is not None
+    ]
+    parts = [f"{entity_id}@{updated_at.isoformat() if updated_at else ''}" for entity_id, updated_at in stamps]
+    return _weak_etag(f"{entity}:batch", ",".join(str(entity_id) for entity_id in ids), *parts), None
+
+
+def expanded_stamps(entity: str, item, relations):
+    """(kind, id, updated_at) of a loaded entity and of every nested row."""
+    stamps = [(entity, item.id, item.updated_at)]
+    for name in relations:
+        related = getattr(item, name)
+        rows = related if isinstance(related, list) else [related] if related is not None else []
+        stamps.extend((name, row.id, row.updated_at) for row in rows)
+    return stamps
+
+
+def expanded_validators(entity: str, relations, stamps) -> Validators:
+    """
+    (ETag, None) of an entity with expanded relations from its
+    expanded_stamps() (or the same triples read by expanded_versions()):
+    a change in the professor or the roster also changes the ETag.
+    """
+    parts = [
+        f"{kind}:{row_id}@{updated_at.isoformat() if updated_at else ''}"
+        for kind, row_id, updated_at in ((kind, row_id, _as_datetime(value)) for kind, row_id, value in stamps)
+    ]
+    return _weak_etag(f"{entity}:expanded", *relations, *parts), None
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-Match / If-None-Match header against `etag`."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return any(opaque(tag) == opaque(etag) for tag in header.split(","))
+
+
+def _http_date(value: datetime) -> str:
+    return format_datetime(value.replace(microsecond=0, tzinfo=timezone.utc), usegmt=True)
+
+
+def wants_revalidation(request: Request) -> bool:
+    """True when the client sent If-None-Match or If-Modified-Since."""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    Evaluates the GET preconditions. If-None-Match takes precedence;
+    If-Modified-Since is only used when the client sent no ETag.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+
+    # Last-Modified viaja con resolución de segundos
+    return last_modified.replace(microsecond=0) <= since
+
+
+def set_validators(response: Response, etag: str, last_modified: Optional[datetime]):
+    """Adds the ETag / Last-Modified headers to a response."""
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = _http_date(last_modified)
+
+
+def conditional_get(request: Request, response: Response, validators: Validators) -> Optional[Response]:
+    """
+    Sets the validators on `response` and returns a bodiless 304 when the
+    client's cached copy is still fresh (None otherwise).
+    """
+    etag, last_modified = validators
+    set_validators(response, etag, last_modified)
+
+    if not is_not_modified(request, etag, last_modified):
+        return None
+
+    not_modified = Response(status_code=304)
+    set_validators(not_modified, etag, last_modified)
+    return not_modified
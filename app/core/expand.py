@@ -0,0 +1,154 @@
+"""
+Recursos compuestos (``?expand=professor,students``).
+
+La página de detalle de un curso necesita el curso, su profesor y su
+roster; sin expansión son tres peticiones (tres sesiones) y, si se
+navegan las relaciones del ORM, una carga perezosa por fila. Con
+``expand`` el detalle trae las relaciones pedidas anidadas con su
+schema Read, en un número fijo de consultas:
+
+- relaciones a uno (course.professor): ``joinedload``, en la misma
+  consulta que la entidad;
+- colecciones (roster, inscripciones, cursos): ``selectinload``, una
+  consulta ``IN`` por relación, sin importar cuántas filas traiga.
+
+Las colecciones vienen completas y ordenadas por id (no se paginan).
+La respuesta se serializa con un schema Read extendido con las
+relaciones pedidas (``expanded_schema``, creado una vez por
+combinación). Una relación desconocida devuelve ``"invalid_expand"``
+(400 en las rutas).
+
+Para las peticiones condicionales, ``expanded_versions`` lee solo los
+pares (id, updated_at) de la entidad y de cada relación (una consulta
+por relación) en el mismo orden en que se cargan las filas.
+"""
+
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from pydantic import Field, create_model
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
+
+from app.models.course_model import CourseModel
+from app.models.professor_model import ProfessorModel
+from app.models.student_model import StudentModel
+from app.schemas.course_schema import CourseRead
+from app.schemas.enrollment_schema import EnrollmentRead
+from app.schemas.professor_schema import ProfessorRead
+from app.schemas.student_schema import StudentRead
+
+
+class Expansion(NamedTuple):
+    """One expandable relation: ORM attribute, loader strategy and nested response type."""
+
+    attribute: Any
+    loader: Any
+    annotation: Any
+    description: str
+
+
+# entidad -> relación -> expansión (en el orden en que se serializan)
+EXPANSIONS = {
+    "courses": {
+        "professor": Expansion(CourseModel.professor, joinedload, Optional[ProfessorRead], "Professor teaching the course"),
+        "students": Expansion(CourseModel.students, selectinload, List[StudentRead], "Students enrolled in the course"),
+        "enrollments": Expansion(CourseModel.enrollments, selectinload, List[EnrollmentRead], "Enrollments of the course"),
+    },
+    "students": {
+        "courses": Expansion(StudentModel.courses, selectinload, List[CourseRead], "Courses the student is enrolled in"),
+        "enrollments": Expansion(StudentModel.enrollments, selectinload, List[EnrollmentRead], "Enrollments of the student"),
+    },
+    "professors": {
+        "courses": Expansion(ProfessorModel.courses, selectinload, List[CourseRead], "Courses taught by the professor"),
+    },
+}
+
+
+MODELS = {
+    "courses": CourseModel,
+    "students": StudentModel,
+    "professors": ProfessorModel,
+}
+
+
+def expand_description(entity: str) -> str:
+    return f"Comma separated relations to embed: {','.join(EXPANSIONS[entity])}"
+
+
+def parse_expand(raw: Optional[str], entity: str):
+    """
+    Requested relations of `entity` in registry order, None when `raw`
+    is empty, or "invalid_expand".
+    """
+    if raw is None:
+        return None
+
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    if not requested:
+        return None
+    if not requested <= set(EXPANSIONS[entity]):
+        return "invalid_expand"
+
+    return tuple(name for name in EXPANSIONS[entity] if name in requested)
+
+
+def expand_options(entity: str, relations: Tuple[str, ...]):
+    """Loader options (joinedload / selectinload) for `relations`."""
+    expansions = EXPANSIONS[entity]
+    return [expansions[name].loader(expansions[name].attribute) for name in relations]
+
+
+def expanded_versions(db: Session, entity: str, entity_id: int, relations: Tuple[str, ...]):
+    """
+    (kind, id, updated_at) of the entity and of every row of `relations`
+    (see conditional.expanded_stamps), or None when the entity does not
+    exist. Like the loaders, relations to one come in the entity's query
+    (outer join) and each collection in one query ordered by id.
+    """
+    model = MODELS[entity]
+    expansions = EXPANSIONS[entity]
+    to_one = {
+        name: aliased(expansions[name].attribute.property.mapper.class_)
+        for name in relations if expansions[name].loader is joinedload
+    }
+
+    columns = [model.id, model.updated_at]
+    for target in to_one.values():
+        columns += [target.id, target.updated_at]
+    query = db.query(*columns)
+    for name, target in to_one.items():
+        query = query.outerjoin(target, expansions[name].attribute.of_type(target))
+    row = query.filter(model.id == entity_id).first()
+    if row is None:
+        return None
+
+    stamps = [(entity, row[0], row[1])]
+    for name in relations:
+        if name in to_one:
+            position = 2 + 2 * list(to_one).index(name)
+            if row[position] is not None:
+                stamps.append((name, row[position], row[position + 1]))
+            continue
+
+        target = expansions[name].attribute.property.mapper.class_
+        rows = (
+            db.query(target.id, target.updated_at)
+            .select_from(model)
+            .join(expansions[name].attribute)
+            .filter(model.id == entity_id)
+            .order_by(target.id)
+            .all()
+        )
+        stamps.extend((name, related.id, related.updated_at) for related in rows)
+    return stamps
+
+
+@lru_cache(maxsize=None)
+def expanded_schema(schema, entity: str, relations: Tuple[str, ...]):
+    """`schema` (Read or sparse) plus the nested `relations` (cached per combination)."""
+    expansions = EXPANSIONS[entity]
+    definitions = {
+        name: (expansions[name].annotation, Field(..., description=expansions[name].description))
+        for name in relations
+    }
+    return create_model(f"{schema.__name__}Expanded", __base__=schema, **definitions)
@@ -0,0 +1,77 @@
+"""
+Conjuntos de campos parciales (``?fields=id,name,code``).
+
+Los clientes móviles solo necesitan algunas columnas. Con ``fields``:
+
+- la consulta lee solo esas columnas, más ``id`` (cursor e identidad) y
+  ``updated_at`` (ETag / Last-Modified), que siempre se leen. Listas,
+  detalle y lotes piden tuplas de columnas (``select_fields``), sin
+  instancias ORM: con ``load_only`` cada fila seguía creando su
+  instancia, su entrada en el identity map y un cargador diferido por
+  columna omitida, y la página parcial no era más rápida que la
+  completa. ``?expand=`` necesita las relaciones y usa ``load_only``
+  (``load_fields``);
+- la respuesta se serializa con un schema Read restringido a esos
+  campos (``sparse_schema``, creado una vez por combinación).
+
+``id`` siempre se incluye en la respuesta. Un campo que no existe en el
+schema Read devuelve ``"invalid_fields"`` (400 en las rutas).
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from pydantic import ConfigDict, create_model
+from sqlalchemy.orm import load_only
+
+
+# Columnas que se cargan aunque no se pidan
+ALWAYS_LOADED = ("id", "updated_at")
+
+FIELDS_DESCRIPTION = "Comma separated fields to return, e.g. id,name,code (id is always included)"
+
+
+def parse_fields(raw: Optional[str], schema):
+    """
+    Requested fields of `schema` in schema order (id always included),
+    None when `raw` is empty, or "invalid_fields".
+    """
+    if raw is None:
+        return None
+
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    if not requested:
+        return None
+    if not requested <= set(schema.model_fields):
+        return "invalid_fields"
+
+    return tuple(name for name in schema.model_fields if name in requested or name == "id")
+
+
+@lru_cache(maxsize=None)
+def sparse_schema(schema, fields: Tuple[str, ...]):
+    """Copy of `schema` with only `fields` (cached per combination)."""
+    definitions = {
+        name: (info.annotation, info)
+        for name, info in schema.model_fields.items()
+        if name in fields
+    }
+    return create_model(f"{schema.__name__}Fields", __config__=ConfigDict(from_attributes=True), **definitions)
+
+
+def _loaded_names(fields: Tuple[str, ...]):
+    """`fields` plus id and updated_at, without repeats."""
+    return dict.fromkeys((*ALWAYS_LOADED, *fields))
+
+
+def select_fields(query, model, fields: Tuple[str, ...]):
+    """
+    `query` returning plain rows with the columns behind `fields` plus id
+    and updated_at, labelled with the schema names (no ORM instances).
+    """
+    return query.with_entities(*(getattr(model, name).label(name) for name in _loaded_names(fields)))
+
+
+def load_fields(model, fields: Tuple[str, ...]):
+    """load_only() option for the columns behind `fields` plus id and updated_at."""
+    return load_only(*(getattr(model, name) for name in _loaded_names(fields)))
@@ -0,0 +1,474 @@
+"""
+Claves de idempotencia (cabecera ``Idempotency-Key``) en los POST.
+
+Un cliente móvil que reintenta ``POST /enrollments/course/{id}`` o
+``POST /students/`` tras un timeout no sabe si el primer intento llegó a
+la base. Con la misma ``Idempotency-Key`` el reintento recibe la
+respuesta del primero (mismo estado, cabeceras y cuerpo, más
+``Idempotent-Replayed: true``) en lugar de volver a validar y terminar
+en un falso "already enrolled" o "email exists".
+
+Funcionamiento (middleware ASGI, por fuera del enrutado):
+
+- la entrada se identifica por cliente y clave. El cliente es el
+  usuario autenticado (``scope["user"]``, p. ej. AuthenticationMiddleware
+  de Starlette) si lo hay; si no, la cabecera IDEMPOTENCY_CLIENT_HEADER
+  solo cuando está configurada (vacía por defecto: la envía el cliente y
+  cualquiera podría usar la de otro; configurarla solo detrás de un
+  gateway que la fija tras autenticar); si no, la IP de la conexión
+  (detrás de un proxy, uvicorn --proxy-headers para ver la del cliente);
+- el primer POST reserva la entrada ("en curso") antes de llegar a la
+  ruta; al terminar guarda la respuesta si no es un 5xx (un 5xx o una
+  excepción liberan la reserva para que el reintento se ejecute);
+- un duplicado concurrente espera a que termine el original hasta
+  IDEMPOTENCY_WAIT_SECONDS y recibe su respuesta (409 si sigue en curso);
+- una repetición se responde desde el almacén: no abre sesión ni toca
+  las tablas de entidades;
+- reutilizar la clave con otro método, ruta o cuerpo responde 422;
+- las reservas en curso nunca se desalojan: con el almacén lleno de
+  reservas una clave nueva responde 503 (Retry-After) en lugar de
+  desalojar una y ejecutar dos veces la misma petición.
+
+Almacenes (settings.IDEMPOTENCY_BACKEND), como la caché de entidades:
+  - "memory": en proceso, con TTL y máximo de entradas (se desalojan
+              las respuestas guardadas más antiguas, nunca las reservas)
+  - "redis":  compartido entre workers (SET NX para la reserva); sus
+              llamadas corren en un hilo (anyio.to_thread), fuera del
+              event loop
+Con "memory" y varios workers, un reintento que cae en otro worker no
+ve la entrada del primero.
+"""
+
+import base64
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import anyio
+from starlette.responses import JSONResponse
+
+from app.database.config import settings
+
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+REPLAYED_HEADER = b"idempotent-replayed"
+MAX_KEY_LENGTH = 255
+
+# Métodos no idempotentes por definición (PUT y DELETE ya lo son)
+_METHODS = ("POST",)
+
+# Cabeceras propias de la ejecución original: no se repiten
+_NOT_STORED = (b"server-timing",)
+
+# Resultados de reserve()
+ACQUIRED, IN_FLIGHT, STORED, MISMATCH, FULL = "acquired", "in_flight", "stored", "mismatch", "full"
+
+_POLL_SECONDS = 0.05
+
+
+class _StoreBase:
+    """Reservation protocol and counters shared by every backend."""
+
+    backend = "base"
+    # True cuando reserve/save/release hacen E/S de red: el middleware los
+    # llama en un hilo para no bloquear el event loop
+    blocking = False
+
+    def __init__(self, ttl_seconds: float, lock_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.lock_seconds = lock_seconds
+        self._lock = threading.Lock()
+        self._counters = {
+            "executed": 0, "stored": 0, "replayed": 0, "waited": 0, "conflicts": 0, "mismatches": 0, "rejected": 0
+        }
+
+    def reserve(self, key: str, fingerprint: str) -> Tuple[str, Optional[dict]]:
+        """
+        Marks `key` as in flight if it is free. Returns (ACQUIRED, None),
+        (STORED, record), (IN_FLIGHT, None), (MISMATCH, None) when the
+        key belongs to a different request or (FULL, None) when there is
+        no room for a new reservation.
+        """
+        raise NotImplementedError
+
+    def save(self, key: str, record: dict):
+        """Replaces the reservation with the finished response."""
+        raise NotImplementedError
+
+    def release(self, key: str):
+        """Drops the reservation (the request failed and may be retried)."""
+        raise NotImplementedError
+
+    def count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            data = {"backend": self.backend, **self._counters}
+        data["ttl_seconds"] = self.ttl_seconds
+        return data
+
+
+class MemoryIdempotencyStore(_StoreBase):
+    """
+    In-process store with a TTL and a maximum number of entries.
+
+    Reservas y respuestas guardadas van en dos OrderedDict en orden de
+    inserción. Al llegar a max_entries se desaloja la respuesta guardada
+    más antigua (o una reserva vencida); una reserva viva nunca se
+    desaloja: sin sitio, reserve() devuelve FULL. Las reservas vencen a
+    los lock_seconds (una petición que nunca terminó no bloquea la clave).
+    """
+
+    backend = "memory"
+
+    def __init__(self, max_entries: int, ttl_seconds: float, lock_seconds: float):
+        super().__init__(ttl_seconds, lock_seconds)
+        self.max_entries = max_entries
+        self._reservations = OrderedDict()
+        self._entries = OrderedDict()
+        self._evictions = 0
+
+    def reserve(self, key: str, fingerprint: str):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._reservations.get(key) or self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                self._drop(key)
+                entry = None
+
+            if entry is None:
+                if not self._make_room(now):
+                    return FULL, None
+                self._reservations[key] = (now + self.lock_seconds, {"fingerprint": fingerprint, "in_flight": True})
+                return ACQUIRED, None
+
+            record = entry[1]
+            if record["fingerprint"] != fingerprint:
+                return MISMATCH, None
+            if record.get("in_flight"):
+                return IN_FLIGHT, None
+            return STORED, record
+
+    def save(self, key: str, record: dict):
+        now = time.monotonic()
+        with self._lock:
+            # Ocupa el lugar de su reserva; si venció y se desalojó, se
+            # busca sitio como para una nueva
+            if self._reservations.pop(key, None) is None and key not in self._entries:
+                self._make_room(now)
+            self._entries[key] = (now + self.ttl_seconds, record)
+            self._entries.move_to_end(key)
+
+    def release(self, key: str):
+        with self._lock:
+            self._drop(key)
+
+    def _drop(self, key: str):
+        self._reservations.pop(key, None)
+        self._entries.pop(key, None)
+
+    def _make_room(self, now: float) -> bool:
+        """Frees one slot for a new reservation; False when only live reservations remain."""
+        while len(self._reservations) + len(self._entries) >= self.max_entries:
+            # Las reservas vencen en orden de inserción (mismo lock_seconds)
+            if self._reservations and next(iter(self._reservations.values()))[0] <= now:
+                self._reservations.popitem(last=False)
+            elif self._entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            else:
+                return False
+        return True
+
+    def stats(self) -> dict:
+        data = super().stats()
+        with self._lock:
+            data["entries"] = len(self._reservations) + len(self._entries)
+            data["in_flight"] = len(self._reservations)
+            data["evictions"] = self._evictions
+        data["max_entries"] = self.max_entries
+        return data
+
+
+class RedisIdempotencyStore(_StoreBase):
+    """
+    Redis-compatible store shared by every worker.
+
+    La reserva es un SET NX EX (atómico entre procesos); la respuesta se
+    guarda con SET EX y el cuerpo en base64. El tamaño lo acota maxmemory
+    con la política noeviction (las políticas volatile-* / allkeys-*
+    podrían desalojar una reserva en curso): sin memoria, el SET NX
+    falla con OOM y reserve() devuelve FULL. Requiere el paquete
+    opcional `redis`.
+    """
+
+    backend = "redis"
+    blocking = True
+
+    def __init__(self, url: str, ttl_seconds: float, lock_seconds: float, namespace: str = "academic:idempotency"):
+        super().__init__(ttl_seconds, lock_seconds)
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("IDEMPOTENCY_BACKEND=redis requires the 'redis' package (pip install redis)") from exc
+
+        self._client = redis.Redis.from_url(url)
+        self._response_error = redis.exceptions.ResponseError
+        self.namespace = namespace
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def reserve(self, key: str, fingerprint: str):
+        reservation = json.dumps({"fingerprint": fingerprint, "in_flight": True})
+        try:
+            acquired = self._client.set(self._key(key), reservation, nx=True, ex=max(1, int(self.lock_seconds)))
+        except self._response_error as error:
+            # maxmemory alcanzado con noeviction
+            if str(error).startswith("OOM"):
+                return FULL, None
+            raise
+        if acquired:
+            return ACQUIRED, None
+
+        raw = self._client.get(self._key(key))
+        if raw is None:
+            # Venció entre el SET NX y el GET: se reintenta en la próxima vuelta
+            return IN_FLIGHT, None
+
+        record = json.loads(raw)
+        if record["fingerprint"] != fingerprint:
+            return MISMATCH, None
+        if record.get("in_flight"):
+            return IN_FLIGHT, None
+
+        record["body"] = base64.b64decode(record["body"])
+        record["headers"] = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in record["headers"]]
+        return STORED, record
+
+    def save(self, key: str, record: dict):
+        payload = {
+            "fingerprint": record["fingerprint"],
+            "status": record["status"],
+            "headers": [(name.decode("latin-1"), value.decode("latin-1")) for name, value in record["headers"]],
+            "body": base64.b64encode(record["body"]).decode("ascii"),
+        }
+        self._client.set(self._key(key), json.dumps(payload), ex=max(1, int(self.ttl_seconds)))
+
+    def release(self, key: str):
+        self._client.delete(self._key(key))
+
+
+def build_store(backend: Optional[str] = None):
+    """Builds the store selected in settings.IDEMPOTENCY_BACKEND."""
+
+    backend = (backend or settings.IDEMPOTENCY_BACKEND).lower()
+
+    if backend == "memory":
+        return MemoryIdempotencyStore(
+            settings.IDEMPOTENCY_MAX_ENTRIES, settings.IDEMPOTENCY_TTL_SECONDS, settings.IDEMPOTENCY_LOCK_SECONDS
+        )
+
+    if backend == "redis":
+        return RedisIdempotencyStore(
+            settings.IDEMPOTENCY_REDIS_URL or settings.CACHE_REDIS_URL,
+            settings.IDEMPOTENCY_TTL_SECONDS,
+            settings.IDEMPOTENCY_LOCK_SECONDS
+        )
+
+    raise ValueError(f"Unknown IDEMPOTENCY_BACKEND: {backend!r} (expected memory or redis)")
+
+
+idempotency_store = build_store()
+
+
+# -------------------------------------------------------------
+# MIDDLEWARE
+# -------------------------------------------------------------
+
+
+def _header(scope, name: bytes) -> Optional[bytes]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
+
+
+def _client_id(scope) -> str:
+    """Scope of the keys: authenticated user, configured client header or client IP."""
+    user = scope.get("user")
+    if user is not None and getattr(user, "is_authenticated", False):
+        return f"user:{user.display_name}"
+
+    header = settings.IDEMPOTENCY_CLIENT_HEADER.strip().lower().encode("latin-1")
+    value = _header(scope, header) if header else None
+    if value:
+        return f"header:{value.decode('latin-1')}"
+
+    client = scope.get("client")
+    return f"ip:{client[0]}" if client else "ip:-"
+
+
+def _fingerprint(scope, body: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in (scope["method"].encode(), scope["path"].encode(), scope.get("query_string", b""), body):
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+async def _replay(record: dict, send):
+    headers = [header for header in record["headers"] if header[0] != REPLAYED_HEADER]
+    headers.append((REPLAYED_HEADER, b"true"))
+    await send({"type": "http.response.start", "status": record["status"], "headers": headers})
+    await send({"type": "http.response.body", "body": record["body"]})
+
+
+class IdempotencyMiddleware:
+    """Stores the first response of each (client, Idempotency-Key) and replays it."""
+
+    def __init__(self, app, store=None):
+        self.app = app
+        self.store = store or idempotency_store
+
+    async def _store_call(self, method, *args):
+        """Runs a store method, in a worker thread for blocking (network) stores."""
+        if self.store.blocking:
+            return await anyio.to_thread.run_sync(method, *args)
+        return method(*args)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in _METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        raw_key = _header(scope, IDEMPOTENCY_HEADER)
+        if raw_key is None:
+            await self.app(scope, receive, send)
+            return
+
+        idempotency_key = raw_key.decode("latin-1").strip()
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            response = JSONResponse(
+                {"detail": f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters."}, status_code=400
+            )
+            await response(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        fingerprint = _fingerprint(scope, body)
+        key = f"{_client_id(scope)}|{idempotency_key}"
+
+        deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+        waited = False
+        while True:
+            outcome, record = await self._store_call(self.store.reserve, key, fingerprint)
+            if outcome != IN_FLIGHT or time.monotonic() >= deadline:
+                break
+            waited = True
+            await anyio.sleep(_POLL_SECONDS)
+
+        if waited:
+            self.store.count("waited")
+
+        if outcome == STORED:
+            self.store.count("replayed")
+            await _replay(record, send)
+            return
+
+        if outcome == MISMATCH:
+            self.store.count("mismatches")
+            response = JSONResponse(
+                {"detail": "Idempotency-Key was already used with a different request."}, status_code=422
+            )
+            await response(scope, receive, send)
+            return
+
+        if outcome == FULL:
+            self.store.count("rejected")
+            response = JSONResponse(
+                {"detail": "Too many requests with an Idempotency-Key in progress; retry later."},
+                status_code=503,
+                headers={"Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+
+        if outcome == IN_FLIGHT:
+            self.store.count("conflicts")
+            response = JSONResponse(
+                {"detail": "A request with this Idempotency-Key is still in progress."},
+                status_code=409,
+                headers={"Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+
+        await self._execute(scope, receive, send, key, fingerprint, body)
+
+    async def _execute(self, scope, receive, send, key: str, fingerprint: str, body: bytes):
+        self.store.count("executed")
+        body_sent = False
+
+        async def replay_receive():
+            # La ruta lee el cuerpo ya consumido; después, lo que llegue
+            # del servidor (http.disconnect)
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        response = {"status": None, "headers": [], "body": []}
+
+        async def capture_send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["headers"] = [
+                    (name.lower(), value) for name, value in message.get("headers", [])
+                    if name.lower() not in _NOT_STORED
+                ]
+            elif message["type"] == "http.response.body":
+                response["body"].append(message.get("body", b""))
+            await send(message)
+
+        saved = False
+        try:
+            await self.app(scope, replay_receive, capture_send)
+            if response["status"] is not None and response["status"] < 500:
+                await self._store_call(self.store.save, key, {
+                    "fingerprint": fingerprint,
+                    "status": response["status"],
+                    "headers": response["headers"],
+                    "body": b"".join(response["body"]),
+                })
+                self.store.count("stored")
+                saved = True
+        finally:
+            if not saved:
+                # También si la petición se canceló (cliente desconectado)
+                with anyio.CancelScope(shield=True):
+                    await self._store_call(self.store.release, key)
+
+
+def install_idempotency(app):
+    """Registers the middleware when IDEMPOTENCY_ENABLED is set."""
+    if settings.IDEMPOTENCY_ENABLED:
+        app.add_middleware(IdempotencyMiddleware)
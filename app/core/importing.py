@@ -0,0 +1,51 @@
+"""
+Lectores de filas para la importación masiva (CSV y NDJSON).
+
+Leen el archivo de forma incremental (línea a línea) y producen tuplas
+``(número_de_fila, dict | None, error | None)`` para que el controlador
+valide y escriba por lotes sin cargar el archivo completo en memoria.
+"""
+
+import csv
+import json
+from itertools import islice
+
+
+def read_csv_rows(text_stream):
+    """CSV with a header row. Empty cells become None."""
+    reader = csv.DictReader(text_stream)
+    for row_number, row in enumerate(reader, start=1):
+        yield row_number, {key: (value if value != "" else None) for key, value in row.items()}, None
+
+
+def read_ndjson_rows(text_stream):
+    """One JSON object per line. Blank lines are ignored."""
+    for row_number, line in enumerate(text_stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            yield row_number, None, f"invalid JSON: {exc}"
+            continue
+        if not isinstance(data, dict):
+            yield row_number, None, "each line must be a JSON object"
+            continue
+        yield row_number, data, None
+
+
+READERS = {
+    "csv": read_csv_rows,
+    "ndjson": read_ndjson_rows,
+}
+
+
+def chunked(iterable, size: int):
+    """Splits an iterable into lists of at most `size` items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
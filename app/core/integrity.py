@@ -0,0 +1,59 @@
+"""
+Traducción de IntegrityError a los códigos de los controladores.
+
+Los create/update no consultan antes de escribir: ejecutan un solo
+INSERT/UPDATE ... RETURNING y dejan que las restricciones de la base
+(UNIQUE, FOREIGN KEY) detecten el conflicto. Estas funciones reconocen
+qué restricción falló:
+
+- SQLite:      "UNIQUE constraint failed: students.email"
+               "FOREIGN KEY constraint failed" (requiere foreign_keys=ON)
+- PostgreSQL:  SQLSTATE 23505 (unique) / 23503 (foreign key), con el
+               detalle "Key (email)=(...) already exists."
+"""
+
+from sqlalchemy.exc import IntegrityError
+
+
+UNIQUE_VIOLATION = "23505"
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+def _sqlstate(error: IntegrityError):
+    # psycopg2 -> pgcode, psycopg 3 / asyncpg -> sqlstate
+    orig = error.orig
+    return getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+
+
+def _postgres_details(error: IntegrityError) -> str:
+    """Message, DETAIL and constraint name of a PostgreSQL error."""
+    orig = error.orig
+    parts = [str(orig)]
+
+    diag = getattr(orig, "diag", None)  # psycopg2 / psycopg 3
+    if diag is not None:
+        parts += [diag.constraint_name or "", diag.message_detail or ""]
+
+    cause = orig.__cause__  # asyncpg (a través del adaptador de SQLAlchemy)
+    if cause is not None:
+        parts += [getattr(cause, "constraint_name", None) or "", getattr(cause, "detail", None) or ""]
+
+    return " ".join(parts)
+
+
+def is_unique_violation(error: IntegrityError, column: str) -> bool:
+    """True when `error` is a UNIQUE violation on `column`."""
+    if _sqlstate(error) == UNIQUE_VIOLATION:
+        # "Key (email)=(...)" o el nombre de la restricción (ix_students_email)
+        details = _postgres_details(error)
+        return f"({column})" in details or f"_{column}" in details
+
+    message = str(error.orig)
+    return "UNIQUE constraint failed" in message and f".{column}" in message
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """True when `error` is a FOREIGN KEY violation."""
+    if _sqlstate(error) == FOREIGN_KEY_VIOLATION:
+        return True
+    return "FOREIGN KEY constraint failed" in str(error.orig)
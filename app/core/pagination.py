@@ -0,0 +1,113 @@
+"""
+Utilidades de paginación por cursor (keyset pagination).
+
+En lugar de usar OFFSET (que obliga a la base de datos a recorrer y
+descartar todas las filas anteriores), cada página filtra por
+``id > último_id_visto`` sobre la llave primaria indexada. Así el costo
+de cada página es constante sin importar qué tan profundo esté en la tabla.
+
+El cursor que recibe el cliente es opaco: un base64 del último id. Los
+resultados de búsqueda, ordenados por relevancia, usan el par
+(puntaje, id) del último resultado.
+"""
+
+import base64
+import binascii
+from typing import Optional, Tuple
+
+
+def encode_cursor(last_id: int) -> str:
+    """Encodes the last seen id as an opaque cursor."""
+    raw = f"id:{last_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[int]:
+    """
+    Decodes an opaque cursor back into an id.
+    Returns None when the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+
+    prefix, _, value = raw.partition(":")
+    if prefix != "id" or not value.isdigit():
+        return None
+
+    return int(value)
+
+
+def encode_rank_cursor(score: float, last_id: int) -> str:
+    """Encodes the (relevance score, id) of the last ranked result."""
+    raw = f"rank:{score!r}:{last_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> Optional[Tuple[float, int]]:
+    """
+    Decodes a ranked-results cursor back into (score, id).
+    Returns None when the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+        prefix, score, value = raw.split(":")
+        if prefix != "rank" or not value.isdigit():
+            return None
+        return float(score), int(value)
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+
+
+def _after_window(query, id_column, after: Optional[str]):
+    """Filters the query past the cursor; None when the cursor is malformed."""
+    if after is None:
+        return query
+
+    after_id = decode_cursor(after)
+    if after_id is None:
+        return None
+    return query.filter(id_column > after_id)
+
+
+def keyset_page(query, id_column, limit: int, after: Optional[str] = None):
+    """
+    Applies keyset pagination to a query ordered by ``id_column``.
+
+    Returns a dict ``{"items", "next_cursor", "limit"}`` or the string
+    ``"invalid_cursor"`` when ``after`` cannot be decoded.
+    """
+
+    query = _after_window(query, id_column, after)
+    if query is None:
+        return "invalid_cursor"
+
+    # Se pide una fila extra para saber si existe una página siguiente
+    rows = query.order_by(id_column.asc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].id)
+
+    return {"items": rows, "next_cursor": next_cursor, "limit": limit}
+
+
+def keyset_versions(query, id_column, updated_column, limit: int, after: Optional[str] = None):
+    """
+    Same window as keyset_page() but only the ``(id, updated_at)`` pairs.
+
+    Es la consulta barata de las peticiones condicionales (ETag): no
+    hidrata objetos ORM ni serializa filas. Returns a dict
+    ``{"versions", "has_more"}`` or ``"invalid_cursor"``.
+    """
+
+    query = _after_window(query.with_entities(id_column, updated_column), id_column, after)
+    if query is None:
+        return "invalid_cursor"
+
+    rows = query.order_by(id_column.asc()).limit(limit + 1).all()
+    return {"versions": [tuple(row) for row in rows[:limit]], "has_more": len(rows) > limit}
@@ -0,0 +1,239 @@
+"""
+Índice de búsqueda de texto (estudiantes, profesores y cursos).
+
+Dos backends según el motor de la base:
+
+- SQLite: una tabla virtual FTS5 por entidad (``students_fts``,
+  ``professors_fts``, ``courses_fts``) con rowid = id de la entidad,
+  tokenizador unicode61 sin tildes e índice de prefijos de 2 y 3
+  letras. Los controladores la mantienen en la misma transacción que
+  la escritura (SearchIndex.index / remove).
+- PostgreSQL: una columna ``search_vector`` (tsvector GENERATED ...
+  STORED, configuración 'simple') con índice GIN; la base la mantiene
+  sola y index/remove no hacen nada.
+
+Cada término de la consulta se busca como prefijo ("ana per" encuentra
+"Ana Pérez" y ana.perez@...), todos deben aparecer y los resultados se
+ordenan por relevancia (bm25 / ts_rank_cd, el nombre pesa más). De un
+correo en la consulta solo se busca la parte antes de la arroba.
+
+Las tablas FTS5 no están en Base.metadata: create_all() y drop_all()
+las crean / borran con los eventos after_create / before_drop, y en
+bases existentes las crea la migración 0006.
+"""
+
+import re
+from typing import List, NamedTuple, Tuple
+
+from sqlalchemy import Column, Integer, MetaData, Table, event, func, literal, literal_column, select, text
+from sqlalchemy.orm import Session
+
+from app.database.connection import Base
+from app.models.course_model import CourseModel
+from app.models.professor_model import ProfessorModel
+from app.models.student_model import StudentModel
+
+
+# Términos de menos letras no usan el índice de prefijos y coinciden con
+# casi todo: se descartan
+MIN_TERM_LENGTH = 2
+MAX_TERMS = 8
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+# Dominio de un correo ("@university.com"): todas las filas lo comparten,
+# no distingue resultados y bm25 recorrería la lista entera del término
+_EMAIL_DOMAIN = re.compile(r"@\S*")
+
+
+class SearchSpec(NamedTuple):
+    """Indexed columns of one entity: (index column, model attribute, bm25 weight)."""
+
+    model: type
+    columns: Tuple[Tuple[str, str, float], ...]
+
+    @property
+    def table(self) -> str:
+        return self.model.__tablename__
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.model.__tablename__}_fts"
+
+
+SEARCH_SPECS = {
+    "students": SearchSpec(StudentModel, (("name", "name", 2.0), ("email", "email", 1.0))),
+    "professors": SearchSpec(ProfessorModel, (("name", "name", 2.0), ("email", "email", 1.0), ("title", "tittle", 1.0))),
+    "courses": SearchSpec(CourseModel, (("code", "code", 3.0), ("name", "name", 2.0), ("description", "description", 1.0))),
+}
+
+# Tablas FTS5 para el SQL de las consultas (metadata propia: create_all
+# no debe crearlas como tablas normales)
+_fts_metadata = MetaData()
+FTS_TABLES = {
+    entity: Table(spec.fts_table, _fts_metadata, Column("rowid", Integer), *(Column(name) for name, _, _ in spec.columns))
+    for entity, spec in SEARCH_SPECS.items()
+}
+
+
+def parse_terms(query: str) -> List[str]:
+    """Lower-cased search terms of a user query (empty when nothing is searchable)."""
+    query = _EMAIL_DOMAIN.sub(" ", query.lower())
+    terms = [term for term in _TERM.findall(query) if len(term) >= MIN_TERM_LENGTH]
+    return terms[:MAX_TERMS]
+
+
+def _dialect(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+
+# -------------------------------------------------------------
+# CONSULTA (coincidencia y puntaje por motor)
+# -------------------------------------------------------------
+
+
+def match_clause(db: Session, entity: str, terms: List[str]):
+    """
+    (from_clause, id_column, match_condition, score) for `terms`.
+    score es menor cuanto más relevante (bm25 y -ts_rank_cd).
+    """
+    spec = SEARCH_SPECS[entity]
+
+    if _dialect(db) == "postgresql":
+        table = spec.model.__table__
+        vector = literal_column(f"{spec.table}.search_vector")
+        query = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        score = -func.ts_rank_cd(vector, query, 1)
+        return table, table.c.id, vector.op("@@")(query), score
+
+    fts = FTS_TABLES[entity]
+    # Cada término entre comillas (sin operadores FTS5) y como prefijo
+    expression = " ".join(f'"{term}"*' for term in terms)
+    match = literal_column(spec.fts_table).op("MATCH")(expression)
+    score = func.bm25(literal_column(spec.fts_table), *(literal(weight) for _, _, weight in spec.columns))
+    return fts, fts.c.rowid, match, score
+
+
+# -------------------------------------------------------------
+# MANTENIMIENTO DEL ÍNDICE (lo llaman los controladores)
+# -------------------------------------------------------------
+
+
+class SearchIndex:
+
+    @staticmethod
+    def put(db: Session, entity: str, row):
+        """
+        Indexes one created / updated row (ORM object from RETURNING)
+        with one INSERT OR REPLACE. No-op on PostgreSQL.
+        """
+        if _dialect(db) != "sqlite":
+            return
+
+        spec = SEARCH_SPECS[entity]
+        values = {name: getattr(row, attribute) for name, attribute, _ in spec.columns}
+        db.execute(FTS_TABLES[entity].insert().prefix_with("OR REPLACE").values(rowid=row.id, **values))
+
+    @staticmethod
+    def index(db: Session, entity: str, *criteria):
+        """
+        (Re)indexes the rows of `entity` matching `criteria` (every row
+        without criteria) with one INSERT OR REPLACE ... SELECT. Runs in
+        the caller's transaction; no-op on PostgreSQL.
+        """
+        if _dialect(db) != "sqlite":
+            return
+
+        spec = SEARCH_SPECS[entity]
+        fts = FTS_TABLES[entity]
+        source = select(
+            spec.model.id, *(getattr(spec.model, attribute) for _, attribute, _ in spec.columns)
+        ).where(*criteria)
+        db.execute(
+            fts.insert()
+            .prefix_with("OR REPLACE")
+            .from_select(["rowid", *(name for name, _, _ in spec.columns)], source)
+        )
+
+    @staticmethod
+    def remove(db: Session, entity: str, ids):
+        """Drops the given ids from the index of `entity` (no-op on PostgreSQL)."""
+        ids = list(ids)
+        if not ids or _dialect(db) != "sqlite":
+            return
+
+        fts = FTS_TABLES[entity]
+        db.execute(fts.delete().where(fts.c.rowid.in_(ids)))
+
+    @staticmethod
+    def rebuild(db: Session):
+        """Empties and refills every index (after loads that bypass the controllers)."""
+        if _dialect(db) != "sqlite":
+            return
+
+        for entity, fts in FTS_TABLES.items():
+            db.execute(fts.delete())
+            SearchIndex.index(db, entity)
+
+
+# -------------------------------------------------------------
+# ESQUEMA (create_all / drop_all y migración 0006)
+# -------------------------------------------------------------
+
+
+def sqlite_create_statement(spec: SearchSpec) -> str:
+    columns = ", ".join(name for name, _, _ in spec.columns)
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {spec.fts_table} USING fts5("
+        f"{columns}, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+
+
+def postgres_vector_expression(spec: SearchSpec) -> str:
+    # Pesos A/B/C por orden de columna; en los correos '@' y '.' separan
+    # palabras (el parser de PostgreSQL trataría el correo como un token)
+    parts = []
+    for position, (name, attribute, _) in enumerate(spec.columns):
+        value = f"coalesce({attribute}, '')"
+        if name == "email":
+            value = f"translate({value}, '@.', '  ')"
+        parts.append(f"setweight(to_tsvector('simple', {value}), '{'ABC'[min(position, 2)]}')")
+    return " || ".join(parts)
+
+
+def _create_search_schema(target, connection, **kw):
+    dialect = connection.dialect.name
+
+    if dialect == "sqlite":
+        existing = {
+            name for (name,) in connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        for entity, spec in SEARCH_SPECS.items():
+            if spec.fts_table in existing:
+                continue
+            connection.exec_driver_sql(sqlite_create_statement(spec))
+            # Tabla nueva sobre datos existentes: se llena una vez
+            columns = ", ".join(name for name, _, _ in spec.columns)
+            attributes = ", ".join(attribute for _, attribute, _ in spec.columns)
+            connection.exec_driver_sql(
+                f"INSERT INTO {spec.fts_table} (rowid, {columns}) SELECT id, {attributes} FROM {spec.table}"
+            )
+
+    elif dialect == "postgresql":
+        for spec in SEARCH_SPECS.values():
+            connection.execute(text(
+                f"ALTER TABLE {spec.table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+                f"GENERATED ALWAYS AS ({postgres_vector_expression(spec)}) STORED"
+            ))
+            connection.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_{spec.table}_search_vector ON {spec.table} USING gin (search_vector)"
+            ))
+
+
+def _drop_search_schema(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        for spec in SEARCH_SPECS.values():
+            connection.exec_driver_sql(f"DROP TABLE IF EXISTS {spec.fts_table}")
+
+
+event.listen(Base.metadata, "after_create", _create_search_schema)
+event.listen(Base.metadata, "before_drop", _drop_search_schema)
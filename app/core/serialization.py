@@ -0,0 +1,259 @@
+"""
+Serialización rápida de respuestas (orjson + encoders cacheados por tipo).
+
+Con ``response_model`` FastAPI valida cada fila ORM contra el schema
+Read (``from_attributes``: EmailStr, fechas, ...), la vuelve a convertir
+a dicts de Python y finalmente ``json.dumps``. En listados grandes esa
+revalidación de datos que ya vienen validados de la base es el mayor
+costo de CPU.
+
+Las rutas con ``route_class=FastJSONRoute`` construyen la respuesta en
+una sola pasada a bytes JSON:
+
+- ``response_encoder(tipo)`` compila y cachea, por tipo de respuesta,
+  un encoder que lee los atributos de cada fila y serializa con orjson
+  (campos, alias, defaults y ``computed_field`` como lo haría pydantic).
+- Los tipos que el encoder no sabe reproducir con exactitud (Union,
+  Decimal, Enum, ...) usan un ``TypeAdapter`` cacheado
+  (validate_python + dump_json), también sin pasar por dicts.
+
+El JSON es idéntico byte a byte al de la ruta estándar (ver
+``python -m benchmarks.serialization``). Sin el paquete orjson todo
+usa el camino de TypeAdapter. Se desactiva con FAST_JSON_RESPONSES=false.
+"""
+
+import functools
+import inspect
+import typing
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, List, Optional
+
+from fastapi import Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.exceptions import ResponseValidationError
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, EmailStr, TypeAdapter, ValidationError
+
+from app.database.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependencia opcional
+    orjson = None
+
+
+# Tipos hoja que orjson escribe igual que pydantic en modo JSON
+_PLAIN_TYPES = (int, str, bool, date, datetime, EmailStr)
+_MISSING = object()
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse backed by orjson. Pre-encoded ``bytes`` content (from
+    response_encoder) is sent as is.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+        return super().render(content)
+
+
+@lru_cache(maxsize=None)
+def response_adapter(response_type) -> TypeAdapter:
+    """Cached TypeAdapter of a response type."""
+    return TypeAdapter(response_type)
+
+
+def _getter(item, name: str):
+    # Diccionarios (keyset_page, caché) u objetos (ORM, Row, modelos)
+    if isinstance(item, dict):
+        return item.get(name, _MISSING)
+    return getattr(item, name, _MISSING)
+
+
+def _compile(annotation) -> Optional[Callable[[Any], Any]]:
+    """
+    Converter value -> orjson-ready object for `annotation`, or None when
+    the type is not supported (the caller falls back to TypeAdapter).
+    """
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Union:
+        members = [arg for arg in args if arg is not type(None)]
+        # Solo Optional[X]; las uniones reales las resuelve pydantic
+        if len(members) != 1:
+            return None
+        inner = _compile(members[0])
+        if inner is None:
+            return None
+        return lambda value: None if value is None else inner(value)
+
+    if origin in (list, List):
+        inner = _compile(args[0]) if args else None
+        if inner is None:
+            return None
+        return lambda value: [inner(item) for item in value]
+
+    if annotation is float:
+        # Un int de la base se serializa como 3.0, igual que pydantic
+        return lambda value: None if value is None else float(value)
+
+    if annotation in _PLAIN_TYPES:
+        return lambda value: value
+
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return _compile_model(annotation)
+
+    return None
+
+
+def _compile_model(model) -> Optional[Callable[[Any], dict]]:
+    fields = []
+    for name, info in model.model_fields.items():
+        convert = _compile(info.annotation)
+        if convert is None:
+            return None
+        key = info.serialization_alias or info.alias or name
+        default = _MISSING if info.is_required() else info.get_default(call_default_factory=True)
+        fields.append((name, key, convert, default))
+
+    computed = list(model.model_computed_fields)
+
+    def convert_model(item) -> dict:
+        data = {}
+        values = {}
+        for name, key, convert, default in fields:
+            value = _getter(item, name)
+            if value is _MISSING:
+                value = default
+            values[name] = value
+            data[key] = convert(value)
+
+        if computed:
+            # Las propiedades calculadas se evalúan sobre una instancia sin validar
+            instance = model.model_construct(**values)
+            for name in computed:
+                data[name] = getattr(instance, name)
+        return data
+
+    return convert_model
+
+
+@lru_cache(maxsize=None)
+def response_encoder(response_type) -> Callable[[Any], bytes]:
+    """
+    Cached encoder content -> JSON bytes for `response_type`.
+
+    Content coming from the database is trusted (it was validated on
+    write); types the orjson encoder cannot reproduce exactly are
+    validated and dumped with a cached TypeAdapter.
+    """
+    convert = _compile(response_type) if orjson is not None else None
+    if convert is not None:
+        return lambda content: orjson.dumps(convert(content), option=orjson.OPT_UTC_Z)
+
+    adapter = response_adapter(response_type)
+
+    def encode(content) -> bytes:
+        try:
+            value = adapter.validate_python(content, from_attributes=True)
+        except ValidationError as exc:
+            raise ResponseValidationError(errors=exc.errors(include_url=False), body=content) from exc
+        return adapter.dump_json(value, by_alias=True)
+
+    return encode
+
+
+def encoded_response(sub_response: Response, response_type, content, status_code: Optional[int] = None) -> Response:
+    """
+    Response with `content` encoded as `response_type`, keeping the
+    headers and status code set on FastAPI's injected Response. Lo usan
+    las rutas cuyo schema se decide por petición (``fields=``).
+    """
+    response = FastJSONResponse(
+        response_encoder(response_type)(content),
+        status_code=sub_response.status_code or status_code or 200,
+    )
+    response.headers.raw.extend(sub_response.headers.raw)
+    return response
+
+
+# -------------------------------------------------------------
+# ROUTE CLASS (se activa por router con route_class=FastJSONRoute)
+# -------------------------------------------------------------
+_RESPONSE_PARAM = "_fast_json_response"
+
+
+def _fast_endpoint(endpoint, response_model, status_code: Optional[int]):
+    """
+    Wraps `endpoint` so that its return value is encoded as `response_model`.
+    El Response que inyecta FastAPI se recibe para copiar sus cabeceras
+    (ETag, cookies) y su status_code a la respuesta final.
+    """
+    signature = inspect.signature(endpoint)
+    response_param = next(
+        (name for name, param in signature.parameters.items() if param.annotation is Response), None
+    )
+    if response_param is None:
+        response_param = _RESPONSE_PARAM
+        signature = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(_RESPONSE_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ])
+    owns_param = response_param == _RESPONSE_PARAM
+
+    def finish(content, sub_response: Response):
+        if isinstance(content, Response):
+            return content
+        return encoded_response(sub_response, response_model, content, status_code)
+
+    if inspect.iscoroutinefunction(endpoint):
+        async def wrapper(**kwargs):
+            sub_response = kwargs.pop(response_param) if owns_param else kwargs[response_param]
+            return finish(await endpoint(**kwargs), sub_response)
+    else:
+        def wrapper(**kwargs):
+            sub_response = kwargs.pop(response_param) if owns_param else kwargs[response_param]
+            return finish(endpoint(**kwargs), sub_response)
+
+    functools.update_wrapper(wrapper, endpoint)
+    wrapper.__signature__ = signature
+    wrapper.fast_json = True
+    return wrapper
+
+
+class FastJSONRoute(APIRoute):
+    """
+    APIRoute that encodes the ``response_model`` with response_encoder()
+    instead of FastAPI's validate + jsonable + json.dumps path. The
+    response_model is still used for the OpenAPI schema.
+
+    Routes with include/exclude options, or with FAST_JSON_RESPONSES
+    disabled, keep the standard behaviour.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        response_model = kwargs.get("response_model")
+        plain_options = not any(kwargs.get(option) for option in (
+            "response_model_include", "response_model_exclude", "response_model_exclude_unset",
+            "response_model_exclude_defaults", "response_model_exclude_none",
+        ))
+        if (
+            settings.FAST_JSON_RESPONSES
+            and plain_options
+            and response_model is not None
+            and not isinstance(response_model, DefaultPlaceholder)
+            # include_router() vuelve a crear la ruta con el endpoint ya envuelto
+            and not getattr(endpoint, "fast_json", False)
+        ):
+            # El encoder se compila al registrar la ruta, no en la primera petición
+            response_encoder(response_model)
+            endpoint = _fast_endpoint(endpoint, response_model, kwargs.get("status_code"))
+
+        super().__init__(path, endpoint, **kwargs)
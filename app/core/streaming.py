@@ -0,0 +1,57 @@
+"""
+Codificadores de exportación en streaming (NDJSON y CSV).
+
+Reciben los nombres de columna y un iterable de lotes de filas, y
+producen un bloque de texto por lote. Cada bloque se envía como un chunk
+de la respuesta (Transfer-Encoding: chunked), así que nunca se arma el
+documento completo en memoria.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def ndjson_chunks(columns, batches):
+    """One JSON object per line, one chunk per batch."""
+    for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(columns, row)), default=_json_default, ensure_ascii=False) + "\n"
+            for row in batch
+        )
+
+
+def csv_chunks(columns, batches):
+    """Header line first, then one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(columns)
+    yield buffer.getvalue()
+
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            [value.isoformat() if isinstance(value, (datetime, date)) else value for value in row]
+            for row in batch
+        )
+        yield buffer.getvalue()
+
+
+ENCODERS = {
+    "ndjson": ndjson_chunks,
+    "csv": csv_chunks,
+}
@@ -0,0 +1,143 @@
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.database.config import settings
+from app.database.connection import WRITE_METHODS, WriteSession
+from app.database.pool import PoolTelemetry, pool_options
+from app.database.replicas import (
+    PINNED, READ_SOURCE, REPLICA, RoundRobin, pin_to_primary, pinned_to_primary, replica_urls
+)
+from app.database.sqlite_profile import BEGIN_OPTION, apply_sqlite_profile
+
+
+# -------------------------------------------------------------------
+# ASYNC DATABASE ENGINE
+# -------------------------------------------------------------------
+# Versión asíncrona del engine definido en connection.py.
+#
+# Con el stack síncrono cada request ocupa un hilo del threadpool de
+# Starlette mientras espera a la base de datos. Con AsyncSession la
+# espera ocurre en el event loop (asyncpg / aiosqlite), así que las
+# peticiones de I/O escalan con el loop y no con la cantidad de hilos.
+#
+# Este módulo solo se importa cuando se usa el stack asíncrono, de modo
+# que los drivers async no son obligatorios para el modo síncrono.
+# -------------------------------------------------------------------
+def to_async_url(url: str) -> str:
+    """
+    Converts a sync database URL into its async driver equivalent.
+    sqlite -> sqlite+aiosqlite, postgresql -> postgresql+asyncpg.
+    """
+    scheme, sep, rest = url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+
+    if dialect == "sqlite":
+        return f"sqlite+aiosqlite{sep}{rest}"
+
+    if dialect in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg{sep}{rest}"
+
+    return url
+
+
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **pool_options(ASYNC_DATABASE_URL, use_async=True))
+
+# Los eventos del pool se registran sobre el engine síncrono interno
+async_pool_telemetry = PoolTelemetry("async")
+async_pool_telemetry.attach(async_engine.sync_engine)
+
+# Mismo perfil de SQLite que el engine síncrono (aiosqlite usa sqlite3)
+apply_sqlite_profile(async_engine.sync_engine)
+
+async_write_engine = async_engine.execution_options(**{BEGIN_OPTION: "IMMEDIATE"})
+
+
+# -------------------------------------------------------------------
+# ASYNC SESSION FACTORY
+# -------------------------------------------------------------------
+# expire_on_commit=False: los objetos devueltos por los controladores
+# se serializan después del commit, fuera del contexto async de la
+# sesión. Si se expiraran, FastAPI dispararía cargas perezosas que no
+# están permitidas con AsyncSession.
+# -------------------------------------------------------------------
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+# Ver WriteSession en connection.py: BEGIN IMMEDIATE solo en la primera transacción
+AsyncWriteSessionLocal = async_sessionmaker(
+    bind=async_write_engine,
+    class_=AsyncSession,
+    sync_session_class=WriteSession,
+    autoflush=False,
+    expire_on_commit=False,
+    info={"read_bind": async_engine.sync_engine}
+)
+
+
+# -------------------------------------------------------------------
+# DEPENDENCY: get_async_db()
+# -------------------------------------------------------------------
+# Equivalente asíncrono de get_db(): una AsyncSession por request
+# (con la primera transacción de escritura para POST/PUT/PATCH/DELETE).
+# -------------------------------------------------------------------
+async def get_async_db(request: Request, response: Response):
+    """
+    Provides an async database session per request.
+    Ensures proper opening and closing.
+    """
+    if request.method in WRITE_METHODS:
+        factory = AsyncWriteSessionLocal
+        if async_replica_sessions:
+            pin_to_primary(response)
+    else:
+        factory = AsyncSessionLocal
+
+    async with factory() as db:
+        yield db
+
+
+# -------------------------------------------------------------------
+# RÉPLICAS DE LECTURA: get_async_read_db()
+# -------------------------------------------------------------------
+# Equivalente asíncrono de get_read_db(): las URLs de READ_REPLICA_URLS
+# se convierten con to_async_url().
+# -------------------------------------------------------------------
+def _create_async_replica_engine(url: str):
+    replica_engine = create_async_engine(url, **pool_options(url, use_async=True))
+    apply_sqlite_profile(replica_engine.sync_engine)
+    return replica_engine
+
+
+async_replica_engines = [_create_async_replica_engine(to_async_url(url)) for url in replica_urls()]
+
+async_replica_pool_telemetries = []
+for index, replica_engine in enumerate(async_replica_engines):
+    async_replica_pool_telemetries.append(PoolTelemetry(f"async_replica{index}"))
+    async_replica_pool_telemetries[-1].attach(replica_engine.sync_engine)
+
+async_replica_sessions = RoundRobin(
+    async_sessionmaker(bind=replica_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    for replica_engine in async_replica_engines
+)
+
+
+async def get_async_read_db(request: Request):
+    """
+    Provides a read-only async session per request: a replica
+    (round-robin) unless the client is inside its read-your-writes window.
+    """
+    pinned = pinned_to_primary(request)
+    if async_replica_sessions and not pinned:
+        factory, source = async_replica_sessions.next(), REPLICA
+    else:
+        factory, source = AsyncSessionLocal, PINNED if pinned else None
+
+    async with factory() as db:
+        if source:
+            db.info[READ_SOURCE] = source
+        yield db
@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 
@@ -9,6 +10,110 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str = "sqlite:///./academic.db"
 
+    # Pool de conexiones (ver app/database/pool.py). Con SQLite en
+    # memoria se ignoran tamaño/overflow/timeout.
+    #   DB_POOL_SIZE       conexiones que el pool mantiene abiertas
+    #   DB_MAX_OVERFLOW    conexiones extra permitidas en picos
+    #   DB_POOL_TIMEOUT    segundos que una petición espera una conexión
+    #   DB_POOL_RECYCLE    segundos de vida de una conexión (-1 = sin límite)
+    #   DB_POOL_PRE_PING   valida la conexión en cada checkout (1 round-trip)
+    #   DB_POOL_USE_LIFO   reutiliza la última conexión devuelta (deja
+    #                      que las sobrantes venzan por recycle)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_USE_LIFO: bool = False
+    # Contadores e histogramas de espera/checkout (GET /internal/pool)
+    DB_POOL_TELEMETRY: bool = True
+
+    # Réplicas de lectura (URLs separadas por comas). Los listados,
+    # get_by_id y rosters se reparten entre ellas en round-robin; tras
+    # una escritura el cliente lee del primario durante
+    # READ_YOUR_WRITES_SECONDS (ver app/database/replicas.py)
+    READ_REPLICA_URLS: str = ""
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # Stack asíncrono (AsyncSession + routers async).
+    # Si ASYNC_DATABASE_URL no se define, se deriva de DATABASE_URL
+    # usando aiosqlite (SQLite) o asyncpg (PostgreSQL).
+    USE_ASYNC_DB: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Trazas SQL por petición (ver app/database/tracing.py): cabecera
+    # Server-Timing, log de consultas lentas (con parámetros) y aviso de
+    # SELECT repetidos dentro de una petición (N+1). Sin costo si está
+    # desactivado.
+    SQL_TRACE: bool = False
+    SQL_SLOW_QUERY_MS: float = 100.0
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+
+    # Respuestas JSON en una sola pasada con orjson en los routers con
+    # route_class=FastJSONRoute (ver app/core/serialization.py)
+    FAST_JSON_RESPONSES: bool = True
+
+    # Paginación por cursor (keyset) en las rutas de listado
+    DEFAULT_PAGE_SIZE: int = 50
+    MAX_PAGE_SIZE: int = 500
+
+    # Lectura por lista de ids (?ids=, ver app/core/batch.py): máximo de
+    # ids por petición e ids por consulta IN
+    MAX_BATCH_IDS: int = 1000
+    BATCH_CHUNK_SIZE: int = 500
+
+    # Máximo de pares (curso, estudiante) por inscripción masiva
+    MAX_BULK_ENROLLMENTS: int = 1000
+
+    # Filas por lote al exportar (yield_per / cursor del lado del servidor)
+    EXPORT_CHUNK_SIZE: int = 1000
+
+    # Filas por lote (y por commit) en la importación masiva
+    IMPORT_CHUNK_SIZE: int = 1000
+
+    # Caché read-through de get_by_id: "memory" (LRU en proceso),
+    # "redis" (requiere el paquete redis) o "none" (desactivada)
+    CACHE_BACKEND: str = "memory"
+    CACHE_TTL_SECONDS: float = 30.0
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Idempotency-Key en los POST (ver app/core/idempotency.py): la
+    # primera respuesta de cada (cliente, clave) se guarda y se repite
+    # a los reintentos. Almacén "memory" (por proceso, LRU con TTL) o
+    # "redis" (compartido; por defecto usa CACHE_REDIS_URL)
+    IDEMPOTENCY_ENABLED: bool = True
+    IDEMPOTENCY_BACKEND: str = "memory"
+    IDEMPOTENCY_TTL_SECONDS: float = 86400.0
+    IDEMPOTENCY_MAX_ENTRIES: int = 10000
+    IDEMPOTENCY_REDIS_URL: Optional[str] = None
+    # Cabecera que identifica al cliente cuando no hay usuario autenticado
+    # (vacía: la IP de origen). Solo detrás de un gateway que la fija: el
+    # cliente podría enviar la de otro y recibir sus respuestas
+    IDEMPOTENCY_CLIENT_HEADER: str = ""
+    # Vida máxima de una reserva "en curso" y espera de un duplicado
+    # concurrente antes de responder 409
+    IDEMPOTENCY_LOCK_SECONDS: float = 60.0
+    IDEMPOTENCY_WAIT_SECONDS: float = 10.0
+
+    # Búsqueda de texto (ver app/core/search.py): las facetas cuentan
+    # todas las coincidencias; con más de SEARCH_FACET_MAX_MATCHES se
+    # omiten (facets_omitted=true). El orden por relevancia es siempre global
+    SEARCH_FACET_MAX_MATCHES: int = 10000
+
+    # Perfil de rendimiento de SQLite (ver app/database/sqlite_profile.py).
+    # cache_size negativo = KiB (-65536 -> 64 MiB)
+    SQLITE_PROFILE: bool = True
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_CACHE_SIZE: int = -65536
+    SQLITE_FOREIGN_KEYS: bool = True
+    # Las peticiones de escritura (POST/PUT/PATCH/DELETE) abren sus
+    # transacciones con BEGIN IMMEDIATE
+    SQLITE_BEGIN_IMMEDIATE: bool = True
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
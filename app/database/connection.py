@@ -1,6 +1,12 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from fastapi import Request, Response
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from app.database.config import settings
+from app.database.pool import PoolTelemetry, pool_options
+from app.database.replicas import (
+    PINNED, READ_SOURCE, REPLICA, RoundRobin, pin_to_primary, pinned_to_primary, replica_urls
+)
+from app.database.sqlite_profile import BEGIN_OPTION, apply_sqlite_profile
 
 
 # -------------------------------------------------------------------
@@ -20,14 +26,33 @@ from app.database.config import settings
 # pero cerrado a modificación en otras capas.
 # -------------------------------------------------------------------
 
-# Ajuste necesario cuando uso SQLite para permitir múltiples hilos
-if settings.DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        settings.DATABASE_URL,
-        connect_args={"check_same_thread": False}
-    )
-else:
-    engine = create_engine(settings.DATABASE_URL)
+def create_db_engine(url: str):
+    """Engine with the configured pool (primary database or a read replica)."""
+
+    # Ajuste necesario cuando uso SQLite para permitir múltiples hilos
+    if url.startswith("sqlite"):
+        db_engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            **pool_options(url)
+        )
+    else:
+        db_engine = create_engine(url, **pool_options(url))
+
+    # WAL, pragmas y BEGIN explícito (solo SQLite y si SQLITE_PROFILE está activo)
+    apply_sqlite_profile(db_engine)
+    return db_engine
+
+
+engine = create_db_engine(settings.DATABASE_URL)
+
+# Contadores e histogramas del pool (GET /internal/pool)
+pool_telemetry = PoolTelemetry("sync")
+pool_telemetry.attach(engine)
+
+# Mismo pool, pero sus transacciones empiezan con BEGIN IMMEDIATE en
+# SQLite (en otros motores la opción no tiene efecto)
+write_engine = engine.execution_options(**{BEGIN_OPTION: "IMMEDIATE"})
 
 
 # -------------------------------------------------------------------
@@ -60,6 +85,50 @@ SessionLocal = sessionmaker(
 )
 
 
+# -------------------------------------------------------------------
+# SESIONES DE ESCRITURA
+# -------------------------------------------------------------------
+# Las peticiones que escriben usan WriteSession: su primera transacción
+# empieza (de forma perezosa, en la primera sentencia del controlador)
+# con BEGIN IMMEDIATE. Después del primer commit la sesión vuelve al
+# engine normal, así el db.refresh() posterior es una lectura diferida
+# y no retiene el lock de escritura hasta que se cierra la sesión.
+# -------------------------------------------------------------------
+class WriteSession(Session):
+    """Session whose first transaction is a write transaction."""
+
+
+@event.listens_for(WriteSession, "after_commit")
+def _deferred_after_commit(session):
+    # También se dispara al liberar un SAVEPOINT (begin_nested): la
+    # transacción exterior sigue abierta en la conexión de escritura
+    if session.in_nested_transaction():
+        return
+    session.bind = session.info.get("read_bind", session.bind)
+
+
+WriteSessionLocal = sessionmaker(
+    class_=WriteSession,
+    autocommit=False,
+    autoflush=False,
+    bind=write_engine,
+    info={"read_bind": engine}
+)
+
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+def begin_write(db: Session):
+    """
+    Opens the session's next transaction as a write transaction
+    (BEGIN IMMEDIATE on SQLite). For code that commits several times,
+    such as the chunked import, where only the first transaction of a
+    WriteSession would be immediate.
+    """
+    if not db.in_transaction():
+        db.connection(execution_options={BEGIN_OPTION: "IMMEDIATE"})
+
+
 # -------------------------------------------------------------------
 # DEPENDENCY: get_db()
 # -------------------------------------------------------------------
@@ -82,13 +151,62 @@ SessionLocal = sessionmaker(
 #   - Si en el futuro uso un ORM diferente, solo modifico este archivo.
 #
 # Este patrón coincide con las mejores prácticas oficiales de FastAPI.
+#
+# POST/PUT/PATCH/DELETE reciben una WriteSession; las lecturas usan
+# transacciones diferidas.
 # -------------------------------------------------------------------
-def get_db():
+def get_db(request: Request, response: Response):
     """
     Provides a database session per request.
     Ensures proper opening and closing.
     """
-    db = SessionLocal()
+    if request.method in WRITE_METHODS:
+        db = WriteSessionLocal()
+        if replica_sessions:
+            pin_to_primary(response)
+    else:
+        db = SessionLocal()
+
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# -------------------------------------------------------------------
+# RÉPLICAS DE LECTURA: get_read_db()
+# -------------------------------------------------------------------
+# Un engine y una fábrica de sesiones por URL de READ_REPLICA_URLS
+# (ver app/database/replicas.py). Sin réplicas, get_read_db() es
+# equivalente a get_db() para un GET.
+# -------------------------------------------------------------------
+replica_engines = [create_db_engine(url) for url in replica_urls()]
+
+replica_pool_telemetries = []
+for index, replica_engine in enumerate(replica_engines):
+    replica_pool_telemetries.append(PoolTelemetry(f"replica{index}"))
+    replica_pool_telemetries[-1].attach(replica_engine)
+
+replica_sessions = RoundRobin(
+    sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+    for replica_engine in replica_engines
+)
+
+
+def get_read_db(request: Request):
+    """
+    Provides a read-only session per request: a replica (round-robin)
+    unless the client is inside its read-your-writes window.
+    """
+    pinned = pinned_to_primary(request)
+    if replica_sessions and not pinned:
+        db = replica_sessions.next()()
+        db.info[READ_SOURCE] = REPLICA
+    else:
+        db = SessionLocal()
+        if pinned:
+            db.info[READ_SOURCE] = PINNED
+
     try:
         yield db
     finally:
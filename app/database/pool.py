@@ -0,0 +1,267 @@
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.database.config import settings
+from app.database.sqlite_profile import is_memory_database, is_sqlite
+
+
+# -------------------------------------------------------------------
+# POOL DE CONEXIONES
+# -------------------------------------------------------------------
+# pool_options() arma los argumentos de create_engine() a partir de
+# settings (DB_POOL_*). Las bases SQLite en memoria conservan el pool
+# por defecto de SQLAlchemy (una sola conexión compartida), porque cada
+# conexión nueva sería una base de datos distinta.
+#
+# TELEMETRÍA
+# -------------------------------------------------------------------
+# PoolTelemetry escucha los eventos del pool (connect, checkout,
+# checkin, invalidate) y mide:
+#
+#   wait_ms       tiempo bloqueado esperando una conexión libre
+#                 (incluye abrir una conexión nueva en el overflow)
+#   checkout_ms   desde que se pide la conexión hasta que se entrega
+#                 (espera + pre-ping)
+#   hold_ms       cuánto tiempo la retiene cada sesión
+#
+# Ningún evento del pool se dispara ANTES de esperar, así que la espera
+# se mide en _do_get() de las subclases Instrumented*QueuePool.
+# Las métricas se leen en GET /internal/pool.
+# -------------------------------------------------------------------
+
+# Límites superiores (ms) de los buckets de los histogramas
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+_REQUESTED_AT = "_telemetry_requested_at"
+_WAIT_MS = "_telemetry_wait_ms"
+_CHECKED_OUT_AT = "_telemetry_checked_out_at"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (cumulative counts, like Prometheus)."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def observe(self, value_ms: float):
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value_ms <= bound:
+                index = i
+                break
+        self._counts[index] += 1
+        self._count += 1
+        self._sum += value_ms
+        self._max = max(self._max, value_ms)
+
+    def _quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile."""
+        if not self._count:
+            return None
+        rank = q * self._count
+        seen = 0
+        for i, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return round(min(self.buckets[i], self._max) if i < len(self.buckets) else self._max, 3)
+        return round(self._max, 3)
+
+    def snapshot(self) -> dict:
+        cumulative, seen = {}, 0
+        for bound, count in zip(self.buckets, self._counts):
+            seen += count
+            cumulative[f"le_{bound}"] = seen
+        cumulative["le_inf"] = self._count
+
+        return {
+            "count": self._count,
+            "sum_ms": round(self._sum, 3),
+            "max_ms": round(self._max, 3),
+            "p50_ms": self._quantile(0.50),
+            "p95_ms": self._quantile(0.95),
+            "p99_ms": self._quantile(0.99),
+            "buckets": cumulative,
+        }
+
+
+class PoolTelemetry:
+    """Counters and latency histograms of one engine's pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.engine = None
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.waiting = 0
+        self.wait = LatencyHistogram()
+        self.checkout = LatencyHistogram()
+        self.hold = LatencyHistogram()
+
+    def reset(self):
+        with self._lock:
+            self._reset()
+
+    def attach(self, engine: Engine):
+        """Registers the pool listeners on `engine` (sync Engine)."""
+
+        self.engine = engine
+        if not settings.DB_POOL_TELEMETRY:
+            return
+
+        pool = engine.pool
+        if isinstance(pool, _TimedGetMixin):
+            pool.telemetry = self
+
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            with self._lock:
+                self.connects += 1
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            now = time.perf_counter()
+            info = connection_record.info
+            requested_at = info.pop(_REQUESTED_AT, None)
+            wait_ms = info.pop(_WAIT_MS, None)
+            info[_CHECKED_OUT_AT] = now
+
+            with self._lock:
+                self.checkouts += 1
+                if wait_ms is not None:
+                    self.wait.observe(wait_ms)
+                if requested_at is not None:
+                    self.checkout.observe((now - requested_at) * 1000)
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            checked_out_at = connection_record.info.pop(_CHECKED_OUT_AT, None)
+            with self._lock:
+                self.checkins += 1
+                if checked_out_at is not None:
+                    self.hold.observe((time.perf_counter() - checked_out_at) * 1000)
+
+        @event.listens_for(engine, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            with self._lock:
+                self.invalidations += 1
+
+    def _started_waiting(self):
+        with self._lock:
+            self.waiting += 1
+
+    def _stopped_waiting(self, timed_out: bool, started: float):
+        with self._lock:
+            self.waiting -= 1
+            if timed_out:
+                # La espera de un checkout fallido también cuenta
+                self.timeouts += 1
+                self.wait.observe((time.perf_counter() - started) * 1000)
+
+    def stats(self) -> dict:
+        pool = self.engine.pool if self.engine is not None else None
+
+        data = {
+            "engine": self.name,
+            "pool_class": type(pool).__name__ if pool else None,
+            "telemetry": settings.DB_POOL_TELEMETRY,
+        }
+        if isinstance(pool, QueuePool):
+            data.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "max_overflow": pool._max_overflow,
+                "timeout_seconds": pool.timeout(),
+            })
+
+        with self._lock:
+            data.update({
+                "waiting": self.waiting,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_ms": self.wait.snapshot(),
+                "checkout_ms": self.checkout.snapshot(),
+                "hold_ms": self.hold.snapshot(),
+            })
+        return data
+
+
+class _TimedGetMixin:
+    """Measures how long _do_get() blocks before a connection is handed out."""
+
+    telemetry: Optional[PoolTelemetry] = None
+
+    def _do_get(self):
+        telemetry = self.telemetry
+        if telemetry is None:
+            return super()._do_get()
+
+        started = time.perf_counter()
+        telemetry._started_waiting()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            telemetry._stopped_waiting(True, started)
+            raise
+        except BaseException:
+            telemetry._stopped_waiting(False, started)
+            raise
+
+        telemetry._stopped_waiting(False, started)
+        record.info[_REQUESTED_AT] = started
+        record.info[_WAIT_MS] = (time.perf_counter() - started) * 1000
+        return record
+
+    def recreate(self):
+        # engine.dispose() crea un pool nuevo: conserva la telemetría
+        pool = super().recreate()
+        pool.telemetry = self.telemetry
+        return pool
+
+
+class InstrumentedQueuePool(_TimedGetMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedGetMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(url: str, use_async: bool = False) -> dict:
+    """create_engine() keyword arguments for the configured pool."""
+
+    options = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if is_sqlite(url) and is_memory_database(url):
+        return options
+
+    options.update({
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+    })
+    if settings.DB_POOL_TELEMETRY:
+        options["poolclass"] = InstrumentedAsyncQueuePool if use_async else InstrumentedQueuePool
+    return options
@@ -0,0 +1,92 @@
+import itertools
+import math
+import time
+from typing import List, Optional
+
+from fastapi import Request, Response
+from app.database.config import settings
+
+
+# -------------------------------------------------------------------
+# RÉPLICAS DE LECTURA
+# -------------------------------------------------------------------
+# Con READ_REPLICA_URLS definido, las rutas de solo lectura (listados,
+# get_by_id y rosters) usan get_read_db() / get_async_read_db(), que
+# reparten las sesiones entre las réplicas en round-robin. Las
+# escrituras y el resto de rutas siguen en el primario (get_db()).
+#
+# READ-YOUR-WRITES
+# -------------------------------------------------------------------
+# Una réplica puede ir por detrás del primario. Cuando un cliente
+# escribe, get_db() le envía la cookie PIN_COOKIE con el instante hasta
+# el que sus lecturas deben ir al primario (READ_YOUR_WRITES_SECONDS).
+# La cookie viaja con el cliente, así que funciona igual con varios
+# workers o varias instancias de la API.
+#
+# CACHÉ DE ENTIDADES
+# -------------------------------------------------------------------
+# get_read_db() marca la sesión en session.info[READ_SOURCE]: una fila
+# leída de una réplica puede ser anterior a la última invalidación, así
+# que no se guarda en caché (REPLICA); dentro de la ventana
+# read-your-writes la caché no se consulta y se lee el primario
+# (PINNED). Ver _CacheBase.get_or_load().
+# -------------------------------------------------------------------
+
+PIN_COOKIE = "read_primary_until"
+
+READ_SOURCE = "read_source"
+REPLICA = "replica"
+PINNED = "pinned"
+
+
+def replica_urls() -> List[str]:
+    """READ_REPLICA_URLS as a list (comma separated, blanks ignored)."""
+    return [url.strip() for url in settings.READ_REPLICA_URLS.split(",") if url.strip()]
+
+
+class RoundRobin:
+    """Cycles over a fixed list of items; safe to share between threads."""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self._counter = itertools.count()
+
+    def __bool__(self):
+        return bool(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def next(self):
+        # next() sobre itertools.count es atómico con el GIL
+        return self.items[next(self._counter) % len(self.items)]
+
+
+def pinned_to_primary(request: Request) -> bool:
+    """True while the client's read-your-writes window is open."""
+    value = request.cookies.get(PIN_COOKIE)
+    if value is None:
+        return False
+    try:
+        return float(value) > time.time()
+    except ValueError:
+        return False
+
+
+def read_source(db) -> Optional[str]:
+    """REPLICA / PINNED for sessions of get_read_db(), None otherwise."""
+    return db.info.get(READ_SOURCE)
+
+
+def pin_to_primary(response: Response):
+    """Opens (or extends) the client's read-your-writes window."""
+    window = settings.READ_YOUR_WRITES_SECONDS
+    if window <= 0:
+        return
+    response.set_cookie(
+        PIN_COOKIE,
+        f"{time.time() + window:.3f}",
+        max_age=math.ceil(window),
+        httponly=True,
+        samesite="lax"
+    )
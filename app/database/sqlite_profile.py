@@ -0,0 +1,100 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.database.config import settings
+
+
+# -------------------------------------------------------------------
+# PERFIL DE RENDIMIENTO PARA SQLITE
+# -------------------------------------------------------------------
+# Se aplica a cada conexión nueva (evento "connect") cuando
+# settings.SQLITE_PROFILE está activo:
+#
+#   journal_mode=WAL      lectores y el escritor no se bloquean entre sí
+#   synchronous=NORMAL    en WAL es seguro ante caídas del proceso; solo
+#                         un corte de energía puede perder el último commit
+#   busy_timeout          espera el lock en lugar de fallar con
+#                         "database is locked"
+#   mmap_size/cache_size  lecturas desde memoria mapeada / caché de páginas
+#   foreign_keys=ON       SQLite no valida las FK si no se pide
+#
+# TRANSACCIONES
+# -------------------------------------------------------------------
+# pysqlite abre las transacciones por su cuenta (y tarde: solo antes de
+# un INSERT/UPDATE). Se desactiva ese comportamiento y SQLAlchemy emite
+# el BEGIN en el evento "begin":
+#
+#   - lectura:   BEGIN (diferido): no toma el lock de escritura
+#   - escritura: BEGIN IMMEDIATE si la conexión lleva la opción
+#                sqlite_begin="IMMEDIATE" (ver WriteSession y
+#                begin_write() en connection.py). Toma el lock de
+#                escritura al inicio; un BEGIN diferido que lee y luego
+#                escribe tendría que "subir" su lock y, si otro escritor
+#                confirmó mientras tanto, SQLite devuelve SQLITE_BUSY
+#                sin esperar el busy_timeout.
+# -------------------------------------------------------------------
+
+BEGIN_OPTION = "sqlite_begin"
+
+
+def is_sqlite(url: str) -> bool:
+    return url.split(":", 1)[0].split("+", 1)[0] == "sqlite"
+
+
+def is_memory_database(url: str) -> bool:
+    return url.rstrip("/").endswith(":memory:") or url.rstrip("/") in ("sqlite:", "sqlite+aiosqlite:")
+
+
+def sqlite_pragmas(url: str):
+    """PRAGMA statements of the profile, in the order they are applied."""
+
+    pragmas = []
+    if not is_memory_database(url):
+        pragmas.append(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    pragmas += [
+        f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}",
+        f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}",
+        f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}",
+        f"PRAGMA foreign_keys={'ON' if settings.SQLITE_FOREIGN_KEYS else 'OFF'}",
+    ]
+    return pragmas
+
+
+def apply_sqlite_profile(engine: Engine):
+    """
+    Installs the connect/begin listeners on a SQLite engine.
+    For an AsyncEngine pass ``async_engine.sync_engine``.
+    """
+
+    if not is_sqlite(str(engine.url)):
+        return
+
+    if not settings.SQLITE_PROFILE:
+        # Aun sin perfil las FK se validan: los create/update detectan el
+        # profesor inexistente por la restricción (ver app/core/integrity.py)
+        if settings.SQLITE_FOREIGN_KEYS:
+            @event.listens_for(engine, "connect")
+            def on_connect_foreign_keys(dbapi_connection, connection_record):
+                dbapi_connection.execute("PRAGMA foreign_keys=ON")
+        return
+
+    pragmas = sqlite_pragmas(str(engine.url))
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        # Sin transacciones implícitas de pysqlite: el BEGIN lo emite on_begin
+        dbapi_connection.isolation_level = None
+
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def on_begin(conn):
+        if settings.SQLITE_BEGIN_IMMEDIATE and conn.get_execution_options().get(BEGIN_OPTION) == "IMMEDIATE":
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            conn.exec_driver_sql("BEGIN")
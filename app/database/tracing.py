@@ -0,0 +1,129 @@
+"""
+Trazas SQL por petición (SQL_TRACE).
+
+Con SQL_TRACE=true se registran listeners before/after_cursor_execute
+sobre la clase Engine (primario, réplicas y el engine síncrono interno
+de los AsyncEngine) y un middleware ASGI que abre una traza por
+petición en un ContextVar. Por cada petición:
+
+- cuenta las consultas (sin BEGIN/COMMIT) y el tiempo en la base y lo
+  devuelve en la cabecera ``Server-Timing: db;dur=12.3;desc="4 queries"``;
+- registra las sentencias que superan SQL_SLOW_QUERY_MS con sus
+  parámetros (logger ``app.sql``);
+- al terminar, avisa de los SELECT con la misma forma (mismo SQL
+  parametrizado) ejecutados SQL_N_PLUS_ONE_THRESHOLD veces o más: el
+  patrón de una carga perezosa por fila (N+1).
+
+Las sentencias fuera de una petición (jobs, scripts) se ignoran. Con
+SQL_TRACE=false no se registra nada: ni listeners ni middleware.
+"""
+
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+
+from app.database.config import settings
+
+
+logger = logging.getLogger("app.sql")
+
+# BEGIN/COMMIT explícitos (perfil SQLite): suman tiempo, no cuentan como consultas
+_TRANSACTION_CONTROL = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE")
+
+_current_trace: ContextVar[Optional["RequestTrace"]] = ContextVar("sql_trace", default=None)
+
+
+class RequestTrace:
+    """Statements run while serving one request."""
+
+    __slots__ = ("count", "duration", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        # SQL parametrizado -> veces que se ejecutó (solo SELECT)
+        self.shapes = Counter()
+
+    def record(self, statement: str, parameters, elapsed: float):
+        self.duration += elapsed
+
+        keyword = statement.lstrip()[:9].upper()
+        if not keyword.startswith(_TRANSACTION_CONTROL):
+            self.count += 1
+            if keyword.startswith("SELECT"):
+                self.shapes[statement] += 1
+
+        if elapsed * 1000 >= settings.SQL_SLOW_QUERY_MS:
+            logger.warning("slow query (%.1f ms): %s | params=%r", elapsed * 1000, " ".join(statement.split()), parameters)
+
+    def repeated_shapes(self, threshold: int):
+        """(statement, times) of the SELECT shapes run `threshold` times or more."""
+        return [(statement, times) for statement, times in self.shapes.most_common() if times >= threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} queries"'
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """Trace of the request being served, or None outside a request."""
+    return _current_trace.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_trace.get() is not None:
+        context._sql_trace_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    trace = _current_trace.get()
+    started = getattr(context, "_sql_trace_started", None)
+    if trace is not None and started is not None:
+        trace.record(statement, parameters, time.perf_counter() - started)
+
+
+class SQLTraceMiddleware:
+    """Opens a RequestTrace per HTTP request and adds the Server-Timing header."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = RequestTrace()
+        token = _current_trace.set(trace)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", trace.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_trace.reset(token)
+            for statement, times in trace.repeated_shapes(settings.SQL_N_PLUS_ONE_THRESHOLD):
+                logger.warning(
+                    "possible N+1 in %s %s: %d x %s",
+                    scope["method"], scope["path"], times, " ".join(statement.split())[:300],
+                )
+
+
+def install_sql_tracing(app):
+    """Registers the listeners and the middleware when SQL_TRACE is enabled."""
+    if not settings.SQL_TRACE:
+        return
+
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+    app.add_middleware(SQLTraceMiddleware)
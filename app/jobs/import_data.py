@@ -0,0 +1,59 @@
+"""
+Importación masiva desde la línea de comandos.
+
+Uso:
+    python -m app.jobs.import_data students admisiones.csv
+    python -m app.jobs.import_data professors profesores.ndjson --on-conflict skip
+    python -m app.jobs.import_data students nuevos.csv --chunk-size 5000 --errors errores.ndjson
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from app.controllers.import_controller import IMPORTERS, ON_CONFLICT_MODES, ImportController
+from app.core.importing import READERS
+from app.database.config import settings
+from app.database.connection import SessionLocal
+from app.models.course_model import CourseModel  # noqa: F401 (registro de relaciones)
+from app.models.enrollment_model import EnrollmentModel  # noqa: F401 (registro de relaciones)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import students or professors.")
+    parser.add_argument("entity", choices=sorted(IMPORTERS))
+    parser.add_argument("path", help="CSV (with header) or NDJSON file")
+    parser.add_argument("--format", choices=sorted(READERS), default=None, help="Defaults to the file extension")
+    parser.add_argument("--chunk-size", type=int, default=settings.IMPORT_CHUNK_SIZE)
+    parser.add_argument("--on-conflict", choices=ON_CONFLICT_MODES, default="update")
+    parser.add_argument("--errors", default=None, help="Write the per-row error report to this NDJSON file")
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+
+    started = time.perf_counter()
+    with open(args.path, encoding="utf-8-sig", newline="") as handle, SessionLocal() as db:
+        report = ImportController.import_rows(
+            db, args.entity, READERS[fmt](handle), args.chunk_size, args.on_conflict
+        )
+    elapsed = time.perf_counter() - started
+
+    errors = report.pop("errors")
+    if args.errors:
+        with open(args.errors, "w", encoding="utf-8") as out:
+            for error in errors:
+                out.write(json.dumps(error) + "\n")
+    else:
+        for error in errors[:20]:
+            print(f"row {error['row']}: {error['error']}", file=sys.stderr)
+        if len(errors) > 20:
+            print(f"... {len(errors) - 20} more error(s)", file=sys.stderr)
+
+    rate = report["processed"] / elapsed * 60 if elapsed else 0
+    print(json.dumps(report))
+    print(f"{report['processed']} row(s) in {elapsed:.2f}s ({rate:,.0f} rows/min)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Job de reconstrucción del índice de búsqueda.
+
+Las tablas FTS5 (SQLite, ver app/core/search.py) las mantienen los
+controladores. Si se escribe en students, professors o courses por
+fuera de la API (scripts, cargas SQL, restauraciones) el índice queda
+desactualizado: este job lo vacía y lo vuelve a llenar en una
+transacción. En PostgreSQL la columna search_vector es generada y no
+hay nada que reconstruir.
+
+Uso:
+    python -m app.jobs.rebuild_search_index
+"""
+
+from sqlalchemy import func, select
+
+from app.core.search import FTS_TABLES, SearchIndex
+from app.database.connection import SessionLocal
+from app.models.enrollment_model import EnrollmentModel  # noqa: F401 (registro de relaciones)
+from app.models.waitlist_model import WaitlistEntryModel  # noqa: F401 (registro de relaciones)
+
+
+def run():
+    """Rebuilds every index and returns the indexed rows per entity (empty on PostgreSQL)."""
+    db = SessionLocal()
+    try:
+        if db.get_bind().dialect.name != "sqlite":
+            return {}
+
+        SearchIndex.rebuild(db)
+        counts = {entity: db.scalar(select(func.count()).select_from(fts)) for entity, fts in FTS_TABLES.items()}
+        db.commit()
+        return counts
+    finally:
+        db.close()
+
+
+def main():
+    counts = run()
+    if not counts:
+        print("Nothing to rebuild: the search index is maintained by the database.")
+        return
+
+    for entity, count in counts.items():
+        print(f"{entity}: {count} row(s) indexed")
+
+
+if __name__ == "__main__":
+    main()
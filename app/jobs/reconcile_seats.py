@@ -0,0 +1,64 @@
+"""
+Job de reconciliación de cupos.
+
+courses.seats_taken es un contador mantenido por enroll/unenroll. Si se
+modifica la tabla enrollments por fuera de la API (scripts, migraciones,
+borrados manuales) el contador puede desviarse. Este job lo recalcula
+desde enrollments y corrige solo los cursos desviados.
+
+--rebuild recalcula todos los contadores con un solo GROUP BY sobre
+enrollments (sin reporte por curso), útil tras cargas masivas.
+
+Uso:
+    python -m app.jobs.reconcile_seats            # corrige
+    python -m app.jobs.reconcile_seats --dry-run  # solo reporta
+    python -m app.jobs.reconcile_seats --rebuild  # recálculo completo
+"""
+
+import argparse
+
+from app.controllers.course_controller import CourseController
+from app.database.connection import SessionLocal
+from app.models.professor_model import ProfessorModel  # noqa: F401 (registro de relaciones)
+from app.models.student_model import StudentModel  # noqa: F401 (registro de relaciones)
+
+
+def run(dry_run: bool = False):
+    """Runs the reconciliation and returns the drifted courses."""
+    db = SessionLocal()
+    try:
+        return CourseController.reconcile_seat_counters(db, dry_run=dry_run)
+    finally:
+        db.close()
+
+
+def rebuild():
+    """Recomputes every counter and returns how many changed."""
+    db = SessionLocal()
+    try:
+        return CourseController.rebuild_seat_counters(db)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute drifted courses.seats_taken counters.")
+    parser.add_argument("--dry-run", action="store_true", help="Only report drifted counters")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute every counter with one GROUP BY")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        print(f"{rebuild()} course counter(s) rebuilt.")
+        return
+
+    drifted = run(dry_run=args.dry_run)
+
+    for row in drifted:
+        print(f"course {row['course_id']}: seats_taken={row['seats_taken']} actual={row['actual']}")
+
+    action = "found" if args.dry_run else "fixed"
+    print(f"{len(drifted)} drifted course counter(s) {action}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 from fastapi import FastAPI
+from app.core.idempotency import install_idempotency
+from app.database.tracing import install_sql_tracing
 from app.routes.api_router import init_routes
 
 app = FastAPI(
@@ -10,6 +12,13 @@ app = FastAPI(
 # Inicializar todos los routers
 init_routes(app)
 
+# Idempotency-Key en los POST (por dentro de las trazas: una
+# repetición muestra 0 consultas en Server-Timing)
+install_idempotency(app)
+
+# Trazas SQL por petición (solo con SQL_TRACE=true)
+install_sql_tracing(app)
+
 
 @app.get("/")
 def root():
@@ -10,10 +10,16 @@ class CourseModel(Base):
     code = Column(String, unique=True, nullable=False, index=True)
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
-    professor_id = Column(Integer, ForeignKey("professors.id"), nullable=True)
+    professor_id = Column(Integer, ForeignKey("professors.id"), nullable=True, index=True)
     maximum_capacity = Column(Integer, nullable=True)
+    # Contador de cupos ocupados; se reclama con un UPDATE condicional atómico
+    seats_taken = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     professor = relationship("ProfessorModel", back_populates="courses")
-    enrollments = relationship("EnrollmentModel", back_populates="course", cascade="all, delete-orphan")
\ No newline at end of file
+    enrollments = relationship(
+        "EnrollmentModel", back_populates="course", cascade="all, delete-orphan", order_by="EnrollmentModel.id"
+    )
+    # Solo lectura (?expand=students): los estudiantes a través de enrollments
+    students = relationship("StudentModel", secondary="enrollments", viewonly=True, order_by="StudentModel.id")
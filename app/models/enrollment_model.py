@@ -1,20 +1,36 @@
-from sqlalchemy import Column,UniqueConstraint, ForeignKey, Integer, String, Date, DateTime
+from sqlalchemy import Column,UniqueConstraint, Index, ForeignKey, Integer, String, Date, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.connection import Base
 
+# Estado de una inscripción vigente (ocupa cupo en el curso)
+ENROLLED_STATE = "inscrito"
+
+
 class EnrollmentModel(Base):
     __tablename__ = "enrollments"
     id = Column(Integer, primary_key=True, index=True)
     course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
     inscription_date = Column(DateTime, default=datetime.utcnow)
-    state = Column(String, default="inscrito")
+    state = Column(String, default=ENROLLED_STATE)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     course = relationship("CourseModel", back_populates="enrollments")
     student = relationship("StudentModel", back_populates="enrollments")
 
+    # Índices según los caminos de acceso reales de los controladores:
+    #   uq_course_student          -> duplicados, roster por curso, cascada de curso
+    #   ix_enrollments_student_course -> cursos de un estudiante, cascada de estudiante
+    #   ix_enrollments_course_state   -> inscripciones activas por curso (cupos)
+    #   ix_enrollments_state_id       -> GET /enrollments?state=... (orden por id)
+    #   ix_enrollments_inscription_date -> GET /enrollments por rango de fechas
     __table_args__ = (
         UniqueConstraint("course_id", "student_id", name="uq_course_student"),
+        Index("ix_enrollments_student_course", "student_id", "course_id"),
+        Index("ix_enrollments_course_state", "course_id", "state"),
+        Index("ix_enrollments_state_id", "state", "id"),
+        Index("ix_enrollments_inscription_date", "inscription_date"),
     )
 
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, Date, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, synonym
 from datetime import datetime
 from app.database.connection import Base
 
@@ -9,8 +9,12 @@ class ProfessorModel(Base):
     name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False, index=True)
     tittle = Column(String, nullable=True)
+    # El esquema expone el campo como "title"
+    title = synonym("tittle")
     contratation_date = Column(Date, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    courses = relationship("CourseModel", back_populates="professor", cascade="all, delete-orphan")
+    courses = relationship(
+        "CourseModel", back_populates="professor", cascade="all, delete-orphan", order_by="CourseModel.id"
+    )
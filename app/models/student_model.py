@@ -13,4 +13,8 @@ class StudentModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    enrollments = relationship("EnrollmentModel", back_populates="student", cascade="all, delete-orphan")
+    enrollments = relationship(
+        "EnrollmentModel", back_populates="student", cascade="all, delete-orphan", order_by="EnrollmentModel.id"
+    )
+    # Solo lectura (?expand=courses): los cursos a través de enrollments
+    courses = relationship("CourseModel", secondary="enrollments", viewonly=True, order_by="CourseModel.id")
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, UniqueConstraint, Index, ForeignKey, Integer, DateTime
+from datetime import datetime
+from app.database.connection import Base
+
+
+class WaitlistEntryModel(Base):
+    """
+    Student waiting for a seat in a full course.
+
+    El orden FIFO es el id (creciente al unirse): la cabeza de la cola es
+    el menor id del curso y la posición de una entrada es cuántas entradas
+    del curso tienen id <= al suyo. Salir o ser promovido borra una fila;
+    nunca se renumera la cola.
+    """
+    __tablename__ = "waitlist_entries"
+    id = Column(Integer, primary_key=True)
+    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    #   uq_waitlist_course_student -> un estudiante una vez por curso; salir / posición
+    #   ix_waitlist_course_id      -> cabeza de la cola y posición (course_id, id)
+    #   ix_waitlist_student_id     -> limpieza al borrar un estudiante
+    __table_args__ = (
+        UniqueConstraint("course_id", "student_id", name="uq_waitlist_course_student"),
+        Index("ix_waitlist_course_id", "course_id", "id"),
+        Index("ix_waitlist_student_id", "student_id"),
+    )
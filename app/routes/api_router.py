@@ -7,16 +7,13 @@ professors, students, courses, enrollments, etc.
 Este patrón permite mantener el main.py limpio y organizado.
 """
 
+from typing import Optional
 from fastapi import FastAPI
 
-# Importación de cada router individual
-from app.routes.professor_routes import router as professor_router
-from app.routes.student_routes import router as student_router
-from app.routes.course_routes import router as course_router
-from app.routes.enrollment_routes import router as enrollment_router
+from app.database.config import settings
 
 
-def init_routes(app: FastAPI):
+def init_routes(app: FastAPI, use_async: Optional[bool] = None):
     """
     Registra todos los routers del proyecto en la instancia
     principal de FastAPI.
@@ -29,10 +26,44 @@ def init_routes(app: FastAPI):
 
     DIP: El main.py depende de esta abstracción de rutas,
          no de cada router individual.
+
+    use_async: registra las rutas asíncronas (AsyncSession) en lugar
+         de las síncronas. Por defecto usa settings.USE_ASYNC_DB.
     """
 
+    if use_async is None:
+        use_async = settings.USE_ASYNC_DB
+
+    # Importación de cada router individual. Los routers async solo se
+    # importan si se usan, así el modo síncrono no necesita drivers async.
+    if use_async:
+        from app.routes.async_professor_routes import router as professor_router
+        from app.routes.async_student_routes import router as student_router
+        from app.routes.async_course_routes import router as course_router
+        from app.routes.async_enrollment_routes import router as enrollment_router
+        from app.routes.async_stats_routes import router as stats_router
+        from app.routes.async_search_routes import router as search_router
+    else:
+        from app.routes.professor_routes import router as professor_router
+        from app.routes.student_routes import router as student_router
+        from app.routes.course_routes import router as course_router
+        from app.routes.enrollment_routes import router as enrollment_router
+        from app.routes.stats_routes import router as stats_router
+        from app.routes.search_routes import router as search_router
+
     app.include_router(professor_router)
     app.include_router(student_router)
     app.include_router(course_router)
     app.include_router(enrollment_router)
+    app.include_router(stats_router)
+    app.include_router(search_router)
+
+    # Routers comunes a ambos modos
+    from app.routes.export_routes import router as export_router
+    from app.routes.import_routes import router as import_router
+    from app.routes.internal_routes import router as internal_router
+
+    app.include_router(export_router)
+    app.include_router(import_router)
+    app.include_router(internal_router)
 
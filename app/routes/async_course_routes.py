@@ -0,0 +1,209 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.batch import IDS_DESCRIPTION, batch_response, parse_ids
+from app.core.conditional import (
+    conditional_get, entity_validators, expanded_stamps, expanded_validators, page_validators, set_validators,
+    versions_validators, wants_revalidation
+)
+from app.core.expand import expand_description, expanded_schema, parse_expand
+from app.core.fieldsets import FIELDS_DESCRIPTION, parse_fields, sparse_schema
+from app.core.serialization import FastJSONRoute, encoded_response
+from app.database.config import settings
+from app.database.async_connection import get_async_db, get_async_read_db
+from app.schemas.batch_schema import Batch
+from app.schemas.pagination_schema import Page
+from app.schemas.course_schema import CourseCreate, CourseRead
+from app.controllers.async_course_controller import AsyncCourseController
+
+
+# -------------------------------------------------------------
+# DEFINICIÓN DEL ROUTER
+# -------------------------------------------------------------
+router = APIRouter(
+    prefix="/courses",
+    tags=["Courses"],
+    # Respuestas JSON en una sola pasada (orjson, sin revalidar filas)
+    route_class=FastJSONRoute
+)
+
+
+# -------------------------------------------------------------
+# VERSIÓN ASÍNCRONA DE LAS RUTAS
+# -------------------------------------------------------------
+# Mismas rutas y respuestas que course_routes.py, pero con
+# endpoints async def y una AsyncSession por request. Se registran
+# en lugar de las síncronas cuando USE_ASYNC_DB=True.
+# -------------------------------------------------------------
+
+
+# -------------------------------------------------------------
+# CREATE
+# -------------------------------------------------------------
+@router.post("/", response_model=CourseRead, status_code=status.HTTP_201_CREATED)
+async def create_course(payload: CourseCreate, db: AsyncSession = Depends(get_async_db)):
+    result = await AsyncCourseController.create(db, payload)
+
+    if result == "code_exists":
+        raise HTTPException(400, "Course code already exists.")
+
+    if result == "professor_not_found":
+        raise HTTPException(400, "Professor not found.")
+
+    return result
+
+
+# -------------------------------------------------------------
+# READ - List (cursor pagination)
+# -------------------------------------------------------------
+@router.get("/", response_model=Page[CourseRead])
+async def list_courses(
+    request: Request,
+    response: Response,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    selected = parse_fields(fields, CourseRead)
+    if selected == "invalid_fields":
+        raise HTTPException(400, "Unknown field in fields.")
+
+    # Lote por ids: una consulta IN en vez de un GET por id
+    if ids is not None:
+        requested = parse_ids(ids)
+        if requested == "invalid_ids":
+            raise HTTPException(400, "ids must be a comma separated list of integers.")
+        if requested == "too_many_ids":
+            raise HTTPException(400, f"At most {settings.MAX_BATCH_IDS} ids per request.")
+
+        batch = await AsyncCourseController.get_many(db, requested, selected)
+        schema = sparse_schema(CourseRead, selected) if selected else CourseRead
+        return batch_response(request, response, "courses", requested, batch, Batch[schema])
+
+    # Revalidación: el 304 sale de la consulta de versiones, sin cargar filas
+    if wants_revalidation(request):
+        window = await AsyncCourseController.list_versions(db, limit, after)
+        if window == "invalid_cursor":
+            raise HTTPException(400, "Invalid pagination cursor.")
+
+        not_modified = conditional_get(request, response, versions_validators("courses", window))
+        if not_modified:
+            return not_modified
+
+    result = await AsyncCourseController.list_all(db, limit, after, selected)
+
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    set_validators(response, *page_validators("courses", result))
+    if selected:
+        return encoded_response(response, Page[sparse_schema(CourseRead, selected)], result)
+    return result
+
+
+# -------------------------------------------------------------
+# READ - Get by ID
+# -------------------------------------------------------------
+@router.get("/{course_id}", response_model=CourseRead)
+async def get_course(
+    course_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    expand: Optional[str] = Query(None, description=expand_description("courses")),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    selected = parse_fields(fields, CourseRead)
+    if selected == "invalid_fields":
+        raise HTTPException(400, "Unknown field in fields.")
+
+    relations = parse_expand(expand, "courses")
+    if relations == "invalid_expand":
+        raise HTTPException(400, "Unknown relation in expand.")
+
+    # Revalidación: el 304 sale de los pares (id, updated_at), sin cargar
+    # la fila ni sus relaciones
+    if wants_revalidation(request):
+        if relations:
+            stamps = await AsyncCourseController.get_expanded_versions(db, course_id, relations)
+            validators = stamps and expanded_validators("courses", relations, stamps)
+        else:
+            version = await AsyncCourseController.get_version(db, course_id)
+            validators = version and entity_validators("courses", version)
+        if not validators:
+            raise HTTPException(404, "Course not found.")
+
+        not_modified = conditional_get(request, response, validators)
+        if not_modified:
+            return not_modified
+
+    # Relaciones anidadas: una consulta por colección, sin pasar por la caché
+    if relations:
+        expanded = await AsyncCourseController.get_expanded(db, course_id, relations, selected)
+        if not expanded:
+            raise HTTPException(404, "Course not found.")
+
+        not_modified = conditional_get(request, response, expanded_validators("courses", relations, expanded_stamps("courses", expanded, relations)))
+        if not_modified:
+            return not_modified
+
+        schema = sparse_schema(CourseRead, selected) if selected else CourseRead
+        return encoded_response(response, expanded_schema(schema, "courses", relations), expanded)
+
+    course = await AsyncCourseController.get_by_id(db, course_id, selected)
+
+    if not course:
+        raise HTTPException(404, "Course not found.")
+
+    not_modified = conditional_get(request, response, entity_validators("courses", course))
+    if not_modified:
+        return not_modified
+
+    if selected:
+        return encoded_response(response, sparse_schema(CourseRead, selected), course)
+    return course
+
+
+# -------------------------------------------------------------
+# UPDATE
+# -------------------------------------------------------------
+@router.put("/{course_id}", response_model=CourseRead)
+async def update_course(
+    course_id: int,
+    payload: CourseCreate,
+    response: Response,
+    if_match: Optional[str] = Header(None, description="ETag the update is conditional on"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    result = await AsyncCourseController.update(db, course_id, payload, if_match)
+
+    if result is None:
+        raise HTTPException(404, "Course not found.")
+
+    if result == "precondition_failed":
+        raise HTTPException(412, "Course was modified since it was read (If-Match).")
+
+    if result == "code_in_use":
+        raise HTTPException(400, "Course code already in use.")
+
+    if result == "professor_not_found":
+        raise HTTPException(400, "Professor not found.")
+
+    set_validators(response, *entity_validators("courses", result))
+    return result
+
+
+# -------------------------------------------------------------
+# DELETE
+# -------------------------------------------------------------
+@router.delete("/{course_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_course(course_id: int, db: AsyncSession = Depends(get_async_db)):
+    deleted = await AsyncCourseController.delete(db, course_id)
+
+    if not deleted:
+        raise HTTPException(404, "Course not found.")
+
+    return None
@@ -0,0 +1,267 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from datetime import datetime
+from typing import Optional, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.conditional import conditional_get, page_validators, set_validators, versions_validators, wants_revalidation
+from app.core.serialization import FastJSONRoute
+from app.database.config import settings
+from app.database.async_connection import get_async_db, get_async_read_db
+from app.schemas.pagination_schema import Page
+from app.schemas.enrollment_schema import (
+    EnrollmentCreate,
+    EnrollmentRead,
+    EnrollmentBulkCreate,
+    EnrollmentBulkReport,
+    EnrollmentCount,
+)
+from app.schemas.waitlist_schema import WaitlistJoin, WaitlistStatus
+from app.schemas.student_schema import StudentRead
+from app.schemas.course_schema import CourseRead
+from app.controllers.async_enrollment_controller import AsyncEnrollmentController
+from app.controllers.async_waitlist_controller import AsyncWaitlistController
+
+
+router = APIRouter(
+    prefix="/enrollments",
+    tags=["Enrollments"],
+    # Respuestas JSON en una sola pasada (orjson, sin revalidar filas)
+    route_class=FastJSONRoute
+)
+
+# -------------------------------------------------------------
+# VERSIÓN ASÍNCRONA DE LAS RUTAS
+# -------------------------------------------------------------
+# Mismas rutas y respuestas que enrollment_routes.py, pero con
+# endpoints async def y una AsyncSession por request. Se registran
+# en lugar de las síncronas cuando USE_ASYNC_DB=True.
+# -------------------------------------------------------------
+
+
+# -------------------------------------------------------------
+# ENROLL STUDENT
+# -------------------------------------------------------------
+@router.post("/course/{course_id}", response_model=EnrollmentRead, status_code=201)
+async def enroll_student(course_id: int, payload: EnrollmentCreate, db: AsyncSession = Depends(get_async_db)):
+
+    result = await AsyncEnrollmentController.enroll_student(db, course_id, payload)
+
+    if result == "course_not_found":
+        raise HTTPException(404, "Course not found.")
+
+    if result == "student_not_found":
+        raise HTTPException(404, "Student not found.")
+
+    if result == "already_enrolled":
+        raise HTTPException(400, "Student is already enrolled in this course.")
+
+    if result == "capacity_full":
+        raise HTTPException(400, "Course has reached maximum capacity.")
+
+    if result == "waitlist_pending":
+        raise HTTPException(400, "Course has students on its waitlist; join the waitlist instead.")
+
+    return result
+
+
+# -------------------------------------------------------------
+# BULK ENROLL (cohortes completas o "carrito" de cursos)
+# -------------------------------------------------------------
+@router.post("/bulk", response_model=EnrollmentBulkReport)
+async def bulk_enroll(payload: EnrollmentBulkCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Enrolls many (course_id, student_id) pairs in one transaction.
+    Each item gets its own result; rejected items do not abort the batch.
+    """
+    return await AsyncEnrollmentController.bulk_enroll(db, payload.items)
+
+
+# -------------------------------------------------------------
+# UNENROLL STUDENT
+# -------------------------------------------------------------
+@router.delete("/course/{course_id}/student/{student_id}", status_code=204)
+async def unenroll_student(course_id: int, student_id: int, db: AsyncSession = Depends(get_async_db)):
+
+    result = await AsyncEnrollmentController.unenroll_student(db, course_id, student_id)
+
+    if not result:
+        raise HTTPException(404, "Enrollment not found.")
+
+    return None
+
+
+# -------------------------------------------------------------
+# WAITLIST (cola FIFO de un curso lleno)
+# -------------------------------------------------------------
+@router.post("/course/{course_id}/waitlist", response_model=WaitlistStatus, status_code=201)
+async def join_waitlist(course_id: int, payload: WaitlistJoin, db: AsyncSession = Depends(get_async_db)):
+    """
+    Queues the student for a seat in the course instead of retrying
+    enroll_student. When a seat is free (and nobody is ahead) the
+    student is enrolled right away (status "enrolled").
+    """
+    result = await AsyncWaitlistController.join(db, course_id, payload.student_id)
+
+    if result == "course_not_found":
+        raise HTTPException(404, "Course not found.")
+
+    if result == "student_not_found":
+        raise HTTPException(404, "Student not found.")
+
+    if result == "already_enrolled":
+        raise HTTPException(400, "Student is already enrolled in this course.")
+
+    if result == "already_waitlisted":
+        raise HTTPException(400, "Student is already on the waitlist of this course.")
+
+    return result
+
+
+@router.get("/course/{course_id}/waitlist/{student_id}", response_model=WaitlistStatus)
+async def waitlist_status(course_id: int, student_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    """Position in the course waitlist, or status "enrolled" once promoted."""
+    result = await AsyncWaitlistController.status(db, course_id, student_id)
+
+    if result == "not_waitlisted":
+        raise HTTPException(404, "Student is not on the waitlist of this course.")
+
+    return result
+
+
+@router.delete("/course/{course_id}/waitlist/{student_id}", status_code=204)
+async def leave_waitlist(course_id: int, student_id: int, db: AsyncSession = Depends(get_async_db)):
+
+    result = await AsyncWaitlistController.leave(db, course_id, student_id)
+
+    if not result:
+        raise HTTPException(404, "Student is not on the waitlist of this course.")
+
+    return None
+
+
+# -------------------------------------------------------------
+# LIST STUDENTS IN A COURSE
+# -------------------------------------------------------------
+@router.get("/course/{course_id}/students", response_model=Page[StudentRead])
+async def list_students_in_course(
+    course_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+
+    # Revalidación: el 304 sale de la consulta de versiones, sin cargar filas
+    if wants_revalidation(request):
+        window = await AsyncEnrollmentController.course_roster_versions(db, course_id, limit, after)
+        if window == "course_not_found":
+            raise HTTPException(404, "Course not found.")
+        if window == "invalid_cursor":
+            raise HTTPException(400, "Invalid pagination cursor.")
+
+        not_modified = conditional_get(request, response, versions_validators(f"course:{course_id}:students", window))
+        if not_modified:
+            return not_modified
+
+    result = await AsyncEnrollmentController.list_students_in_course(db, course_id, limit, after)
+
+    if result == "course_not_found":
+        raise HTTPException(404, "Course not found.")
+
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    set_validators(response, *page_validators(f"course:{course_id}:students", result))
+    return result
+
+
+# -------------------------------------------------------------
+# LIST COURSES OF A STUDENT
+# -------------------------------------------------------------
+@router.get("/student/{student_id}/courses", response_model=Page[CourseRead])
+async def list_courses_of_student(
+    student_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+
+    # Revalidación: el 304 sale de la consulta de versiones, sin cargar filas
+    if wants_revalidation(request):
+        window = await AsyncEnrollmentController.student_schedule_versions(db, student_id, limit, after)
+        if window == "student_not_found":
+            raise HTTPException(404, "Student not found.")
+        if window == "invalid_cursor":
+            raise HTTPException(400, "Invalid pagination cursor.")
+
+        not_modified = conditional_get(request, response, versions_validators(f"student:{student_id}:courses", window))
+        if not_modified:
+            return not_modified
+
+    result = await AsyncEnrollmentController.list_courses_of_student(db, student_id, limit, after)
+
+    if result == "student_not_found":
+        raise HTTPException(404, "Student not found.")
+
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    set_validators(response, *page_validators(f"student:{student_id}:courses", result))
+    return result
+
+
+# -------------------------------------------------------------
+# QUERY ENROLLMENTS (filters + cursor pagination / count)
+# -------------------------------------------------------------
+@router.get("/", response_model=Union[EnrollmentCount, Page[EnrollmentRead]])
+async def list_enrollments(
+    request: Request,
+    response: Response,
+    course_id: Optional[int] = Query(None, description="Only enrollments of this course"),
+    student_id: Optional[int] = Query(None, description="Only enrollments of this student"),
+    state: Optional[str] = Query(None, description="Stored state, e.g. inscrito"),
+    inscribed_from: Optional[datetime] = Query(None, description="inscription_date >= this instant"),
+    inscribed_to: Optional[datetime] = Query(None, description="inscription_date < this instant"),
+    count_only: bool = Query(False, description="Return only {\"count\": n} for the filters"),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Enrollments filtered by course, student, state and inscription date
+    range, ordered by id. With count_only=true returns only the count.
+    """
+
+    filters = (course_id, student_id, state, inscribed_from, inscribed_to)
+
+    if count_only:
+        result = await AsyncEnrollmentController.count_enrollments(db, *filters)
+        if result == "invalid_date_range":
+            raise HTTPException(400, "inscribed_from must not be after inscribed_to.")
+        return result
+
+    # Revalidación: el 304 sale de la consulta de versiones, sin cargar filas
+    if wants_revalidation(request):
+        window = await AsyncEnrollmentController.enrollment_versions(db, *filters, limit, after)
+        if window == "invalid_date_range":
+            raise HTTPException(400, "inscribed_from must not be after inscribed_to.")
+        if window == "invalid_cursor":
+            raise HTTPException(400, "Invalid pagination cursor.")
+
+        not_modified = conditional_get(request, response, versions_validators("enrollments", window))
+        if not_modified:
+            return not_modified
+
+    result = await AsyncEnrollmentController.list_enrollments(db, *filters, limit, after)
+
+    if result == "invalid_date_range":
+        raise HTTPException(400, "inscribed_from must not be after inscribed_to.")
+
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    set_validators(response, *page_validators("enrollments", result))
+    return result
@@ -0,0 +1,221 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.batch import IDS_DESCRIPTION, batch_response, parse_ids
+from app.core.conditional import (
+    conditional_get, entity_validators, expanded_stamps, expanded_validators, page_validators, set_validators,
+    versions_validators, wants_revalidation
+)
+from app.core.expand import expand_description, expanded_schema, parse_expand
+from app.core.fieldsets import FIELDS_DESCRIPTION, parse_fields, sparse_schema
+from app.core.serialization import FastJSONRoute, encoded_response
+from app.database.config import settings
+from app.database.async_connection import get_async_db, get_async_read_db
+from app.schemas.batch_schema import Batch
+from app.schemas.pagination_schema import Page
+from app.schemas.professor_schema import ProfessorCreate, ProfessorRead
+from app.controllers.async_professor_controller import AsyncProfessorController
+
+
+# -------------------------------------------------------------
+# DEFINICIÓN DEL ROUTER
+# -------------------------------------------------------------
+router = APIRouter(
+    prefix="/professors",
+    tags=["Professors"],
+    # Respuestas JSON en una sola pasada (orjson, sin revalidar filas)
+    route_class=FastJSONRoute
+)
+
+
+# -------------------------------------------------------------
+# VERSIÓN ASÍNCRONA DE LAS RUTAS
+# -------------------------------------------------------------
+# Mismas rutas y respuestas que professor_routes.py, pero con
+# endpoints async def y una AsyncSession por request. Se registran
+# en lugar de las síncronas cuando USE_ASYNC_DB=True.
+# -------------------------------------------------------------
+
+
+# -------------------------------------------------------------
+# CREATE
+# -------------------------------------------------------------
+@router.post("/", response_model=ProfessorRead, status_code=status.HTTP_201_CREATED)
+async def create_professor(payload: ProfessorCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Ruta responsable de registrar un nuevo profesor.
+    """
+
+    result = await AsyncProfessorController.create(db, payload)
+
+    if result == "email_exists":
+        raise HTTPException(400, "Professor email already exists.")
+
+    return result
+
+
+# -------------------------------------------------------------
+# READ - List (cursor pagination)
+# -------------------------------------------------------------
+@router.get("/", response_model=Page[ProfessorRead])
+async def list_professors(
+    request: Request,
+    response: Response,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Devuelve una página de profesores (paginación por cursor).
+    """
+    selected = parse_fields(fields, ProfessorRead)
+    if selected == "invalid_fields":
+        raise HTTPException(400, "Unknown field in fields.")
+
+    # Lote por ids: una consulta IN en vez de un GET por id
+    if ids is not None:
+        requested = parse_ids(ids)
+        if requested == "invalid_ids":
+            raise HTTPException(400, "ids must be a comma separated list of integers.")
+        if requested == "too_many_ids":
+            raise HTTPException(400, f"At most {settings.MAX_BATCH_IDS} ids per request.")
+
+        batch = await AsyncProfessorController.get_many(db, requested, selected)
+        schema = sparse_schema(ProfessorRead, selected) if selected else ProfessorRead
+        return batch_response(request, response, "professors", requested, batch, Batch[schema])
+
+    # Revalidación: el 304 sale de la consulta de versiones, sin cargar filas
+    if wants_revalidation(request):
+        window = await AsyncProfessorController.list_versions(db, limit, after)
+        if window == "invalid_cursor":
+            raise HTTPException(400, "Invalid pagination cursor.")
+
+        not_modified = conditional_get(request, response, versions_validators("professors", window))
+        if not_modified:
+            return not_modified
+
+    result = await AsyncProfessorController.list_all(db, limit, after, selected)
+
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    set_validators(response, *page_validators("professors", result))
+    if selected:
+        return encoded_response(response, Page[sparse_schema(ProfessorRead, selected)], result)
+    return result
+
+
+# -------------------------------------------------------------
+# READ - Get by ID
+# -------------------------------------------------------------
+@router.get("/{professor_id}", response_model=ProfessorRead)
+async def get_professor(
+    professor_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    expand: Optional[str] = Query(None, description=expand_description("professors")),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Obtiene un profesor por ID.
+    """
+    selected = parse_fields(fields, ProfessorRead)
+    if selected == "invalid_fields":
+        raise HTTPException(400, "Unknown field in fields.")
+
+    relations = parse_expand(expand, "professors")
+    if relations == "invalid_expand":
+        raise HTTPException(400, "Unknown relation in expand.")
+
+    # Revalidación: el 304 sale de los pares (id, updated_at), sin cargar
+    # la fila ni sus relaciones
+    if wants_revalidation(request):
+        if relations:
+            stamps = await AsyncProfessorController.get_expanded_versions(db, professor_id, relations)
+            validators = stamps and expanded_validators("professors", relations, stamps)
+        else:
+            version = await AsyncProfessorController.get_version(db, professor_id)
+            validators = version and entity_validators("professors", version)
+        if not validators:
+            raise HTTPException(404, "Professor not found.")
+
+        not_modified = conditional_get(request, response, validators)
+        if not_modified:
+            return not_modified
+
+    # Relaciones anidadas: una consulta por colección, sin pasar por la caché
+    if relations:
+        expanded = await AsyncProfessorController.get_expanded(db, professor_id, relations, selected)
+        if not expanded:
+            raise HTTPException(404, "Professor not found.")
+
+        not_modified = conditional_get(request, response, expanded_validators("professors", relations, expanded_stamps("professors", expanded, relations)))
+        if not_modified:
+            return not_modified
+
+        schema = sparse_schema(ProfessorRead, selected) if selected else ProfessorRead
+        return encoded_response(response, expanded_schema(schema, "professors", relations), expanded)
+
+    prof = await AsyncProfessorController.get_by_id(db, professor_id, selected)
+
+    if not prof:
+        raise HTTPException(404, "Professor not found.")
+
+    not_modified = conditional_get(request, response, entity_validators("professors", prof))
+    if not_modified:
+        return not_modified
+
+    if selected:
+        return encoded_response(response, sparse_schema(ProfessorRead, selected), prof)
+    return prof
+
+
+# -------------------------------------------------------------
+# UPDATE
+# -------------------------------------------------------------
+@router.put("/{professor_id}", response_model=ProfessorRead)
+async def update_professor(
+    professor_id: int,
+    payload: ProfessorCreate,
+    response: Response,
+    if_match: Optional[str] = Header(None, description="ETag the update is conditional on"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Actualiza los datos de un profesor.
+    """
+
+    result = await AsyncProfessorController.update(db, professor_id, payload, if_match)
+
+    if result is None:
+        raise HTTPException(404, "Professor not found.")
+
+    if result == "precondition_failed":
+        raise HTTPException(412, "Professor was modified since it was read (If-Match).")
+
+    if result == "email_in_use":
+        raise HTTPException(400, "Email already used by another professor.")
+
+    set_validators(response, *entity_validators("professors", result))
+    return result
+
+
+# -------------------------------------------------------------
+# DELETE
+# -------------------------------------------------------------
+@router.delete("/{professor_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_professor(professor_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Elimina un profesor por ID.
+    """
+
+    deleted = await AsyncProfessorController.delete(db, professor_id)
+
+    if not deleted:
+        raise HTTPException(404, "Professor not found.")
+
+    return None
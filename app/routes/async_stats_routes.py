@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.conditional import conditional_get, page_validators, set_validators, versions_validators, wants_revalidation
+from app.core.serialization import FastJSONRoute
+from app.database.config import settings
+from app.database.async_connection import get_async_read_db
+from app.schemas.pagination_schema import Page
+from app.schemas.stats_schema import CourseStatsRead, ProfessorStatsRead
+from app.controllers.async_stats_controller import AsyncStatsController
+
+
+router = APIRouter(
+    prefix="/stats",
+    tags=["Stats"],
+    # Respuestas JSON en una sola pasada (orjson, sin revalidar filas)
+    route_class=FastJSONRoute
+)
+
+# -------------------------------------------------------------
+# VERSIÓN ASÍNCRONA DE LAS RUTAS
+# -------------------------------------------------------------
+# Mismas rutas y respuestas que stats_routes.py con AsyncSession.
+# Se registran en lugar de las síncronas cuando USE_ASYNC_DB=True.
+# -------------------------------------------------------------
+
+
+# -------------------------------------------------------------
+# COURSE FILL RATES
+# -------------------------------------------------------------
+@router.get("/courses", response_model=Page[CourseStatsRead])
+async def course_stats(
+    request: Request,
+    response: Response,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Enrolled count, capacity and fill rate of each course."""
+
+    # Revalidación: el 304 sale de la consulta de versiones, sin cargar filas
+    if wants_revalidation(request):
+        window = await AsyncStatsController.course_stats_versions(db, limit, after)
+        if window == "invalid_cursor":
+            raise HTTPException(400, "Invalid pagination cursor.")
+
+        not_modified = conditional_get(request, response, versions_validators("stats:courses", window))
+        if not_modified:
+            return not_modified
+
+    result = await AsyncStatsController.course_stats(db, limit, after)
+
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    set_validators(response, *page_validators("stats:courses", result))
+    return result
+
+
+@router.get("/courses/{course_id}", response_model=CourseStatsRead)
+async def course_stats_by_id(course_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    """Enrolled count, capacity and fill rate of one course."""
+
+    result = await AsyncStatsController.course_stats_by_id(db, course_id)
+
+    if not result:
+        raise HTTPException(404, "Course not found.")
+
+    return result
+
+
+# -------------------------------------------------------------
+# PROFESSOR LOAD
+# -------------------------------------------------------------
+@router.get("/professors", response_model=Page[ProfessorStatsRead])
+async def professor_stats(
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Course count and total students of each professor."""
+
+    result = await AsyncStatsController.professor_stats(db, limit, after)
+
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    return result
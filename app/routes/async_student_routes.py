@@ -0,0 +1,217 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.batch import IDS_DESCRIPTION, batch_response, parse_ids
+from app.core.conditional import (
+    conditional_get, entity_validators, expanded_stamps, expanded_validators, page_validators, set_validators,
+    versions_validators, wants_revalidation
+)
+from app.core.expand import expand_description, expanded_schema, parse_expand
+from app.core.fieldsets import FIELDS_DESCRIPTION, parse_fields, sparse_schema
+from app.core.serialization import FastJSONRoute, encoded_response
+from app.database.config import settings
+from app.database.async_connection import get_async_db, get_async_read_db
+from app.schemas.batch_schema import Batch
+from app.schemas.pagination_schema import Page
+from app.schemas.student_schema import StudentCreate, StudentRead
+from app.controllers.async_student_controller import AsyncStudentController
+
+
+# -------------------------------------------------------------
+# DEFINICIÓN DEL ROUTER
+# -------------------------------------------------------------
+router = APIRouter(
+    prefix="/students",
+    tags=["Students"],
+    # Respuestas JSON en una sola pasada (orjson, sin revalidar filas)
+    route_class=FastJSONRoute
+)
+
+
+# -------------------------------------------------------------
+# VERSIÓN ASÍNCRONA DE LAS RUTAS
+# -------------------------------------------------------------
+# Mismas rutas y respuestas que student_routes.py, pero con
+# endpoints async def y una AsyncSession por request. Se registran
+# en lugar de las síncronas cuando USE_ASYNC_DB=True.
+# -------------------------------------------------------------
+
+
+# -------------------------------------------------------------
+# CREATE
+# -------------------------------------------------------------
+@router.post("/", response_model=StudentRead, status_code=status.HTTP_201_CREATED)
+async def create_student(payload: StudentCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Route to create a new student.
+    """
+
+    result = await AsyncStudentController.create(db, payload)
+
+    if result == "email_exists":
+        raise HTTPException(400, "Student email already registered.")
+
+    return result
+
+
+# -------------------------------------------------------------
+# READ - List (cursor pagination)
+# -------------------------------------------------------------
+@router.get("/", response_model=Page[StudentRead])
+async def list_students(
+    request: Request,
+    response: Response,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Returns a page of students (cursor pagination)."""
+    selected = parse_fields(fields, StudentRead)
+    if selected == "invalid_fields":
+        raise HTTPException(400, "Unknown field in fields.")
+
+    # Lote por ids: una consulta IN en vez de un GET por id
+    if ids is not None:
+        requested = parse_ids(ids)
+        if requested == "invalid_ids":
+            raise HTTPException(400, "ids must be a comma separated list of integers.")
+        if requested == "too_many_ids":
+            raise HTTPException(400, f"At most {settings.MAX_BATCH_IDS} ids per request.")
+
+        batch = await AsyncStudentController.get_many(db, requested, selected)
+        schema = sparse_schema(StudentRead, selected) if selected else StudentRead
+        return batch_response(request, response, "students", requested, batch, Batch[schema])
+
+    # Revalidación: el 304 sale de la consulta de versiones, sin cargar filas
+    if wants_revalidation(request):
+        window = await AsyncStudentController.list_versions(db, limit, after)
+        if window == "invalid_cursor":
+            raise HTTPException(400, "Invalid pagination cursor.")
+
+        not_modified = conditional_get(request, response, versions_validators("students", window))
+        if not_modified:
+            return not_modified
+
+    result = await AsyncStudentController.list_all(db, limit, after, selected)
+
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    set_validators(response, *page_validators("students", result))
+    if selected:
+        return encoded_response(response, Page[sparse_schema(StudentRead, selected)], result)
+    return result
+
+
+# -------------------------------------------------------------
+# READ - Get by ID
+# -------------------------------------------------------------
+@router.get("/{student_id}", response_model=StudentRead)
+async def get_student(
+    student_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    expand: Optional[str] = Query(None, description=expand_description("students")),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Returns a specific student by ID."""
+    selected = parse_fields(fields, StudentRead)
+    if selected == "invalid_fields":
+        raise HTTPException(400, "Unknown field in fields.")
+
+    relations = parse_expand(expand, "students")
+    if relations == "invalid_expand":
+        raise HTTPException(400, "Unknown relation in expand.")
+
+    # Revalidación: el 304 sale de los pares (id, updated_at), sin cargar
+    # la fila ni sus relaciones
+    if wants_revalidation(request):
+        if relations:
+            stamps = await AsyncStudentController.get_expanded_versions(db, student_id, relations)
+            validators = stamps and expanded_validators("students", relations, stamps)
+        else:
+            version = await AsyncStudentController.get_version(db, student_id)
+            validators = version and entity_validators("students", version)
+        if not validators:
+            raise HTTPException(404, "Student not found.")
+
+        not_modified = conditional_get(request, response, validators)
+        if not_modified:
+            return not_modified
+
+    # Relaciones anidadas: una consulta por colección, sin pasar por la caché
+    if relations:
+        expanded = await AsyncStudentController.get_expanded(db, student_id, relations, selected)
+        if not expanded:
+            raise HTTPException(404, "Student not found.")
+
+        not_modified = conditional_get(request, response, expanded_validators("students", relations, expanded_stamps("students", expanded, relations)))
+        if not_modified:
+            return not_modified
+
+        schema = sparse_schema(StudentRead, selected) if selected else StudentRead
+        return encoded_response(response, expanded_schema(schema, "students", relations), expanded)
+
+    student = await AsyncStudentController.get_by_id(db, student_id, selected)
+
+    if not student:
+        raise HTTPException(404, "Student not found.")
+
+    not_modified = conditional_get(request, response, entity_validators("students", student))
+    if not_modified:
+        return not_modified
+
+    if selected:
+        return encoded_response(response, sparse_schema(StudentRead, selected), student)
+    return student
+
+
+# -------------------------------------------------------------
+# UPDATE
+# -------------------------------------------------------------
+@router.put("/{student_id}", response_model=StudentRead)
+async def update_student(
+    student_id: int,
+    payload: StudentCreate,
+    response: Response,
+    if_match: Optional[str] = Header(None, description="ETag the update is conditional on"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Updates a student's information.
+    """
+
+    result = await AsyncStudentController.update(db, student_id, payload, if_match)
+
+    if result is None:
+        raise HTTPException(404, "Student not found.")
+
+    if result == "precondition_failed":
+        raise HTTPException(412, "Student was modified since it was read (If-Match).")
+
+    if result == "email_in_use":
+        raise HTTPException(400, "Email already used by another student.")
+
+    set_validators(response, *entity_validators("students", result))
+    return result
+
+
+# -------------------------------------------------------------
+# DELETE
+# -------------------------------------------------------------
+@router.delete("/{student_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_student(student_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Deletes a student by ID.
+    """
+
+    deleted = await AsyncStudentController.delete(db, student_id)
+
+    if not deleted:
+        raise HTTPException(404, "Student not found.")
+
+    return None
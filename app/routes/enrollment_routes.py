@@ -1,17 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from datetime import datetime
+from typing import Optional, Union
 from sqlalchemy.orm import Session
 
-from app.database.connection import get_db
-from app.schemas.enrollment_schema import EnrollmentCreate, EnrollmentRead
+from app.core.conditional import conditional_get, page_validators, set_validators, versions_validators, wants_revalidation
+from app.core.serialization import FastJSONRoute
+from app.database.config import settings
+from app.database.connection import get_db, get_read_db
+from app.schemas.pagination_schema import Page
+from app.schemas.enrollment_schema import (
+    EnrollmentCreate,
+    EnrollmentRead,
+    EnrollmentBulkCreate,
+    EnrollmentBulkReport,
+    EnrollmentCount,
+)
+from app.schemas.waitlist_schema import WaitlistJoin, WaitlistStatus
 from app.schemas.student_schema import StudentRead
 from app.schemas.course_schema import CourseRead
 from app.controllers.enrollment_controller import EnrollmentController
+from app.controllers.waitlist_controller import WaitlistController
 
 
 router = APIRouter(
     prefix="/enrollments",
-    tags=["Enrollments"]
+    tags=["Enrollments"],
+    # Respuestas JSON en una sola pasada (orjson, sin revalidar filas)
+    route_class=FastJSONRoute
 )
 
 # -------------------------------------------------------------
@@ -49,9 +64,24 @@ def enroll_student(course_id: int, payload: EnrollmentCreate, db: Session = Depe
     if result == "capacity_full":
         raise HTTPException(400, "Course has reached maximum capacity.")
 
+    if result == "waitlist_pending":
+        raise HTTPException(400, "Course has students on its waitlist; join the waitlist instead.")
+
     return result
 
 
+# -------------------------------------------------------------
+# BULK ENROLL (cohortes completas o "carrito" de cursos)
+# -------------------------------------------------------------
+@router.post("/bulk", response_model=EnrollmentBulkReport)
+def bulk_enroll(payload: EnrollmentBulkCreate, db: Session = Depends(get_db)):
+    """
+    Enrolls many (course_id, student_id) pairs in one transaction.
+    Each item gets its own result; rejected items do not abort the batch.
+    """
+    return EnrollmentController.bulk_enroll(db, payload.items)
+
+
 # -------------------------------------------------------------
 # UNENROLL STUDENT
 # -------------------------------------------------------------
@@ -66,29 +96,178 @@ def unenroll_student(course_id: int, student_id: int, db: Session = Depends(get_
     return None
 
 
+# -------------------------------------------------------------
+# WAITLIST (cola FIFO de un curso lleno)
+# -------------------------------------------------------------
+@router.post("/course/{course_id}/waitlist", response_model=WaitlistStatus, status_code=201)
+def join_waitlist(course_id: int, payload: WaitlistJoin, db: Session = Depends(get_db)):
+    """
+    Queues the student for a seat in the course instead of retrying
+    enroll_student. When a seat is free (and nobody is ahead) the
+    student is enrolled right away (status "enrolled").
+    """
+    result = WaitlistController.join(db, course_id, payload.student_id)
+
+    if result == "course_not_found":
+        raise HTTPException(404, "Course not found.")
+
+    if result == "student_not_found":
+        raise HTTPException(404, "Student not found.")
+
+    if result == "already_enrolled":
+        raise HTTPException(400, "Student is already enrolled in this course.")
+
+    if result == "already_waitlisted":
+        raise HTTPException(400, "Student is already on the waitlist of this course.")
+
+    return result
+
+
+@router.get("/course/{course_id}/waitlist/{student_id}", response_model=WaitlistStatus)
+def waitlist_status(course_id: int, student_id: int, db: Session = Depends(get_read_db)):
+    """Position in the course waitlist, or status "enrolled" once promoted."""
+    result = WaitlistController.status(db, course_id, student_id)
+
+    if result == "not_waitlisted":
+        raise HTTPException(404, "Student is not on the waitlist of this course.")
+
+    return result
+
+
+@router.delete("/course/{course_id}/waitlist/{student_id}", status_code=204)
+def leave_waitlist(course_id: int, student_id: int, db: Session = Depends(get_db)):
+
+    result = WaitlistController.leave(db, course_id, student_id)
+
+    if not result:
+        raise HTTPException(404, "Student is not on the waitlist of this course.")
+
+    return None
+
+
 # -------------------------------------------------------------
 # LIST STUDENTS IN A COURSE
 # -------------------------------------------------------------
-@router.get("/course/{course_id}/students", response_model=List[StudentRead])
-def list_students_in_course(course_id: int, db: Session = Depends(get_db)):
+@router.get("/course/{course_id}/students", response_model=Page[StudentRead])
+def list_students_in_course(
+    course_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    db: Session = Depends(get_read_db)
+):
 
-    result = EnrollmentController.list_students_in_course(db, course_id)
+    # Revalidación: el 304 sale de la consulta de versiones, sin cargar filas
+    if wants_revalidation(request):
+        window = EnrollmentController.course_roster_versions(db, course_id, limit, after)
+        if window == "course_not_found":
+            raise HTTPException(404, "Course not found.")
+        if window == "invalid_cursor":
+            raise HTTPException(400, "Invalid pagination cursor.")
+
+        not_modified = conditional_get(request, response, versions_validators(f"course:{course_id}:students", window))
+        if not_modified:
+            return not_modified
+
+    result = EnrollmentController.list_students_in_course(db, course_id, limit, after)
 
     if result == "course_not_found":
         raise HTTPException(404, "Course not found.")
 
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    set_validators(response, *page_validators(f"course:{course_id}:students", result))
     return result
 
 
 # -------------------------------------------------------------
 # LIST COURSES OF A STUDENT
 # -------------------------------------------------------------
-@router.get("/student/{student_id}/courses", response_model=List[CourseRead])
-def list_courses_of_student(student_id: int, db: Session = Depends(get_db)):
+@router.get("/student/{student_id}/courses", response_model=Page[CourseRead])
+def list_courses_of_student(
+    student_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    db: Session = Depends(get_read_db)
+):
 
-    result = EnrollmentController.list_courses_of_student(db, student_id)
+    # Revalidación: el 304 sale de la consulta de versiones, sin cargar filas
+    if wants_revalidation(request):
+        window = EnrollmentController.student_schedule_versions(db, student_id, limit, after)
+        if window == "student_not_found":
+            raise HTTPException(404, "Student not found.")
+        if window == "invalid_cursor":
+            raise HTTPException(400, "Invalid pagination cursor.")
+
+        not_modified = conditional_get(request, response, versions_validators(f"student:{student_id}:courses", window))
+        if not_modified:
+            return not_modified
+
+    result = EnrollmentController.list_courses_of_student(db, student_id, limit, after)
 
     if result == "student_not_found":
         raise HTTPException(404, "Student not found.")
 
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    set_validators(response, *page_validators(f"student:{student_id}:courses", result))
+    return result
+
+
+# -------------------------------------------------------------
+# QUERY ENROLLMENTS (filters + cursor pagination / count)
+# -------------------------------------------------------------
+@router.get("/", response_model=Union[EnrollmentCount, Page[EnrollmentRead]])
+def list_enrollments(
+    request: Request,
+    response: Response,
+    course_id: Optional[int] = Query(None, description="Only enrollments of this course"),
+    student_id: Optional[int] = Query(None, description="Only enrollments of this student"),
+    state: Optional[str] = Query(None, description="Stored state, e.g. inscrito"),
+    inscribed_from: Optional[datetime] = Query(None, description="inscription_date >= this instant"),
+    inscribed_to: Optional[datetime] = Query(None, description="inscription_date < this instant"),
+    count_only: bool = Query(False, description="Return only {\"count\": n} for the filters"),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Enrollments filtered by course, student, state and inscription date
+    range, ordered by id. With count_only=true returns only the count.
+    """
+
+    filters = (course_id, student_id, state, inscribed_from, inscribed_to)
+
+    if count_only:
+        result = EnrollmentController.count_enrollments(db, *filters)
+        if result == "invalid_date_range":
+            raise HTTPException(400, "inscribed_from must not be after inscribed_to.")
+        return result
+
+    # Revalidación: el 304 sale de la consulta de versiones, sin cargar filas
+    if wants_revalidation(request):
+        window = EnrollmentController.enrollment_versions(db, *filters, limit, after)
+        if window == "invalid_date_range":
+            raise HTTPException(400, "inscribed_from must not be after inscribed_to.")
+        if window == "invalid_cursor":
+            raise HTTPException(400, "Invalid pagination cursor.")
+
+        not_modified = conditional_get(request, response, versions_validators("enrollments", window))
+        if not_modified:
+            return not_modified
+
+    result = EnrollmentController.list_enrollments(db, *filters, limit, after)
+
+    if result == "invalid_date_range":
+        raise HTTPException(400, "inscribed_from must not be after inscribed_to.")
+
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    set_validators(response, *page_validators("enrollments", result))
     return result
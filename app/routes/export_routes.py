@@ -0,0 +1,83 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Literal
+from sqlalchemy.orm import Session
+
+from app.database.connection import get_db
+from app.controllers.export_controller import ExportController
+from app.core.streaming import ENCODERS, MEDIA_TYPES
+
+
+router = APIRouter(
+    prefix="/export",
+    tags=["Export"]
+)
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# -------------------------------------------------------------
+# EXPORTACIÓN EN STREAMING
+# -------------------------------------------------------------
+# Las rutas solo eligen el formato y envuelven los lotes del
+# controlador en un StreamingResponse (respuesta chunked).
+#
+# FastAPI cierra las dependencias con yield ANTES de enviar el cuerpo
+# de un StreamingResponse, así que el propio generador cierra la sesión
+# al terminar (o si el cliente corta la descarga).
+# -------------------------------------------------------------
+
+
+def _stream(db: Session, columns, batches, fmt: str, filename: str):
+
+    def body():
+        try:
+            yield from ENCODERS[fmt](columns, batches)
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'}
+    )
+
+
+# -------------------------------------------------------------
+# EXPORT - Tablas completas
+# -------------------------------------------------------------
+@router.get("/students")
+def export_students(format: ExportFormat = Query("ndjson"), db: Session = Depends(get_db)):
+    columns, batches = ExportController.export_students(db)
+    return _stream(db, columns, batches, format, "students")
+
+
+@router.get("/professors")
+def export_professors(format: ExportFormat = Query("ndjson"), db: Session = Depends(get_db)):
+    columns, batches = ExportController.export_professors(db)
+    return _stream(db, columns, batches, format, "professors")
+
+
+@router.get("/courses")
+def export_courses(format: ExportFormat = Query("ndjson"), db: Session = Depends(get_db)):
+    columns, batches = ExportController.export_courses(db)
+    return _stream(db, columns, batches, format, "courses")
+
+
+@router.get("/enrollments")
+def export_enrollments(format: ExportFormat = Query("ndjson"), db: Session = Depends(get_db)):
+    columns, batches = ExportController.export_enrollments(db)
+    return _stream(db, columns, batches, format, "enrollments")
+
+
+# -------------------------------------------------------------
+# EXPORT - Roster de un curso
+# -------------------------------------------------------------
+@router.get("/courses/{course_id}/roster")
+def export_course_roster(course_id: int, format: ExportFormat = Query("ndjson"), db: Session = Depends(get_db)):
+    result = ExportController.export_course_roster(db, course_id)
+
+    if result == "course_not_found":
+        raise HTTPException(404, "Course not found.")
+
+    columns, batches = result
+    return _stream(db, columns, batches, format, f"course_{course_id}_roster")
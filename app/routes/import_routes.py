@@ -0,0 +1,78 @@
+import io
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from typing import Literal, Optional
+from sqlalchemy.orm import Session
+
+from app.database.config import settings
+from app.database.connection import get_db
+from app.controllers.import_controller import ImportController
+from app.core.importing import READERS
+from app.schemas.import_schema import ImportReport
+
+
+router = APIRouter(
+    prefix="/import",
+    tags=["Import"]
+)
+
+ImportFormat = Literal["csv", "ndjson"]
+OnConflict = Literal["update", "skip"]
+
+# -------------------------------------------------------------
+# IMPORTACIÓN MASIVA
+# -------------------------------------------------------------
+# Las rutas reciben el archivo (multipart), detectan el formato y
+# delegan la validación por lotes y la escritura al controlador.
+# -------------------------------------------------------------
+
+
+def _detect_format(file: UploadFile, fmt: Optional[str]):
+    if fmt:
+        return fmt
+
+    name = (file.filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+
+    return None
+
+
+def _import(entity: str, file: UploadFile, fmt, chunk_size: int, on_conflict: str, db: Session):
+    fmt = _detect_format(file, fmt)
+    if fmt is None:
+        raise HTTPException(400, "Cannot detect file format. Use ?format=csv or ?format=ndjson.")
+
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    rows = READERS[fmt](text)
+
+    return ImportController.import_rows(db, entity, rows, chunk_size, on_conflict)
+
+
+# -------------------------------------------------------------
+# IMPORT STUDENTS
+# -------------------------------------------------------------
+@router.post("/students", response_model=ImportReport)
+def import_students(
+    file: UploadFile = File(..., description="CSV (with header) or NDJSON file"),
+    format: Optional[ImportFormat] = Query(None, description="Defaults to the file extension"),
+    chunk_size: int = Query(settings.IMPORT_CHUNK_SIZE, ge=1, le=10000),
+    on_conflict: OnConflict = Query("update", description="What to do when the email already exists"),
+    db: Session = Depends(get_db)
+):
+    return _import("students", file, format, chunk_size, on_conflict, db)
+
+
+# -------------------------------------------------------------
+# IMPORT PROFESSORS
+# -------------------------------------------------------------
+@router.post("/professors", response_model=ImportReport)
+def import_professors(
+    file: UploadFile = File(..., description="CSV (with header) or NDJSON file"),
+    format: Optional[ImportFormat] = Query(None, description="Defaults to the file extension"),
+    chunk_size: int = Query(settings.IMPORT_CHUNK_SIZE, ge=1, le=10000),
+    on_conflict: OnConflict = Query("update", description="What to do when the email already exists"),
+    db: Session = Depends(get_db)
+):
+    return _import("professors", file, format, chunk_size, on_conflict, db)
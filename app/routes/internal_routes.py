@@ -0,0 +1,56 @@
+from fastapi import APIRouter
+
+from app.core.cache import entity_cache
+from app.core.idempotency import idempotency_store
+from app.database.config import settings
+from app.database.connection import pool_telemetry, replica_pool_telemetries
+
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"]
+)
+
+# -------------------------------------------------------------
+# RUTAS INTERNAS DE OPERACIÓN
+# -------------------------------------------------------------
+# Telemetría para operación y benchmarks; no forman parte de la API
+# pública y no tocan la base de datos.
+# -------------------------------------------------------------
+
+
+@router.get("/cache")
+def cache_stats():
+    """Hit / miss / eviction counters of the entity cache."""
+    return entity_cache.stats()
+
+
+@router.get("/idempotency")
+def idempotency_stats():
+    """Executed / replayed / waited / conflicting Idempotency-Key requests."""
+    return idempotency_store.stats()
+
+
+def _pool_telemetries():
+    telemetries = [pool_telemetry, *replica_pool_telemetries]
+    if settings.USE_ASYNC_DB:
+        from app.database.async_connection import async_pool_telemetry, async_replica_pool_telemetries
+        telemetries += [async_pool_telemetry, *async_replica_pool_telemetries]
+    return telemetries
+
+
+@router.get("/pool")
+def pool_stats():
+    """
+    Connection pool state (checked out, overflow, waiting) and
+    wait / checkout / hold latency histograms per engine.
+    """
+    return {telemetry.name: telemetry.stats() for telemetry in _pool_telemetries()}
+
+
+@router.post("/pool/reset")
+def reset_pool_stats():
+    """Zeroes the pool counters and histograms (e.g. between benchmark runs)."""
+    for telemetry in _pool_telemetries():
+        telemetry.reset()
+    return pool_stats()
@@ -0,0 +1,87 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from app.core.serialization import FastJSONRoute
+from app.database.config import settings
+from app.database.connection import get_read_db
+from app.schemas.course_schema import CourseRead
+from app.schemas.professor_schema import ProfessorRead
+from app.schemas.search_schema import SearchPage
+from app.schemas.student_schema import StudentRead
+from app.controllers.search_controller import SearchController
+
+
+router = APIRouter(
+    prefix="/search",
+    tags=["Search"],
+    # Respuestas JSON en una sola pasada (orjson, sin revalidar filas)
+    route_class=FastJSONRoute
+)
+
+# -------------------------------------------------------------
+# BÚSQUEDA DE TEXTO
+# -------------------------------------------------------------
+# Cada término de q se busca como prefijo en los campos de texto de
+# la entidad; los resultados vienen por relevancia, paginados por
+# cursor, con facetas de los filtros en la primera página.
+# -------------------------------------------------------------
+
+Q_DESCRIPTION = "Search terms; each one matches as a word prefix (at least 2 characters)"
+
+
+def _check(result):
+    if result == "empty_query":
+        raise HTTPException(400, "Search query needs at least one term of 2 or more characters.")
+
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    return result
+
+
+# -------------------------------------------------------------
+# STUDENTS (nombre y correo)
+# -------------------------------------------------------------
+@router.get("/students", response_model=SearchPage[StudentRead])
+def search_students(
+    q: str = Query(..., min_length=1, max_length=200, description=Q_DESCRIPTION),
+    degree: Optional[str] = Query(None, description="Only students of this degree"),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    facets: bool = Query(True, description="Include result counts per degree (first page)"),
+    db: Session = Depends(get_read_db)
+):
+    return _check(SearchController.search(db, "students", q, limit, after, {"degree": degree}, facets))
+
+
+# -------------------------------------------------------------
+# PROFESSORS (nombre, correo y título)
+# -------------------------------------------------------------
+@router.get("/professors", response_model=SearchPage[ProfessorRead])
+def search_professors(
+    q: str = Query(..., min_length=1, max_length=200, description=Q_DESCRIPTION),
+    title: Optional[str] = Query(None, description="Only professors with this title"),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    facets: bool = Query(True, description="Include result counts per title (first page)"),
+    db: Session = Depends(get_read_db)
+):
+    return _check(SearchController.search(db, "professors", q, limit, after, {"title": title}, facets))
+
+
+# -------------------------------------------------------------
+# COURSES (código, nombre y descripción)
+# -------------------------------------------------------------
+@router.get("/courses", response_model=SearchPage[CourseRead])
+def search_courses(
+    q: str = Query(..., min_length=1, max_length=200, description=Q_DESCRIPTION),
+    professor_id: Optional[int] = Query(None, description="Only courses taught by this professor"),
+    has_seats: Optional[bool] = Query(None, description="Only courses with (true) or without (false) free seats"),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    facets: bool = Query(True, description="Include result counts per professor and seat availability (first page)"),
+    db: Session = Depends(get_read_db)
+):
+    filters = {"professor_id": professor_id, "has_seats": has_seats}
+    return _check(SearchController.search(db, "courses", q, limit, after, filters, facets))
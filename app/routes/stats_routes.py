@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from app.core.conditional import conditional_get, page_validators, set_validators, versions_validators, wants_revalidation
+from app.core.serialization import FastJSONRoute
+from app.database.config import settings
+from app.database.connection import get_read_db
+from app.schemas.pagination_schema import Page
+from app.schemas.stats_schema import CourseStatsRead, ProfessorStatsRead
+from app.controllers.stats_controller import StatsController
+
+
+router = APIRouter(
+    prefix="/stats",
+    tags=["Stats"],
+    # Respuestas JSON en una sola pasada (orjson, sin revalidar filas)
+    route_class=FastJSONRoute
+)
+
+# -------------------------------------------------------------
+# RESÚMENES PARA DASHBOARDS
+# -------------------------------------------------------------
+# Sirven los contadores precalculados (courses.seats_taken): cada
+# página cuesta O(cursos) y no recorre las inscripciones.
+# -------------------------------------------------------------
+
+
+# -------------------------------------------------------------
+# COURSE FILL RATES
+# -------------------------------------------------------------
+@router.get("/courses", response_model=Page[CourseStatsRead])
+def course_stats(
+    request: Request,
+    response: Response,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    db: Session = Depends(get_read_db)
+):
+    """Enrolled count, capacity and fill rate of each course."""
+
+    # Revalidación: el 304 sale de la consulta de versiones, sin cargar filas
+    if wants_revalidation(request):
+        window = StatsController.course_stats_versions(db, limit, after)
+        if window == "invalid_cursor":
+            raise HTTPException(400, "Invalid pagination cursor.")
+
+        not_modified = conditional_get(request, response, versions_validators("stats:courses", window))
+        if not_modified:
+            return not_modified
+
+    result = StatsController.course_stats(db, limit, after)
+
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    set_validators(response, *page_validators("stats:courses", result))
+    return result
+
+
+@router.get("/courses/{course_id}", response_model=CourseStatsRead)
+def course_stats_by_id(course_id: int, db: Session = Depends(get_read_db)):
+    """Enrolled count, capacity and fill rate of one course."""
+
+    result = StatsController.course_stats_by_id(db, course_id)
+
+    if not result:
+        raise HTTPException(404, "Course not found.")
+
+    return result
+
+
+# -------------------------------------------------------------
+# PROFESSOR LOAD
+# -------------------------------------------------------------
+@router.get("/professors", response_model=Page[ProfessorStatsRead])
+def professor_stats(
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    db: Session = Depends(get_read_db)
+):
+    """Course count and total students of each professor."""
+
+    result = StatsController.professor_stats(db, limit, after)
+
+    if result == "invalid_cursor":
+        raise HTTPException(400, "Invalid pagination cursor.")
+
+    return result
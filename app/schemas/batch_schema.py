@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+# ------------------------------------------------------------
+# BATCH (lectura por lista de ids, en el orden pedido)
+# ------------------------------------------------------------
+class Batch(BaseModel, Generic[T]):
+    items: List[Optional[T]] = Field(
+        ...,
+        description="One entry per requested id, in input order; null when the id does not exist"
+    )
+    missing: List[int] = Field(..., description="Requested ids that do not exist", examples=[[7]])
@@ -1,6 +1,8 @@
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field
-from typing import Optional
+from typing import List, Optional
+
+from app.database.config import settings
 
 # ------------------------------------------------------------
 # ENROLLMENT BASE
@@ -37,6 +39,7 @@ class EnrollmentCreate(EnrollmentBase):
 # ------------------------------------------------------------
 class EnrollmentRead(EnrollmentBase):
     id: int = Field(..., description="Unique enrollment identifier")
+    state: Optional[str] = Field(None, description="Stored enrollment state (e.g., inscrito)")
     created_at: datetime = Field(..., description="Record creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
@@ -49,8 +52,61 @@ class EnrollmentRead(EnrollmentBase):
                 "student_id": 5,
                 "inscription_date": "2025-01-10T10:00:00",
                 "status": "active",
+                "state": "inscrito",
                 "created_at": "2025-01-10T10:00:00",
                 "updated_at": "2025-01-10T10:00:00"
             }
         }
-    )
\ No newline at end of file
+    )
+
+
+# ------------------------------------------------------------
+# ENROLLMENT COUNT (conteo de inscripciones)
+# ------------------------------------------------------------
+class EnrollmentCount(BaseModel):
+    count: int = Field(..., description="Number of enrollments matching the filters")
+
+
+# ------------------------------------------------------------
+# ENROLLMENT BULK (inscripción masiva)
+# ------------------------------------------------------------
+class EnrollmentBulkItem(BaseModel):
+    course_id: int = Field(..., description="Course identifier")
+    student_id: int = Field(..., description="Student identifier")
+
+
+class EnrollmentBulkCreate(BaseModel):
+    items: List[EnrollmentBulkItem] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.MAX_BULK_ENROLLMENTS,
+        description="(course_id, student_id) pairs to enroll in a single transaction"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {"course_id": 1, "student_id": 5},
+                    {"course_id": 1, "student_id": 6},
+                    {"course_id": 2, "student_id": 5}
+                ]
+            }
+        }
+    )
+
+
+class EnrollmentBulkResult(BaseModel):
+    course_id: int = Field(..., description="Course identifier")
+    student_id: int = Field(..., description="Student identifier")
+    status: str = Field(
+        ...,
+        description="enrolled, course_not_found, student_not_found, already_enrolled, waitlist_pending or capacity_full"
+    )
+    enrollment_id: Optional[int] = Field(None, description="Identifier of the created enrollment")
+
+
+class EnrollmentBulkReport(BaseModel):
+    enrolled: int = Field(..., description="Number of enrollments created")
+    failed: int = Field(..., description="Number of rejected items")
+    results: List[EnrollmentBulkResult] = Field(..., description="Per-item result, in input order")
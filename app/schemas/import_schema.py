@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+
+# ------------------------------------------------------------
+# IMPORT ROW ERROR
+# ------------------------------------------------------------
+class ImportRowError(BaseModel):
+    row: int = Field(..., description="1-based data row number in the uploaded file (header excluded)")
+    error: str = Field(..., description="Validation or conflict message")
+
+
+# ------------------------------------------------------------
+# IMPORT REPORT
+# ------------------------------------------------------------
+class ImportReport(BaseModel):
+    processed: int = Field(..., description="Rows read from the file")
+    created: int = Field(..., description="New records inserted")
+    updated: int = Field(..., description="Existing records (same email) updated")
+    skipped: int = Field(..., description="Rows ignored because of an email conflict")
+    failed: int = Field(..., description="Rows rejected by validation")
+    errors: List[ImportRowError] = Field(..., description="Per-row error report")
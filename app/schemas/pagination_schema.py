@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+# ------------------------------------------------------------
+# PAGE (envelope genérico para paginación por cursor)
+# ------------------------------------------------------------
+class Page(BaseModel, Generic[T]):
+    items: List[T] = Field(..., description="Items in this page, ordered by id")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor for the next page. Null when there are no more items",
+        examples=["aWQ6NTA"]
+    )
+    limit: int = Field(..., description="Maximum number of items requested for this page")
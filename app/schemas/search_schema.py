@@ -0,0 +1,39 @@
+from pydantic import BaseModel, Field
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+# ------------------------------------------------------------
+# FACET (conteo de resultados por valor de un filtro)
+# ------------------------------------------------------------
+class FacetValue(BaseModel):
+    value: Optional[str] = Field(None, description="Filter value, as text (null for rows without a value)")
+    count: int = Field(..., description="Matching results with this value")
+
+
+class Facet(BaseModel):
+    field: str = Field(..., description="Filter parameter the values apply to", examples=["professor_id"])
+    values: List[FacetValue] = Field(..., description="Most frequent values first")
+
+
+# ------------------------------------------------------------
+# SEARCH PAGE (resultados por relevancia, paginados por cursor)
+# ------------------------------------------------------------
+class SearchPage(BaseModel, Generic[T]):
+    items: List[T] = Field(..., description="Results in this page, most relevant first")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor for the next page. Null when there are no more results",
+        examples=["cmFuazotMS4yNTo0Mg"]
+    )
+    limit: int = Field(..., description="Maximum number of results requested for this page")
+    facets: List[Facet] = Field(
+        default_factory=list,
+        description="Result counts per filter value over every match (first page only)"
+    )
+    facets_omitted: bool = Field(
+        False,
+        description="True when the query matches more than SEARCH_FACET_MAX_MATCHES rows and "
+                    "facets were not counted; results are still ranked over every match"
+    )
@@ -0,0 +1,52 @@
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+from typing import Optional
+
+
+class CourseStatsRead(BaseModel):
+    id: int = Field(..., description="Course identifier")
+    code: str = Field(..., description="Internal course code")
+    name: str = Field(..., description="Course name")
+    professor_id: Optional[int] = Field(None, description="Professor teaching the course")
+    enrolled: int = Field(..., description="Active enrollments (courses.seats_taken)")
+    capacity: Optional[int] = Field(None, description="Maximum capacity, null when unlimited")
+
+    @computed_field(description="enrolled / capacity in percent, null when the capacity is unlimited")
+    @property
+    def fill_rate(self) -> Optional[float]:
+        if not self.capacity:
+            return None
+        return round(self.enrolled * 100 / self.capacity, 1)
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": 10,
+                "code": "CS101",
+                "name": "Introduction to Programming",
+                "professor_id": 1,
+                "enrolled": 24,
+                "capacity": 30,
+                "fill_rate": 80.0
+            }
+        }
+    )
+
+
+class ProfessorStatsRead(BaseModel):
+    id: int = Field(..., description="Professor identifier")
+    name: str = Field(..., description="Professor name")
+    course_count: int = Field(..., description="Courses taught by the professor")
+    total_students: int = Field(..., description="Active enrollments across those courses")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": 1,
+                "name": "Ada Lovelace",
+                "course_count": 3,
+                "total_students": 72
+            }
+        }
+    )
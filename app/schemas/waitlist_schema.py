@@ -0,0 +1,42 @@
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
+
+
+# ------------------------------------------------------------
+# WAITLIST JOIN
+# ------------------------------------------------------------
+class WaitlistJoin(BaseModel):
+    student_id: int = Field(..., description="Student identifier")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {"student_id": 5}
+        }
+    )
+
+
+# ------------------------------------------------------------
+# WAITLIST STATUS
+# ------------------------------------------------------------
+class WaitlistStatus(BaseModel):
+    course_id: int = Field(..., description="Course identifier")
+    student_id: int = Field(..., description="Student identifier")
+    status: str = Field(..., description="waiting, or enrolled when a seat was free (or freed) right away")
+    position: Optional[int] = Field(None, description="1-based place in the course queue while waiting")
+    enrollment_id: Optional[int] = Field(None, description="Identifier of the enrollment once enrolled")
+    joined_at: Optional[datetime] = Field(None, description="When the student joined the queue")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "course_id": 1,
+                "student_id": 5,
+                "status": "waiting",
+                "position": 3,
+                "enrollment_id": None,
+                "joined_at": "2025-01-10T10:00:00"
+            }
+        }
+    )
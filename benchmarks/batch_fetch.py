@@ -0,0 +1,96 @@
+"""
+Benchmark de lectura por lista de ids (``?ids=``).
+
+Siembra una base con benchmarks.seed y compara, para --ids ids de
+cursos y de estudiantes, las dos formas de armar una página de
+tarjetas: un ``GET /{entidad}/{id}`` por id (N peticiones, N sesiones)
+contra un solo ``GET /{entidad}/?ids=...``. Reporta peticiones,
+consultas (Server-Timing) y la mediana de latencia de la página
+completa en --repeat repeticiones.
+
+La caché de entidades se desactiva (CACHE_BACKEND=none) para medir el
+camino hasta la base.
+
+Uso:
+    python -m benchmarks.batch_fetch --ids 50
+    USE_ASYNC_DB=true python -m benchmarks.batch_fetch --ids 200
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import statistics
+import tempfile
+import time
+
+
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare N detail requests with one ?ids= batch request.")
+    parser.add_argument("--ids", type=int, default=50, help="Ids per page of cards")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed pages per case")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    tmpdir = tempfile.mkdtemp(prefix="academic-batch-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmpdir, 'batch.db')}"
+    os.environ["CACHE_BACKEND"] = "none"
+    os.environ["SQL_TRACE"] = "true"
+
+    import httpx
+
+    from app.database.config import settings
+    from app.database.connection import engine
+    from app.main import app
+    from benchmarks.seed import prepare_schema, seed_database
+
+    prepare_schema(engine, reset=True)
+    seed_database(engine)
+
+    def queries(response):
+        match = _QUERIES.search(response.headers.get("server-timing", ""))
+        return int(match.group(1)) if match else 0
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for path in ("/courses/", "/students/"):
+                ids = [1 + (i * 7919) % 200 for i in range(args.ids)]
+
+                async def one_by_one():
+                    responses = await asyncio.gather(*(client.get(f"{path}{entity_id}") for entity_id in ids))
+                    return len(responses), sum(queries(response) for response in responses)
+
+                async def batch():
+                    response = await client.get(path, params={"ids": ",".join(map(str, ids))})
+                    response.raise_for_status()
+                    return 1, queries(response)
+
+                for label, fetch in (("one by one", one_by_one), ("?ids=", batch)):
+                    requests, statements = await fetch()
+                    samples = []
+                    for _ in range(args.repeat):
+                        started = time.perf_counter()
+                        await fetch()
+                        samples.append((time.perf_counter() - started) * 1000)
+                    print(
+                        f"{path:<11} {label:<11} ids={len(ids):<4} requests={requests:<4} "
+                        f"queries={statements:<4} p50={statistics.median(samples):7.1f} ms"
+                    )
+
+        if settings.USE_ASYNC_DB:
+            # Cierra las conexiones aiosqlite dentro del mismo event loop
+            from app.database.async_connection import async_engine
+
+            await async_engine.dispose()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
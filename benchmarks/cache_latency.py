@@ -0,0 +1,138 @@
+"""
+Benchmark de la caché de entidades (get_by_id).
+
+Golpea GET /students/{id}, /courses/{id} y /professors/{id} con una
+distribución sesgada (la mayoría de peticiones van a un conjunto
+"caliente" de ids, como ocurre con las páginas del portal) y compara la
+latencia p50/p99 con CACHE_BACKEND=none y con la caché en memoria.
+
+Cada backend corre en un subproceso porque la configuración se lee al
+importar la app.
+
+Uso:
+    python -m benchmarks.cache_latency --requests 5000
+    python -m benchmarks.cache_latency --backends none,memory,redis
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare get_by_id latency with and without the entity cache.")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per backend")
+    parser.add_argument("--rows", type=int, default=2000, help="Students to seed (courses/professors: rows / 10)")
+    parser.add_argument("--hot", type=float, default=0.9, help="Share of requests that go to the hot 5%% of ids")
+    parser.add_argument("--backends", default="none,memory", help="Comma separated CACHE_BACKEND values")
+    parser.add_argument("--database-url", default=None, help="Default: temp SQLite file")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def seed(rows):
+    from app.core import search  # noqa: F401 (crea las tablas FTS5 con create_all)
+    from app.database.connection import Base, SessionLocal, engine
+    from app.models.course_model import CourseModel
+    from app.models.enrollment_model import EnrollmentModel  # noqa: F401 (registro del modelo)
+    from app.models.professor_model import ProfessorModel
+    from app.models.student_model import StudentModel
+    from app.models.waitlist_model import WaitlistEntryModel  # noqa: F401 (registro del modelo)
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    with SessionLocal() as db:
+        small = max(1, rows // 10)
+        db.add_all([ProfessorModel(name=f"Professor {i}", email=f"professor{i}@university.com") for i in range(small)])
+        db.add_all([StudentModel(name=f"Student {i}", email=f"student{i}@university.com") for i in range(rows)])
+        db.flush()
+        db.add_all([
+            CourseModel(code=f"C{i}", name=f"Course {i}", professor_id=1 + i % small, maximum_capacity=40)
+            for i in range(small)
+        ])
+        db.commit()
+
+
+def request_paths(args):
+    """Deterministic skewed sequence of detail paths."""
+    rng = random.Random(42)
+    small = max(1, args.rows // 10)
+    sizes = {"students": args.rows, "courses": small, "professors": small}
+
+    paths = []
+    for i in range(args.requests):
+        entity = ("students", "students", "courses", "professors")[i % 4]
+        size = sizes[entity]
+        hot = max(1, size // 20)
+        entity_id = rng.randint(1, hot) if rng.random() < args.hot else rng.randint(1, size)
+        paths.append(f"/{entity}/{entity_id}")
+    return paths
+
+
+def worker(args):
+    """Runs the load against one backend and prints a JSON result line."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    latencies = []
+    with TestClient(app) as client:
+        for path in request_paths(args):
+            started = time.perf_counter()
+            response = client.get(path)
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+        stats = client.get("/internal/cache").json()
+
+    print(json.dumps({
+        "backend": args.worker,
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "hits": stats["hits"],
+        "misses": stats["misses"],
+        "evictions": stats["evictions"],
+    }))
+
+
+def main():
+    args = parse_args()
+
+    if args.worker is not None:
+        worker(args)
+        return
+
+    if args.database_url is None:
+        tmpdir = tempfile.mkdtemp(prefix="academic-cache-")
+        args.database_url = f"sqlite:///{os.path.join(tmpdir, 'cache.db')}"
+    os.environ["DATABASE_URL"] = args.database_url
+
+    seed(args.rows)
+
+    print(f"database: {args.database_url}  requests: {args.requests}  hot share: {args.hot}")
+    print(f"{'backend':<8} {'p50 ms':>8} {'p99 ms':>8} {'hits':>7} {'misses':>7} {'evict':>6}")
+    for backend in args.backends.split(","):
+        env = dict(os.environ, CACHE_BACKEND=backend)
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.cache_latency", "--worker", backend,
+             "--requests", str(args.requests), "--rows", str(args.rows), "--hot", str(args.hot)],
+            env=env, check=True, capture_output=True, text=True
+        ).stdout
+        r = json.loads(output.strip().splitlines()[-1])
+        print(f"{r['backend']:<8} {r['p50_ms']:>8} {r['p99_ms']:>8} {r['hits']:>7} {r['misses']:>7} {r['evictions']:>6}")
+
+
+if __name__ == "__main__":
+    main()
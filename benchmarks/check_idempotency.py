@@ -0,0 +1,208 @@
+"""
+Chequeo de las claves de idempotencia (cabecera Idempotency-Key).
+
+Comprueba que:
+
+1. Reintentar ``POST /students/`` con la misma clave devuelve la misma
+   respuesta (``Idempotent-Replayed: true``) sin ejecutar consultas
+   (Server-Timing con 0 queries) ni crear otra fila.
+2. Reintentar una inscripción ya hecha devuelve el 201 original, no
+   "already enrolled".
+3. Reutilizar la clave con otro cuerpo responde 422. X-Client-Id no
+   cambia el ámbito de las claves salvo que IDEMPOTENCY_CLIENT_HEADER
+   lo configure; un usuario autenticado tiene su propio ámbito.
+4. N duplicados concurrentes de una inscripción ejecutan una sola vez y
+   reciben todos la misma respuesta.
+5. Un 5xx no se guarda: el reintento vuelve a ejecutar la ruta.
+6. El almacén en memoria respeta el máximo de entradas y el TTL, nunca
+   desaloja una reserva en curso y, lleno de reservas, responde 503.
+
+Uso:
+    python -m benchmarks.check_idempotency
+    USE_ASYNC_DB=true python -m benchmarks.check_idempotency
+
+Sale con código 1 si alguna comprobación falla.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+
+DUPLICATES = 20
+
+
+def main():
+    tmpdir = tempfile.mkdtemp(prefix="academic-idempotency-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmpdir, 'idempotency.db')}"
+    os.environ["SQL_TRACE"] = "true"
+    os.environ["IDEMPOTENCY_ENABLED"] = "true"
+    os.environ["IDEMPOTENCY_BACKEND"] = "memory"
+
+    import httpx
+
+    from starlette.authentication import SimpleUser
+
+    from app.core.idempotency import (
+        ACQUIRED, FULL, IN_FLIGHT, STORED, IdempotencyMiddleware, MemoryIdempotencyStore, _client_id, idempotency_store
+    )
+    from app.database.config import settings
+    from app.database.connection import Base, SessionLocal, engine
+    from app.main import app
+    from app.models.course_model import CourseModel
+    from app.models.enrollment_model import EnrollmentModel
+    from app.models.professor_model import ProfessorModel  # noqa: F401 (registro de relaciones)
+    from app.models.student_model import StudentModel
+    from app.models.waitlist_model import WaitlistEntryModel  # noqa: F401
+
+    Base.metadata.create_all(engine)
+    with SessionLocal() as db:
+        db.add(CourseModel(code="C1", name="Course 1", maximum_capacity=50))
+        db.add_all([StudentModel(name=f"Student {i}", email=f"student{i}@university.com") for i in range(3)])
+        db.commit()
+
+    # Ruta que falla una vez: el 500 no debe quedar guardado
+    calls = {"flaky": 0}
+
+    @app.post("/_idempotency/flaky")
+    def flaky():
+        calls["flaky"] += 1
+        if calls["flaky"] == 1:
+            raise RuntimeError("transient failure")
+        return {"calls": calls["flaky"]}
+
+    failures = []
+
+    def check(label, ok):
+        print(f"{'OK  ' if ok else 'FAIL'} {label}")
+        if not ok:
+            failures.append(label)
+
+    def count(model, *criteria):
+        with SessionLocal() as db:
+            return db.query(model).filter(*criteria).count()
+
+    def enrollment(student_id):
+        return {"course_id": 1, "student_id": student_id, "inscription_date": "2025-01-10T10:00:00"}
+
+    async def run():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            # 1. Crear estudiante dos veces con la misma clave
+            student = {"name": "Ana", "email": "ana@university.com"}
+            headers = {"Idempotency-Key": "create-ana"}
+            first = await client.post("/students/", json=student, headers=headers)
+            retry = await client.post("/students/", json=student, headers=headers)
+            check(f"create: first {first.status_code}, retry {retry.status_code} with the same body",
+                  first.status_code == retry.status_code == 201 and first.content == retry.content)
+            check(f"retry replayed without queries: {retry.headers.get('server-timing')!r}",
+                  retry.headers.get("idempotent-replayed") == "true"
+                  and 'desc="0 queries"' in retry.headers.get("server-timing", ""))
+            check("one student row", count(StudentModel, StudentModel.email == student["email"]) == 1)
+
+            # Sin cabecera, el comportamiento no cambia
+            plain = await client.post("/students/", json=student)
+            check(f"without Idempotency-Key the duplicate is rejected ({plain.status_code})", plain.status_code == 400)
+
+            # 2. Inscripción reintentada tras el éxito
+            headers = {"Idempotency-Key": "enroll-1"}
+            first = await client.post("/enrollments/course/1", json=enrollment(1), headers=headers)
+            retry = await client.post("/enrollments/course/1", json=enrollment(1), headers=headers)
+            check(f"enroll retry returns the original {first.status_code}, not 'already enrolled' ({retry.status_code})",
+                  first.status_code == retry.status_code == 201 and first.content == retry.content)
+
+            # 3. Misma clave, otra petición / otro cliente
+            other = await client.post("/enrollments/course/1", json=enrollment(2), headers=headers)
+            check(f"same key, different body -> {other.status_code}", other.status_code == 422)
+            spoofed = await client.post(
+                "/enrollments/course/1", json=enrollment(2), headers={**headers, "X-Client-Id": "device-b"}
+            )
+            check(f"X-Client-Id is ignored unless configured ({spoofed.status_code})", spoofed.status_code == 422)
+
+            settings.IDEMPOTENCY_CLIENT_HEADER = "X-Client-Id"
+            try:
+                other_client = await client.post(
+                    "/enrollments/course/1", json=enrollment(2), headers={**headers, "X-Client-Id": "device-b"}
+                )
+            finally:
+                settings.IDEMPOTENCY_CLIENT_HEADER = ""
+            check(f"configured client header: same key, other client executes ({other_client.status_code})",
+                  other_client.status_code == 201)
+
+            # 4. Duplicados concurrentes
+            executed = idempotency_store.stats()["executed"]
+            headers = {"Idempotency-Key": "enroll-3-burst"}
+            responses = await asyncio.gather(*[
+                client.post("/enrollments/course/1", json=enrollment(3), headers=headers) for _ in range(DUPLICATES)
+            ])
+            statuses = sorted({r.status_code for r in responses})
+            check(f"{DUPLICATES} concurrent duplicates: statuses {statuses}, one distinct body",
+                  statuses == [201] and len({r.content for r in responses}) == 1)
+            check("executed once, one enrollment row",
+                  idempotency_store.stats()["executed"] - executed == 1
+                  and count(EnrollmentModel, EnrollmentModel.student_id == 3) == 1)
+
+            # 5. Un 5xx libera la clave
+            headers = {"Idempotency-Key": "flaky"}
+            failed = await client.post("/_idempotency/flaky", headers=headers)
+            retried = await client.post("/_idempotency/flaky", headers=headers)
+            check(f"5xx is not stored: {failed.status_code} then {retried.status_code} {retried.json()}",
+                  failed.status_code == 500 and retried.status_code == 200 and calls["flaky"] == 2)
+
+        if settings.USE_ASYNC_DB:
+            # Cierra las conexiones aiosqlite dentro del mismo event loop
+            from app.database.async_connection import async_engine
+            await async_engine.dispose()
+
+    asyncio.run(run())
+
+    # Ámbito: usuario autenticado > cabecera configurada > IP
+    scope = {"client": ("10.0.0.1", 5000), "headers": [(b"x-client-id", b"device-b")]}
+    check(f"unauthenticated scope uses the IP ({_client_id(scope)})", _client_id(scope) == "ip:10.0.0.1")
+    authenticated = _client_id({**scope, "user": SimpleUser("ana")})
+    check(f"authenticated scope uses the user ({authenticated})", authenticated == "user:ana")
+
+    # 6. Almacén acotado
+    store = MemoryIdempotencyStore(max_entries=3, ttl_seconds=0.05, lock_seconds=1)
+    record = {"fingerprint": "f", "status": 201, "headers": [], "body": b"{}"}
+    for i in range(5):
+        store.reserve(f"k{i}", "f")
+        store.save(f"k{i}", record)
+    check(f"max_entries=3 keeps 3 entries ({store.stats()['entries']}, {store.stats()['evictions']} evicted)",
+          store.stats()["entries"] == 3 and store.reserve("k0", "f")[0] == ACQUIRED)
+    fresh = store.reserve("k4", "f")[0]
+    time.sleep(0.1)
+    check(f"TTL: stored before expiry ({fresh}), reusable after", fresh == STORED and store.reserve("k4", "f")[0] == ACQUIRED)
+
+    # Reservas en curso: nunca se desalojan
+    store = MemoryIdempotencyStore(max_entries=2, ttl_seconds=60, lock_seconds=60)
+    store.reserve("done", "f")
+    store.save("done", record)
+    outcomes = [store.reserve(key, "f")[0] for key in ("a", "b", "c")]
+    check(f"full of reservations: {outcomes}", outcomes == [ACQUIRED, ACQUIRED, FULL])
+    check("in-flight reservations survive", store.reserve("a", "f")[0] == IN_FLIGHT and store.reserve("b", "f")[0] == IN_FLIGHT)
+
+    async def full_store():
+        app_calls = []
+
+        async def endpoint(scope, receive, send):
+            app_calls.append(scope["path"])
+
+        middleware = IdempotencyMiddleware(endpoint, store)
+        transport = httpx.ASGITransport(app=middleware)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/students/", json={}, headers={"Idempotency-Key": "d"})
+        return response, app_calls
+
+    response, app_calls = asyncio.run(full_store())
+    check(f"new key with a full store -> {response.status_code} without running the route",
+          response.status_code == 503 and not app_calls and store.stats()["rejected"] == 1)
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Chequeo de las trazas SQL por petición (SQL_TRACE).
+
+Con SQL_TRACE=true comprueba que:
+
+1. Cada respuesta trae ``Server-Timing: db;dur=...;desc="N queries"``.
+2. El roster de un curso (selectinload) no dispara el aviso de N+1.
+3. Una ruta de prueba que recorre las inscripciones y lee ``e.student``
+   de forma perezosa (una consulta por fila) sí lo dispara.
+4. Con SQL_SLOW_QUERY_MS=0 cada sentencia se registra como lenta, con
+   sus parámetros.
+
+Y en un subproceso con SQL_TRACE=false, que no hay cabecera ni
+listeners registrados.
+
+Uso:
+    python -m benchmarks.check_sql_tracing
+    USE_ASYNC_DB=true python -m benchmarks.check_sql_tracing
+
+Sale con código 1 si alguna comprobación falla.
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+
+
+DISABLED_CHECK = """
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.database.tracing import _before_cursor_execute
+from app.main import app
+response = TestClient(app).get("/")
+print("server-timing" in response.headers, event.contains(Engine, "before_cursor_execute", _before_cursor_execute))
+"""
+
+
+class _Records(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def main():
+    tmpdir = tempfile.mkdtemp(prefix="academic-tracing-")
+    database_url = f"sqlite:///{os.path.join(tmpdir, 'tracing.db')}"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["SQL_TRACE"] = "true"
+    os.environ["SQL_SLOW_QUERY_MS"] = "10000"
+    os.environ["CACHE_BACKEND"] = "none"
+
+    from fastapi.testclient import TestClient
+
+    from app.database.config import settings
+    from app.database.connection import Base, SessionLocal, engine
+    from app.main import app
+    from app.models.course_model import CourseModel
+    from app.models.enrollment_model import EnrollmentModel
+    from app.models.professor_model import ProfessorModel
+    from app.models.student_model import StudentModel
+    from app.models.waitlist_model import WaitlistEntryModel  # noqa: F401 (registro del modelo)
+
+    Base.metadata.create_all(engine)
+    students = settings.SQL_N_PLUS_ONE_THRESHOLD * 2
+    with SessionLocal() as db:
+        db.add(ProfessorModel(name="Professor 1", email="professor1@university.com"))
+        db.add_all([StudentModel(name=f"Student {i}", email=f"student{i}@university.com") for i in range(students)])
+        db.flush()
+        db.add(CourseModel(code="C1", name="Course 1", professor_id=1, seats_taken=students))
+        db.flush()
+        db.add_all([EnrollmentModel(course_id=1, student_id=i + 1) for i in range(students)])
+        db.commit()
+
+    # El N+1 clásico: una carga perezosa de e.student por inscripción
+    @app.get("/_trace/lazy-roster")
+    def lazy_roster():
+        with SessionLocal() as db:
+            enrollments = db.query(EnrollmentModel).filter(EnrollmentModel.course_id == 1).all()
+            return [e.student.name for e in enrollments]
+
+    records = _Records()
+    logging.getLogger("app.sql").addHandler(records)
+
+    failures = []
+
+    def check(label, ok):
+        print(f"{'OK  ' if ok else 'FAIL'} {label}")
+        if not ok:
+            failures.append(label)
+
+    client = TestClient(app)
+
+    response = client.get("/enrollments/course/1/students")
+    timing = response.headers.get("server-timing", "")
+    check(f"Server-Timing on the roster: {timing!r}", timing.startswith("db;dur=") and "queries" in timing)
+    check("roster (selectinload) is not flagged as N+1", not any("N+1" in m for m in records.messages))
+
+    response = client.get("/_trace/lazy-roster")
+    flagged = [m for m in records.messages if "N+1" in m and "/_trace/lazy-roster" in m]
+    check(f"lazy e.student loop flagged: {flagged[0][:90] if flagged else None!r}", len(flagged) == 1)
+    # 1 SELECT de inscripciones + 1 por estudiante (el BEGIN no cuenta)
+    check(f"lazy loop Server-Timing counts every query: {response.headers.get('server-timing')!r}",
+          f'desc="{students + 1} queries"' in response.headers.get("server-timing", ""))
+
+    records.messages.clear()
+    settings.SQL_SLOW_QUERY_MS = 0
+    client.get("/students/3")
+    slow = [m for m in records.messages if m.startswith("slow query") and "SELECT" in m]
+    check(f"slow query logged with parameters: {slow[0][-40:] if slow else None!r}", bool(slow) and "params=(3," in slow[0])
+
+    env = dict(os.environ, SQL_TRACE="false", DATABASE_URL=database_url)
+    output = subprocess.run(
+        [sys.executable, "-c", DISABLED_CHECK], env=env, capture_output=True, text=True, check=True
+    ).stdout.split()
+    check(f"SQL_TRACE=false: no header, no listeners ({output})", output == ["False", "False"])
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
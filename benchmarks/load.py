@@ -0,0 +1,632 @@
+"""
+Benchmark de carga reproducible de toda la API.
+
+1. Siembra una base nueva con benchmarks.seed (mismos tamaños y semilla
+   -> mismos datos), o usa una existente con --no-seed.
+2. Recorre todas las rutas de la app (una clave "MÉTODO /ruta" por
+   APIRoute) con --requests-per-route peticiones cada una y
+   --concurrency peticiones en vuelo. Las rutas se miden una a una:
+   primero las lecturas sobre los datos sembrados, luego las escrituras
+   y al final los DELETE. Las filas que un DELETE o una inscripción
+   necesitan se crean antes de medir, por la misma API.
+3. Reporta por ruta throughput, p50/p95/p99/máx en ms y el máximo de
+   consultas por petición, leído de la cabecera Server-Timing
+   (SQL_TRACE=true, ver app.database.tracing), contra BUDGETS.
+
+Objetivos:
+- ``--target inprocess`` (por defecto): httpx.AsyncClient sobre
+  ASGITransport, sin red; el cliente comparte CPU con la app.
+- ``--target uvicorn``: levanta ``uvicorn app.main:app`` en --port y le
+  pega por HTTP local.
+
+El resultado (--output) es un JSON comparable entre commits; con
+--baseline otro JSON anterior se imprime la variación del p95 y de las
+consultas por ruta.
+
+Uso:
+    python -m benchmarks.load --output results.json
+    python -m benchmarks.load --students 50000 --courses 1000 --concurrency 16 --target uvicorn
+    USE_ASYNC_DB=true python -m benchmarks.load --baseline results.json
+
+Sale con código 1 si una ruta queda sin escenario, alguna petición
+falla o alguna ruta supera su presupuesto de consultas.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+from benchmarks.seed import DEFAULT_SIZES
+
+
+# Las exportaciones recorren tablas enteras: menos peticiones
+HEAVY_SHARE = 20
+BULK_BATCH = 10
+IMPORT_ROWS = 50
+BATCH_IDS = 24
+
+# Máximo de consultas por petición (sin BEGIN/COMMIT). None: no se
+# controla; las exportaciones hacen streaming y Server-Timing sale con
+# la primera línea, antes de las consultas por lotes.
+BUDGETS = {
+    "GET /": 0,
+    "GET /professors/": 1,
+    # Detalle: 1 consulta; con expand, una más por colección
+    "GET /professors/{professor_id}": 2,
+    "POST /professors/": 2,
+    "PUT /professors/{professor_id}": 2,
+    "DELETE /professors/{professor_id}": 4,
+    "GET /students/": 1,
+    "GET /students/{student_id}": 3,
+    "POST /students/": 2,
+    "PUT /students/{student_id}": 2,
+    "DELETE /students/{student_id}": 6,
+    "GET /courses/": 1,
+    "GET /courses/{course_id}": 3,
+    "POST /courses/": 2,
+    "PUT /courses/{course_id}": 2,
+    "DELETE /courses/{course_id}": 5,
+    "POST /enrollments/course/{course_id}": 7,
+    # 3 lecturas + UPDATE del cupo + un INSERT por elemento del lote + la
+    # limpieza de listas de espera
+    "POST /enrollments/bulk": 5 + BULK_BATCH,
+    # Baja en un curso lleno con cola: incluye la promoción de la cabeza
+    "DELETE /enrollments/course/{course_id}/student/{student_id}": 7,
+    "POST /enrollments/course/{course_id}/waitlist": 8,
+    "GET /enrollments/course/{course_id}/waitlist/{student_id}": 2,
+    "DELETE /enrollments/course/{course_id}/waitlist/{student_id}": 1,
+    "GET /enrollments/course/{course_id}/students": 2,
+    "GET /enrollments/student/{student_id}/courses": 2,
+    "GET /enrollments/": 1,
+    "GET /stats/courses": 1,
+    "GET /stats/courses/{course_id}": 1,
+    "GET /stats/professors": 1,
+    "GET /export/students": None,
+    "GET /export/professors": None,
+    "GET /export/courses": None,
+    "GET /export/enrollments": None,
+    "GET /export/courses/{course_id}/roster": None,
+    "POST /import/students": 3,
+    "POST /import/professors": 3,
+    # Corte de la ventana + resultados + una consulta por faceta
+    "GET /search/students": 3,
+    "GET /search/professors": 3,
+    "GET /search/courses": 4,
+    "GET /internal/cache": 0,
+    "GET /internal/idempotency": 0,
+    "GET /internal/pool": 0,
+    "POST /internal/pool/reset": 0,
+}
+
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load-test every API route and report latency and query budgets.")
+    parser.add_argument("--target", choices=("inprocess", "uvicorn"), default="inprocess")
+    parser.add_argument("--port", type=int, default=8765, help="uvicorn target port")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight per route")
+    parser.add_argument("--requests-per-route", type=int, default=200)
+    parser.add_argument("--database-url", default=None, help="Default: temp SQLite file")
+    parser.add_argument("--no-seed", action="store_true", help="Use the existing data in --database-url")
+    parser.add_argument("--professors", type=int, default=DEFAULT_SIZES["professors"])
+    parser.add_argument("--students", type=int, default=DEFAULT_SIZES["students"])
+    parser.add_argument("--courses", type=int, default=DEFAULT_SIZES["courses"])
+    parser.add_argument("--enrollments-per-student", type=float, default=DEFAULT_SIZES["enrollments_per_student"])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--routes", default=None, help="Only routes whose key contains this text")
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    parser.add_argument("--baseline", default=None, help="Previous JSON report to compare against")
+    return parser.parse_args()
+
+
+# ----------------------------------------------------------------------
+# Escenarios: por ruta, una función async (client, n, ctx) -> lista de
+# peticiones {"method", "url", ...kwargs de httpx}. Lo que hacen antes
+# de devolver (crear filas para borrarlas, etc.) no se mide.
+# ----------------------------------------------------------------------
+
+def _get(url, **params):
+    return {"method": "GET", "url": url, "params": params or None}
+
+
+def _professor(tag, i):
+    return {"name": f"Load Professor {i}", "email": f"load-{tag}-p{i}@university.com", "title": "PhD", "contratation_date": "2020-02-03"}
+
+
+def _student(tag, i):
+    return {"name": f"Load Student {i}", "email": f"load-{tag}-s{i}@university.com", "birthdate": "2003-05-17", "degree": "Mathematics"}
+
+
+def _course(tag, i, capacity=None):
+    return {"code": f"L-{tag}-{i}", "name": f"Load Course {i}", "description": "Load test course", "professor_id": 1, "maximum_capacity": capacity}
+
+
+async def _create(client, path, payloads):
+    ids = []
+    for payload in payloads:
+        response = await client.post(path, json=payload)
+        response.raise_for_status()
+        ids.append(response.json()["id"])
+    return ids
+
+
+def _csv(header, rows):
+    return "\n".join([",".join(header), *(",".join(row) for row in rows)]) + "\n"
+
+
+def _spread(n, size):
+    """n ids in 1..size, spread evenly (deterministic)."""
+    return [1 + (i * 7919) % size for i in range(n)]
+
+
+def build_scenarios():
+    def reads(path, param):
+        async def build(client, n, ctx):
+            return [_get(path.format(id=entity_id)) for entity_id in _spread(n, ctx[param])]
+        return build
+
+    # Detalles alternados con el recurso compuesto (?expand=)
+    def details(path, param, expand):
+        async def build(client, n, ctx):
+            return [
+                _get(path.format(id=entity_id), **({"expand": expand} if i % 2 else {}))
+                for i, entity_id in enumerate(_spread(n, ctx[param]))
+            ]
+        return build
+
+    def page(path, method="GET", **params):
+        async def build(client, n, ctx):
+            return [{"method": method, "url": path, "params": params or None} for _ in range(n)]
+        return build
+
+    # Páginas alternadas con lotes de BATCH_IDS ids (más uno inexistente)
+    def listing(path, param):
+        async def build(client, n, ctx):
+            ids = _spread(n * BATCH_IDS, ctx[param])
+            batch = lambda i: ",".join(map(str, [*ids[i * BATCH_IDS:(i + 1) * BATCH_IDS], ctx[param] + 1]))
+            return [_get(path, limit=50) if i % 2 == 0 else _get(path, ids=batch(i)) for i in range(n)]
+        return build
+
+    def heavy(path):
+        async def build(client, n, ctx):
+            return [_get(path) for _ in range(max(1, n // HEAVY_SHARE))]
+        return build
+
+    async def post_professors(client, n, ctx):
+        return [{"method": "POST", "url": "/professors/", "json": _professor(ctx["tag"], i)} for i in range(n)]
+
+    async def post_students(client, n, ctx):
+        return [{"method": "POST", "url": "/students/", "json": _student(ctx["tag"], i)} for i in range(n)]
+
+    async def post_courses(client, n, ctx):
+        return [{"method": "POST", "url": "/courses/", "json": _course(ctx["tag"], i, 40)} for i in range(n)]
+
+    # PUT con el mismo correo sembrado: no choca con el índice UNIQUE
+    async def put_professors(client, n, ctx):
+        return [
+            {"method": "PUT", "url": f"/professors/{i}", "json": {**_professor(ctx["tag"], i), "email": f"professor{i}@university.com"}}
+            for i in _spread(n, ctx["professors"])
+        ]
+
+    async def put_students(client, n, ctx):
+        return [
+            {"method": "PUT", "url": f"/students/{i}", "json": {**_student(ctx["tag"], i), "email": f"student{i}@university.com"}}
+            for i in _spread(n, ctx["students"])
+        ]
+
+    async def put_courses(client, n, ctx):
+        return [
+            {"method": "PUT", "url": f"/courses/{i}", "json": {**_course(ctx["tag"], i), "code": f"C{i:06d}"}}
+            for i in _spread(n, ctx["courses"])
+        ]
+
+    def deletes(path, factory):
+        async def build(client, n, ctx):
+            ids = await _create(client, path, [factory(f"{ctx['tag']}-del", i) for i in range(n)])
+            return [{"method": "DELETE", "url": f"{path}{entity_id}"} for entity_id in ids]
+        return build
+
+    async def enroll(client, n, ctx):
+        course_id, = await _create(client, "/courses/", [_course(f"{ctx['tag']}-enroll", 0)])
+        return [
+            {"method": "POST", "url": f"/enrollments/course/{course_id}", "json": {"course_id": course_id, "student_id": student_id}}
+            for student_id in range(1, min(n, ctx["students"]) + 1)
+        ]
+
+    async def bulk(client, n, ctx):
+        per_course = max(1, ctx["students"] // BULK_BATCH)
+        courses = await _create(client, "/courses/", [
+            _course(f"{ctx['tag']}-bulk", i) for i in range(math.ceil(n / per_course))
+        ])
+        requests = []
+        for i in range(n):
+            course_id = courses[i // per_course]
+            first = (i % per_course) * BULK_BATCH + 1
+            items = [{"course_id": course_id, "student_id": s} for s in range(first, first + BULK_BATCH)]
+            requests.append({"method": "POST", "url": "/enrollments/bulk", "json": {"items": items}})
+        return requests
+
+    async def _waitlisted(client, label, students, capacity, ctx):
+        """Course with `capacity` seats; `students` join its waitlist in order."""
+        course_id, = await _create(client, "/courses/", [_course(f"{ctx['tag']}-{label}", 0, capacity)])
+        for student_id in students:
+            (await client.post(f"/enrollments/course/{course_id}/waitlist", json={"student_id": student_id})).raise_for_status()
+        return course_id
+
+    # Curso lleno con cola: cada baja promueve a la cabeza
+    async def unenroll(client, n, ctx):
+        n = min(n, ctx["students"] // 2)
+        course_id = await _waitlisted(client, "unenroll", range(1, 2 * n + 1), n, ctx)
+        return [{"method": "DELETE", "url": f"/enrollments/course/{course_id}/student/{s}"} for s in range(1, n + 1)]
+
+    async def join_waitlist(client, n, ctx):
+        course_id, = await _create(client, "/courses/", [_course(f"{ctx['tag']}-join", 0, 1)])
+        return [
+            {"method": "POST", "url": f"/enrollments/course/{course_id}/waitlist", "json": {"student_id": s}}
+            for s in range(1, min(n, ctx["students"]) + 1)
+        ]
+
+    async def waitlist_status(client, n, ctx):
+        students = range(1, min(n, ctx["students"]) + 1)
+        course_id = await _waitlisted(client, "status", students, 0, ctx)
+        return [_get(f"/enrollments/course/{course_id}/waitlist/{s}") for s in students]
+
+    async def leave_waitlist(client, n, ctx):
+        students = range(1, min(n, ctx["students"]) + 1)
+        course_id = await _waitlisted(client, "leave", students, 0, ctx)
+        return [{"method": "DELETE", "url": f"/enrollments/course/{course_id}/waitlist/{s}"} for s in students]
+
+    async def enrollments(client, n, ctx):
+        variants = [
+            {"course_id": ctx["busiest_course"]},
+            {"student_id": 1},
+            {"state": "inscrito", "limit": 50},
+            {"course_id": ctx["busiest_course"], "count_only": "true"},
+        ]
+        return [_get("/enrollments/", **variants[i % len(variants)]) for i in range(n)]
+
+    # Consultas amplias (truncadas), combinadas y selectivas, con y sin filtro
+    def search(path, queries):
+        async def build(client, n, ctx):
+            return [_get(path, **queries[i % len(queries)]) for i in range(n)]
+        return build
+
+    def imports(path, header, row):
+        async def build(client, n, ctx):
+            # Las mismas filas en cada petición: la primera inserta, las demás actualizan
+            body = _csv(header, [row(ctx["tag"], i) for i in range(IMPORT_ROWS)])
+            return [
+                {"method": "POST", "url": path, "params": {"on_conflict": "update"}, "files": {"file": ("rows.csv", body, "text/csv")}}
+                for _ in range(n)
+            ]
+        return build
+
+    return {
+        "GET /": page("/"),
+        "GET /professors/": listing("/professors/", "professors"),
+        "GET /professors/{professor_id}": details("/professors/{id}", "professors", "courses"),
+        "GET /students/": listing("/students/", "students"),
+        "GET /students/{student_id}": details("/students/{id}", "students", "courses,enrollments"),
+        "GET /courses/": listing("/courses/", "courses"),
+        "GET /courses/{course_id}": details("/courses/{id}", "courses", "professor,students,enrollments"),
+        "GET /enrollments/course/{course_id}/students": reads("/enrollments/course/{id}/students", "courses"),
+        "GET /enrollments/student/{student_id}/courses": reads("/enrollments/student/{id}/courses", "students"),
+        "GET /enrollments/": enrollments,
+        "GET /enrollments/course/{course_id}/waitlist/{student_id}": waitlist_status,
+        "GET /stats/courses": page("/stats/courses", limit=50),
+        "GET /stats/courses/{course_id}": reads("/stats/courses/{id}", "courses"),
+        "GET /stats/professors": page("/stats/professors", limit=50),
+        "GET /export/students": heavy("/export/students"),
+        "GET /export/professors": heavy("/export/professors"),
+        "GET /export/courses": heavy("/export/courses"),
+        "GET /export/enrollments": heavy("/export/enrollments"),
+        "GET /export/courses/{course_id}/roster": reads("/export/courses/{id}/roster", "courses"),
+        "GET /search/students": search("/search/students", [
+            {"q": "ana"}, {"q": "garcia valentina"}, {"q": "student42"}, {"q": "per", "degree": "Physics"},
+        ]),
+        "GET /search/professors": search("/search/professors", [
+            {"q": "lopez"}, {"q": "phd carlos"}, {"q": "professor1"}, {"q": "ma", "title": "MSc"},
+        ]),
+        "GET /search/courses": search("/search/courses", [
+            {"q": "algorithms"}, {"q": "data"}, {"q": "c000042"}, {"q": "calculus", "has_seats": "true"},
+        ]),
+        "GET /internal/cache": page("/internal/cache"),
+        "GET /internal/idempotency": page("/internal/idempotency"),
+        "GET /internal/pool": page("/internal/pool"),
+        "POST /professors/": post_professors,
+        "PUT /professors/{professor_id}": put_professors,
+        "POST /students/": post_students,
+        "PUT /students/{student_id}": put_students,
+        "POST /courses/": post_courses,
+        "PUT /courses/{course_id}": put_courses,
+        "POST /enrollments/course/{course_id}": enroll,
+        "POST /enrollments/bulk": bulk,
+        "POST /enrollments/course/{course_id}/waitlist": join_waitlist,
+        "POST /import/students": imports(
+            "/import/students", ("name", "email", "birthdate", "degree"),
+            lambda tag, i: (f"Imported {i}", f"import-{tag}-s{i}@university.com", "2002-01-15", "Physics"),
+        ),
+        "POST /import/professors": imports(
+            "/import/professors", ("name", "email", "title", "contratation_date"),
+            lambda tag, i: (f"Imported {i}", f"import-{tag}-p{i}@university.com", "MSc", "2019-08-01"),
+        ),
+        "POST /internal/pool/reset": page("/internal/pool/reset", method="POST"),
+        "DELETE /enrollments/course/{course_id}/student/{student_id}": unenroll,
+        "DELETE /enrollments/course/{course_id}/waitlist/{student_id}": leave_waitlist,
+        "DELETE /courses/{course_id}": deletes("/courses/", _course),
+        "DELETE /students/{student_id}": deletes("/students/", _student),
+        "DELETE /professors/{professor_id}": deletes("/professors/", _professor),
+    }
+
+
+def route_keys(app):
+    """"METHOD /path" of every APIRoute of the app."""
+    from fastapi.routing import APIRoute
+
+    return sorted(
+        f"{method} {route.path}"
+        for route in app.routes if isinstance(route, APIRoute)
+        for method in route.methods if method != "HEAD"
+    )
+
+
+# ----------------------------------------------------------------------
+# Ejecución y medición
+# ----------------------------------------------------------------------
+
+def percentile(samples, p):
+    """Nearest-rank percentile of sorted `samples`."""
+    if not samples:
+        return None
+    return samples[min(len(samples) - 1, max(0, math.ceil(p / 100 * len(samples)) - 1))]
+
+
+async def run_route(client, requests, concurrency):
+    latencies, queries, errors = [], [], []
+    pending = iter(requests)
+
+    async def worker():
+        for spec in pending:
+            spec = dict(spec)
+            if spec.get("params") is None:
+                spec.pop("params", None)
+            started = time.perf_counter()
+            response = await client.request(**spec)
+            await response.aread()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+            if response.status_code >= 400:
+                errors.append(f"{response.status_code} {spec['url']}: {response.text[:120]}")
+            match = _QUERIES.search(response.headers.get("server-timing", ""))
+            if match:
+                queries.append(int(match.group(1)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "error_samples": errors[:3],
+        "rps": round(len(latencies) / wall, 1) if wall else None,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2),
+        "queries_max": max(queries) if queries else None,
+    }
+
+
+class UvicornServer:
+    """`uvicorn app.main:app` in a child process with the same environment."""
+
+    def __init__(self, port):
+        self.port = port
+        self.process = None
+
+    async def __aenter__(self):
+        import httpx
+
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(self.port), "--log-level", "warning"],
+            env=dict(os.environ),
+        )
+        async with httpx.AsyncClient() as probe:
+            for _ in range(150):
+                try:
+                    if (await probe.get(f"http://127.0.0.1:{self.port}/")).status_code == 200:
+                        return f"http://127.0.0.1:{self.port}"
+                except httpx.TransportError:
+                    pass
+                if self.process.poll() is not None:
+                    break
+                await asyncio.sleep(0.2)
+        self.process.terminate()
+        raise RuntimeError(f"uvicorn did not start on port {self.port}")
+
+    async def __aexit__(self, *exc):
+        self.process.terminate()
+        self.process.wait(timeout=10)
+        return False
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report, baseline):
+    """Prints the p95 and query deltas of `report` against `baseline`."""
+    print(f"\nvs baseline {baseline['meta'].get('git_commit')} ({baseline['meta'].get('timestamp')})")
+    for key, current in report["routes"].items():
+        previous = baseline["routes"].get(key)
+        if not previous or not previous.get("p95_ms"):
+            print(f"  {key:<60} (new)")
+            continue
+        delta = (current["p95_ms"] - previous["p95_ms"]) / previous["p95_ms"] * 100
+        queries = ""
+        if current["queries_max"] != previous.get("queries_max"):
+            queries = f"  queries {previous.get('queries_max')} -> {current['queries_max']}"
+        print(f"  {key:<60} p95 {previous['p95_ms']:>8.2f} -> {current['p95_ms']:>8.2f} ms ({delta:+6.1f}%){queries}")
+
+
+async def run(args, app, context):
+    import httpx
+
+    from app.database.config import settings
+
+    scenarios = build_scenarios()
+    keys = route_keys(app)
+    uncovered = [key for key in keys if key not in scenarios]
+    selected = [key for key in scenarios if key in keys and (not args.routes or args.routes in key)]
+
+    if args.target == "uvicorn":
+        server = UvicornServer(args.port)
+        base_url = await server.__aenter__()
+        transport = None
+    else:
+        server = None
+        base_url = "http://bench"
+        transport = httpx.ASGITransport(app=app)
+
+    routes = {}
+    try:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(transport=transport, base_url=base_url, limits=limits, timeout=120) as client:
+            for key in selected:
+                requests = await scenarios[key](client, args.requests_per_route, context)
+                result = await run_route(client, requests, args.concurrency)
+                budget = BUDGETS.get(key)
+                result["query_budget"] = budget
+                result["within_budget"] = (
+                    None if budget is None or result["queries_max"] is None else result["queries_max"] <= budget
+                )
+                routes[key] = result
+                print(
+                    f"{key:<60} n={result['requests']:<5} rps={result['rps']:>8} p50={result['p50_ms']:>8} "
+                    f"p95={result['p95_ms']:>8} p99={result['p99_ms']:>8} queries={result['queries_max']}/{budget}"
+                    + (f" errors={result['errors']}" if result["errors"] else "")
+                )
+    finally:
+        if server is not None:
+            await server.__aexit__()
+        if settings.USE_ASYNC_DB:
+            # Cierra las conexiones aiosqlite/asyncpg dentro del mismo event loop
+            from app.database.async_connection import async_engine, async_replica_engines
+
+            for engine in (async_engine, *async_replica_engines):
+                await engine.dispose()
+
+    return routes, uncovered
+
+
+def main():
+    args = parse_args()
+    tmpdir = tempfile.mkdtemp(prefix="academic-load-")
+    if args.database_url is None:
+        args.database_url = f"sqlite:///{os.path.join(tmpdir, 'load.db')}"
+
+    # La configuración se lee al importar la app; las consultas se
+    # cuentan con las trazas de SQL_TRACE (Server-Timing)
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["SQL_TRACE"] = "true"
+    os.environ.setdefault("SQL_SLOW_QUERY_MS", "1000000")
+
+    import fastapi
+    import sqlalchemy
+    from sqlalchemy import func, select
+
+    from app.database.config import settings
+    from app.database.connection import engine
+    from app.main import app
+    from app.models.course_model import CourseModel
+    from app.models.professor_model import ProfessorModel
+    from app.models.student_model import StudentModel
+    from benchmarks.seed import prepare_schema, seed_database
+
+    if args.no_seed:
+        seeded = None
+    else:
+        if not prepare_schema(engine, reset=True):
+            sys.exit("could not reset the database")
+        seeded = seed_database(
+            engine,
+            professors=args.professors,
+            students=args.students,
+            courses=args.courses,
+            enrollments_per_student=args.enrollments_per_student,
+            seed=args.seed,
+        )
+        print(f"seeded in {seeded['seconds']} s: {seeded['enrollments']} enrollments")
+
+    with engine.connect() as conn:
+        context = {
+            "tag": uuid.uuid4().hex[:8],
+            "professors": conn.scalar(select(func.max(ProfessorModel.id))),
+            "students": conn.scalar(select(func.max(StudentModel.id))),
+            "courses": conn.scalar(select(func.max(CourseModel.id))),
+            "busiest_course": seeded["busiest_course"] if seeded else 1,
+        }
+
+    routes, uncovered = asyncio.run(run(args, app, context))
+
+    report = {
+        "meta": {
+            "git_commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "target": args.target,
+            "concurrency": args.concurrency,
+            "requests_per_route": args.requests_per_route,
+            "database": engine.url.get_backend_name(),
+            "use_async_db": settings.USE_ASYNC_DB,
+            "cache_backend": settings.CACHE_BACKEND,
+            "fast_json_responses": settings.FAST_JSON_RESPONSES,
+            "seed": seeded,
+            "python": platform.python_version(),
+            "fastapi": fastapi.__version__,
+            "sqlalchemy": sqlalchemy.__version__,
+        },
+        "routes": routes,
+        "uncovered": uncovered,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"report written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            compare(report, json.load(handle))
+
+    over_budget = [key for key, result in routes.items() if result["within_budget"] is False]
+    failed = [key for key, result in routes.items() if result["errors"]]
+    for key in failed:
+        print(f"ERRORS {key}: {routes[key]['error_samples']}")
+    if uncovered:
+        print(f"routes without a load scenario: {uncovered}")
+    if over_budget:
+        print(f"over the query budget: {over_budget}")
+    if uncovered or over_budget or failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Contador de sentencias SQL para los benchmarks y chequeos de presupuesto.
+
+    with QueryCounter() as counter:
+        client.get("/enrollments/course/1/students")
+    assert counter.count <= 2, counter.statements
+
+Sin argumentos cuenta en los engines con los que la app sirve las
+peticiones (serving_engines): el engine síncrono o, con
+USE_ASYNC_DB=true, el ``sync_engine`` del engine asíncrono, más las
+réplicas de lectura configuradas.
+"""
+
+from sqlalchemy import event
+
+from app.database.config import settings
+
+
+def serving_engines():
+    """Sync engines behind the sessions the routes use (primary and read replicas)."""
+    if settings.USE_ASYNC_DB:
+        from app.database.async_connection import async_engine, async_replica_engines
+
+        return [async_engine.sync_engine] + [replica.sync_engine for replica in async_replica_engines]
+
+    from app.database.connection import engine, replica_engines
+
+    return [engine] + list(replica_engines)
+
+
+class QueryCounter:
+    """Counts the statements the engines send to the database inside a `with` block."""
+
+    def __init__(self, *engines):
+        self.engines = list(engines) or serving_engines()
+        self.statements = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        self.statements = []
+        for engine in self.engines:
+            event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc):
+        for engine in self.engines:
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        return False
@@ -0,0 +1,132 @@
+"""
+Chequeo de número de consultas en rosters y horarios (N+1).
+
+Crea un curso con 500 estudiantes inscritos y un estudiante inscrito en
+muchos cursos, y verifica que servir cada lista completa por la API cueste
+un número fijo de sentencias SQL, sin importar cuántas filas tenga:
+
+    GET /enrollments/course/{id}/students   -> existencia + 1 JOIN
+    GET /enrollments/student/{id}/courses   -> existencia + 1 JOIN
+    GET /courses/{id}?expand=...            -> curso + profesor (JOIN) + 1 IN por colección
+    GET /students/{id}?expand=...           -> estudiante + 1 IN por colección
+    GET /professors/{id}?expand=courses     -> profesor + 1 IN
+    DELETE /professors/{id}                 -> cascada con selectinload
+
+Uso:
+    python -m benchmarks.roster_query_count --students 500
+    USE_ASYNC_DB=true python -m benchmarks.roster_query_count --students 500
+
+Sale con código 1 si alguna ruta supera su presupuesto.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+
+# Sentencias máximas por petición (independientes del tamaño del roster)
+BUDGETS = {
+    "roster": 2,
+    "schedule": 2,
+    "course+expand": 3,
+    "student+expand": 3,
+    "professor+expand": 2,
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Assert a fixed statement count for rosters.")
+    parser.add_argument("--students", type=int, default=500, help="Students in the roster")
+    parser.add_argument("--courses", type=int, default=50, help="Courses in the schedule")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="academic-roster-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmpdir, 'roster.db')}"
+
+    from fastapi.testclient import TestClient
+
+    from app.database.connection import Base, SessionLocal, engine
+    from app.main import app
+    from app.models.course_model import CourseModel
+    from app.models.enrollment_model import EnrollmentModel
+    from app.models.professor_model import ProfessorModel
+    from app.models.student_model import StudentModel
+    from app.models.waitlist_model import WaitlistEntryModel  # noqa: F401 (registro del modelo)
+    from benchmarks.query_counter import QueryCounter
+
+    Base.metadata.create_all(engine)
+
+    with SessionLocal() as db:
+        db.add(ProfessorModel(name="Professor", email="professor@university.com"))
+        db.add_all([StudentModel(name=f"Student {i}", email=f"s{i}@university.com") for i in range(args.students)])
+        db.add_all([
+            CourseModel(code=f"C{i}", name=f"Course {i}", professor_id=1, seats_taken=0)
+            for i in range(args.courses)
+        ])
+        db.flush()
+        db.add_all([EnrollmentModel(course_id=1, student_id=i + 1) for i in range(args.students)])
+        db.add_all([EnrollmentModel(course_id=i + 1, student_id=1) for i in range(1, args.courses)])
+        db.commit()
+
+    client = TestClient(app)
+    failed = False
+
+    checks = [
+        ("roster", f"/enrollments/course/1/students?limit={args.students}", args.students),
+        ("schedule", f"/enrollments/student/1/courses?limit={args.students}", args.courses),
+    ]
+    for name, path, expected_items in checks:
+        with QueryCounter() as counter:
+            response = client.get(path)
+        response.raise_for_status()
+
+        # El perfil SQLite emite BEGIN explícito; no cuenta como consulta
+        statements = [s for s in counter.statements if s.strip().upper() not in ("BEGIN", "BEGIN IMMEDIATE")]
+        items = len(response.json()["items"])
+        # Cero sentencias = el contador no ve el engine que sirvió la petición
+        ok = 0 < len(statements) <= BUDGETS[name] and items == expected_items
+        failed = failed or not ok
+        print(f"{name:<9} items={items:<5} statements={len(statements)} budget={BUDGETS[name]} -> {'OK' if ok else 'FAIL'}")
+        if not ok:
+            for statement in statements:
+                print(f"    {' '.join(statement.split())[:160]}")
+
+    # Detalle con relaciones anidadas: consultas fijas por colección
+    expansions = [
+        ("course+expand", "/courses/1?expand=professor,students,enrollments", {"students": args.students, "enrollments": args.students}),
+        ("student+expand", "/students/1?expand=courses,enrollments", {"courses": args.courses, "enrollments": args.courses}),
+        ("professor+expand", "/professors/1?expand=courses", {"courses": args.courses}),
+    ]
+    for name, path, expected in expansions:
+        with QueryCounter() as counter:
+            response = client.get(path)
+        response.raise_for_status()
+
+        statements = [s for s in counter.statements if s.strip().upper() not in ("BEGIN", "BEGIN IMMEDIATE")]
+        sizes = {relation: len(response.json()[relation]) for relation in expected}
+        ok = 0 < len(statements) <= BUDGETS[name] and sizes == expected
+        failed = failed or not ok
+        print(f"{name:<16} {sizes} statements={len(statements)} budget={BUDGETS[name]} -> {'OK' if ok else 'FAIL'}")
+        if not ok:
+            for statement in statements:
+                print(f"    {' '.join(statement.split())[:160]}")
+
+    # Cascada del profesor: carga de cursos + inscripciones en consultas IN,
+    # no una consulta por curso.
+    with QueryCounter() as counter:
+        response = client.delete("/professors/1")
+    selects = [s for s in counter.statements if s.lstrip().upper().startswith("SELECT")]
+    ok = response.status_code == 204 and 0 < len(selects) <= 3
+    failed = failed or not ok
+    print(f"{'cascade':<9} courses={args.courses:<3} selects={len(selects)} budget=3 -> {'OK' if ok else 'FAIL'}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark de latencia de la búsqueda de texto (SearchController).
+
+Siembra una base con benchmarks.seed (o usa una existente con
+--no-seed) y mide cada consulta de QUERIES --repeat veces, primera
+página con y sin facetas. Reporta p50/p95 en ms, coincidencias,
+resultados, si las facetas se omitieron (más de
+SEARCH_FACET_MAX_MATCHES coincidencias) y si el p95 queda bajo
+--target-ms. El orden por relevancia es global, así que el costo sigue
+al número de coincidencias: las consultas amplias quedan sobre el
+objetivo.
+
+Las consultas van de amplias ("ana": un nombre de cada diez; "va":
+prefijo de dos letras) a selectivas (un correo, un código de curso).
+
+Uso:
+    python -m benchmarks.search_latency --students 1000000 --courses 20000 --professors 2000
+    python -m benchmarks.search_latency --database-url sqlite:///./bench.db --no-seed
+    SEARCH_FACET_MAX_MATCHES=50000 python -m benchmarks.search_latency --no-seed --database-url sqlite:///./bench.db
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.seed import DEFAULT_SIZES
+
+
+# (entidad, consulta, filtros)
+QUERIES = [
+    ("students", "ana", {}),
+    ("students", "va", {}),
+    ("students", "ana garcia", {}),
+    ("students", "ana", {"degree": "Physics"}),
+    ("students", "student123", {}),
+    ("students", "student4242@university.com", {}),
+    ("professors", "phd lopez", {}),
+    ("professors", "professor17", {}),
+    ("courses", "algorithms", {}),
+    ("courses", "calculus", {"has_seats": True}),
+    ("courses", "c000042", {}),
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Measure full-text search latency.")
+    parser.add_argument("--database-url", default=None, help="Default: temp SQLite file")
+    parser.add_argument("--no-seed", action="store_true", help="Use the existing data in --database-url")
+    parser.add_argument("--professors", type=int, default=DEFAULT_SIZES["professors"])
+    parser.add_argument("--students", type=int, default=DEFAULT_SIZES["students"])
+    parser.add_argument("--courses", type=int, default=DEFAULT_SIZES["courses"])
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query")
+    parser.add_argument("--limit", type=int, default=20, help="Page size")
+    parser.add_argument("--target-ms", type=float, default=10.0, help="p95 target per query")
+    return parser.parse_args()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def main():
+    args = parse_args()
+    tmpdir = tempfile.mkdtemp(prefix="academic-search-")
+    if args.database_url is None:
+        args.database_url = f"sqlite:///{os.path.join(tmpdir, 'search.db')}"
+    os.environ["DATABASE_URL"] = args.database_url
+
+    from app.controllers.search_controller import SearchController
+    from app.database.config import settings
+    from app.database.connection import SessionLocal, engine
+    from app.models import enrollment_model, waitlist_model  # noqa: F401 (registro de relaciones)
+    from benchmarks.seed import prepare_schema, seed_database
+
+    if not args.no_seed:
+        prepare_schema(engine, reset=True)
+        summary = seed_database(engine, professors=args.professors, students=args.students, courses=args.courses)
+        print(f"seeded in {summary['seconds']} s (facets up to {settings.SEARCH_FACET_MAX_MATCHES} matches)")
+
+    with SessionLocal() as db:
+        for entity, query, filters in QUERIES:
+            for facets in (False, True):
+                timings = []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    result = SearchController.search(db, entity, query, args.limit, None, filters, facets)
+                    timings.append((time.perf_counter() - started) * 1000)
+
+                p95 = percentile(timings, 95)
+                label = f"{entity} {query!r}" + (f" {filters}" if filters else "")
+                print(
+                    f"{label:<48} facets={'on ' if facets else 'off'} results={len(result['items']):<3} "
+                    f"facets_omitted={str(result['facets_omitted']):<5} p50={percentile(timings, 50):7.2f} p95={p95:7.2f} ms "
+                    f"-> {'OK' if p95 <= args.target_ms else 'OVER TARGET'}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Generador determinista de datos sintéticos para los benchmarks.
+
+Crea --professors profesores, --students estudiantes y --courses cursos
+y reparte las inscripciones de forma realista:
+
+- cada estudiante toma en promedio --enrollments-per-student cursos
+  (distribución triangular entre 1 y 2·promedio − 1);
+- la popularidad de los cursos sigue una ley de Zipf (unos pocos cursos
+  concentran la demanda y se llenan, la mayoría tiene pocos inscritos);
+- los cupos (maximum_capacity) se respetan; ~10 % de los cursos no
+  tienen límite;
+- ~5 % de las inscripciones quedan en estado "cancelado" (no ocupan
+  cupo), para ejercitar los filtros por estado;
+- courses.seats_taken queda igual al número de inscripciones activas;
+- el índice de búsqueda (app/core/search.py) se reconstruye al final.
+
+Todo sale de random.Random(--seed) y de fechas fijas: la misma semilla
+y los mismos tamaños producen exactamente las mismas filas. Las filas
+se insertan con INSERT masivos (executemany) en lotes de --chunk-size,
+sin pasar por el ORM, así escala a millones de inscripciones.
+
+Uso:
+    python -m benchmarks.seed --database-url sqlite:///./bench.db --reset
+    python -m benchmarks.seed --students 1000000 --courses 20000 --professors 2000 --reset
+
+Sin --reset se niega a escribir en una base que ya tiene estudiantes.
+"""
+
+import argparse
+import bisect
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+
+DEFAULT_SIZES = {
+    "professors": 50,
+    "students": 5000,
+    "courses": 200,
+    "enrollments_per_student": 4,
+}
+
+DROPPED_STATE = "cancelado"
+DROPPED_SHARE = 0.05
+UNLIMITED_SHARE = 0.10
+CAPACITIES = (25, 30, 40, 60, 120, 250)
+ZIPF_EXPONENT = 1.07
+
+# Fechas fijas: el resultado no depende del día en que se corre
+BASE_DATE = datetime(2025, 1, 6, 8, 0)
+ENROLLMENT_WINDOW_SECONDS = 120 * 24 * 3600
+
+FIRST_NAMES = ("Ana", "Luis", "María", "Carlos", "Sofía", "Jorge", "Valentina", "Andrés", "Camila", "Diego")
+LAST_NAMES = ("García", "Rodríguez", "Martínez", "López", "Gómez", "Pérez", "Sánchez", "Ramírez", "Torres", "Valencia")
+DEGREES = ("Software Engineering", "Systems Engineering", "Mathematics", "Physics", "Economics", None)
+TITLES = ("PhD", "MSc", "Eng.", None)
+SUBJECTS = ("Algorithms", "Databases", "Calculus", "Statistics", "Networks", "Physics", "Economics", "Compilers")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Seed the database with deterministic synthetic data.")
+    parser.add_argument("--database-url", default=None, help="Default: DATABASE_URL / settings")
+    parser.add_argument("--professors", type=int, default=DEFAULT_SIZES["professors"])
+    parser.add_argument("--students", type=int, default=DEFAULT_SIZES["students"])
+    parser.add_argument("--courses", type=int, default=DEFAULT_SIZES["courses"])
+    parser.add_argument("--enrollments-per-student", type=float, default=DEFAULT_SIZES["enrollments_per_student"])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Rows per INSERT batch")
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate every table first")
+    return parser.parse_args()
+
+
+def _person(rng, index):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {index}"
+
+
+def _insert_chunks(engine, table, rows, chunk_size):
+    """executemany INSERT of `rows` (an iterable of dicts) in batches of chunk_size."""
+    from sqlalchemy import insert
+
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            with engine.begin() as conn:
+                conn.execute(insert(table), chunk)
+            chunk = []
+    if chunk:
+        with engine.begin() as conn:
+            conn.execute(insert(table), chunk)
+
+
+def seed_database(
+    engine,
+    professors: int = DEFAULT_SIZES["professors"],
+    students: int = DEFAULT_SIZES["students"],
+    courses: int = DEFAULT_SIZES["courses"],
+    enrollments_per_student: float = DEFAULT_SIZES["enrollments_per_student"],
+    seed: int = 42,
+    chunk_size: int = 10000,
+) -> dict:
+    """
+    Inserts the synthetic rows into an empty schema and returns a
+    summary (sizes, enrollment counts, the busiest course...).
+    """
+    from sqlalchemy import bindparam, update
+    from sqlalchemy.orm import Session
+
+    from app.core.search import SearchIndex
+    from app.models.course_model import CourseModel
+    from app.models.enrollment_model import ENROLLED_STATE, EnrollmentModel
+    from app.models.professor_model import ProfessorModel
+    from app.models.student_model import StudentModel
+
+    rng = random.Random(seed)
+    started = time.perf_counter()
+
+    def stamp(index):
+        moment = BASE_DATE + timedelta(minutes=index)
+        return {"created_at": moment, "updated_at": moment}
+
+    _insert_chunks(engine, ProfessorModel.__table__, (
+        {
+            "id": i + 1,
+            "name": _person(rng, i + 1),
+            "email": f"professor{i + 1}@university.com",
+            "tittle": rng.choice(TITLES),
+            "contratation_date": date(2005, 1, 1) + timedelta(days=rng.randrange(7000)),
+            **stamp(i),
+        }
+        for i in range(professors)
+    ), chunk_size)
+
+    _insert_chunks(engine, StudentModel.__table__, (
+        {
+            "id": i + 1,
+            "name": _person(rng, i + 1),
+            "email": f"student{i + 1}@university.com",
+            "birthdate": date(1995, 1, 1) + timedelta(days=rng.randrange(3650)),
+            "degree": rng.choice(DEGREES),
+            **stamp(i),
+        }
+        for i in range(students)
+    ), chunk_size)
+
+    capacities = [None if rng.random() < UNLIMITED_SHARE else rng.choice(CAPACITIES) for _ in range(courses)]
+    _insert_chunks(engine, CourseModel.__table__, (
+        {
+            "id": i + 1,
+            "code": f"C{i + 1:06d}",
+            "name": f"{rng.choice(SUBJECTS)} {100 + rng.randrange(400)}",
+            "description": f"Synthetic course {i + 1} generated with seed {seed}.",
+            "professor_id": rng.randrange(professors) + 1 if professors else None,
+            "maximum_capacity": capacities[i],
+            "seats_taken": 0,
+            **stamp(i),
+        }
+        for i in range(courses)
+    ), chunk_size)
+
+    # Popularidad Zipf sobre un orden aleatorio de los cursos
+    order = list(range(courses))
+    rng.shuffle(order)
+    weights = [0.0] * courses
+    for rank, course in enumerate(order):
+        weights[course] = 1 / (rank + 1) ** ZIPF_EXPONENT
+    cumulative = []
+    total = 0.0
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+
+    taken = [0] * courses
+    counts = {"active": 0, "dropped": 0}
+    high = max(1.0, 2 * enrollments_per_student - 1)
+
+    def enrollments():
+        next_id = 1
+        for student in range(students):
+            wanted = min(courses, max(1, round(rng.triangular(1, high, enrollments_per_student))))
+            chosen = set()
+            # Rechazo acotado: un curso lleno o repetido se vuelve a sortear
+            for _ in range(wanted * 10):
+                if len(chosen) >= wanted:
+                    break
+                course = min(bisect.bisect_left(cumulative, rng.random() * total), courses - 1)
+                if course in chosen:
+                    continue
+                if capacities[course] is not None and taken[course] >= capacities[course]:
+                    continue
+                dropped = rng.random() < DROPPED_SHARE
+
+                chosen.add(course)
+                if dropped:
+                    counts["dropped"] += 1
+                else:
+                    taken[course] += 1
+                    counts["active"] += 1
+
+                moment = BASE_DATE + timedelta(seconds=rng.randrange(ENROLLMENT_WINDOW_SECONDS))
+                yield {
+                    "id": next_id,
+                    "course_id": course + 1,
+                    "student_id": student + 1,
+                    "inscription_date": moment,
+                    "state": DROPPED_STATE if dropped else ENROLLED_STATE,
+                    "created_at": moment,
+                    "updated_at": moment,
+                }
+                next_id += 1
+
+    _insert_chunks(engine, EnrollmentModel.__table__, enrollments(), chunk_size)
+
+    # seats_taken = inscripciones activas (contadas al generarlas); updated_at
+    # se reescribe con su propio valor para que el onupdate no use la hora actual
+    course_table = CourseModel.__table__
+    updates = [{"course": i + 1, "taken": n} for i, n in enumerate(taken) if n]
+    for start in range(0, len(updates), chunk_size):
+        with engine.begin() as conn:
+            conn.execute(
+                update(course_table)
+                .where(course_table.c.id == bindparam("course"))
+                .values(seats_taken=bindparam("taken"), updated_at=course_table.c.updated_at),
+                updates[start:start + chunk_size],
+            )
+
+    # Las filas no pasaron por los controladores: índice de búsqueda completo
+    with Session(engine) as db:
+        SearchIndex.rebuild(db)
+        db.commit()
+
+    busiest = max(range(courses), key=taken.__getitem__) + 1 if courses else None
+    return {
+        "seed": seed,
+        "professors": professors,
+        "students": students,
+        "courses": courses,
+        "enrollments": counts["active"] + counts["dropped"],
+        "active_enrollments": counts["active"],
+        "dropped_enrollments": counts["dropped"],
+        "full_courses": sum(1 for i in range(courses) if capacities[i] is not None and taken[i] >= capacities[i]),
+        "busiest_course": busiest,
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def prepare_schema(engine, reset: bool):
+    """Creates the tables (dropping them first with reset). False if data exists."""
+    from sqlalchemy import func, select
+
+    from app.core import search  # noqa: F401 (crea las tablas FTS5 con create_all)
+    from app.database.connection import Base
+    from app.models import course_model, enrollment_model, professor_model, waitlist_model  # noqa: F401 (registro de modelos)
+    from app.models.student_model import StudentModel
+
+    if reset:
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    with engine.connect() as conn:
+        return conn.scalar(select(func.count()).select_from(StudentModel.__table__)) == 0
+
+
+def main():
+    args = parse_args()
+    if args.database_url:
+        # La configuración se lee al importar la app
+        os.environ["DATABASE_URL"] = args.database_url
+
+    from app.database.connection import engine
+
+    if not prepare_schema(engine, args.reset):
+        sys.exit(f"{engine.url} already has data; use --reset to drop and reseed it")
+
+    summary = seed_database(
+        engine,
+        professors=args.professors,
+        students=args.students,
+        courses=args.courses,
+        enrollments_per_student=args.enrollments_per_student,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+    )
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark de serialización de listados grandes.
+
+Carga --rows estudiantes y cursos desde SQLite (objetos ORM, como los
+devuelven los controladores) y serializa un Page[StudentRead] y un
+Page[CourseRead] de --rows elementos por dos caminos:
+
+- estándar: lo que hace FastAPI con response_model (serialize_response:
+  validación from_attributes + dump a dicts, y luego JSONResponse)
+- rápido:   response_encoder() de app/core/serialization.py (una pasada
+  a bytes con orjson)
+
+Comprueba que el JSON sea idéntico byte a byte y reporta la mediana de
+--repeat repeticiones.
+
+Uso:
+    python -m benchmarks.serialization --rows 10000
+
+Sale con código 1 si los cuerpos difieren.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare FastAPI's response_model serialization with the fast encoder.")
+    parser.add_argument("--rows", type=int, default=10000, help="Rows per list")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path")
+    return parser.parse_args()
+
+
+def seed(rows):
+    from app.core import search  # noqa: F401 (crea las tablas FTS5 con create_all)
+    from app.database.connection import Base, SessionLocal, engine
+    from app.models.course_model import CourseModel
+    from app.models.enrollment_model import EnrollmentModel  # noqa: F401 (registro del modelo)
+    from app.models.professor_model import ProfessorModel
+    from app.models.student_model import StudentModel
+    from app.models.waitlist_model import WaitlistEntryModel  # noqa: F401 (registro del modelo)
+
+    Base.metadata.create_all(engine)
+
+    with SessionLocal() as db:
+        db.add(ProfessorModel(name="Professor 1", email="professor1@university.com"))
+        db.add_all([
+            StudentModel(
+                name=f"Estudiante {i}", email=f"student{i}@university.com",
+                birthdate=date(2000 + i % 5, 1 + i % 12, 1 + i % 28), degree="Ingeniería" if i % 2 else None,
+            )
+            for i in range(rows)
+        ])
+        db.flush()
+        db.add_all([
+            CourseModel(code=f"C{i}", name=f"Course {i}", professor_id=1, maximum_capacity=30 if i % 3 else None)
+            for i in range(rows)
+        ])
+        db.commit()
+
+
+def timed(fn, repeat):
+    samples = []
+    body = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return body, statistics.median(samples)
+
+
+def main():
+    args = parse_args()
+    tmpdir = tempfile.mkdtemp(prefix="academic-serialization-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmpdir, 'serialization.db')}"
+
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+
+    from app.core.serialization import response_encoder
+    from app.database.connection import SessionLocal
+    from app.models.course_model import CourseModel
+    from app.models.student_model import StudentModel
+    from app.schemas.course_schema import CourseRead
+    from app.schemas.pagination_schema import Page
+    from app.schemas.student_schema import StudentRead
+
+    seed(args.rows)
+
+    failed = False
+    with SessionLocal() as db:
+        for label, model, schema in (("StudentRead", StudentModel, StudentRead), ("CourseRead", CourseModel, CourseRead)):
+            rows = db.query(model).order_by(model.id).all()
+            page = {"items": rows, "next_cursor": "aWQ6MTAwMDA", "limit": len(rows)}
+            response_type = Page[schema]
+
+            field = create_model_field(name="Response", type_=response_type, mode="serialization")
+
+            def standard():
+                content = asyncio.run(serialize_response(field=field, response_content=page, is_coroutine=True))
+                return JSONResponse(content).body
+
+            encode = response_encoder(response_type)
+
+            def fast():
+                return encode(page)
+
+            standard_body, standard_ms = timed(standard, args.repeat)
+            fast_body, fast_ms = timed(fast, args.repeat)
+
+            identical = standard_body == fast_body
+            failed = failed or not identical
+            print(
+                f"Page[{label}] rows={len(rows):<6} bytes={len(fast_body):<9} "
+                f"standard={standard_ms:8.1f} ms  fast={fast_ms:7.1f} ms  "
+                f"speedup={standard_ms / fast_ms:5.1f}x  identical={identical}"
+            )
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
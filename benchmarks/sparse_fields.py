@@ -0,0 +1,92 @@
+"""
+Benchmark de campos parciales (``?fields=``).
+
+Carga --rows cursos (con una descripción larga) y estudiantes, y pide la
+misma página completa y con ``fields=`` por la API. Reporta por petición
+los bytes de la respuesta, las columnas del SELECT y la mediana de
+latencia de --repeat repeticiones.
+
+Uso:
+    python -m benchmarks.sparse_fields --rows 500
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare full and sparse (fields=) list responses.")
+    parser.add_argument("--rows", type=int, default=500, help="Courses and students to seed (one page)")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed requests per case")
+    return parser.parse_args()
+
+
+def seed(rows):
+    from app.core import search  # noqa: F401 (crea las tablas FTS5 con create_all)
+    from app.database.connection import Base, SessionLocal, engine
+    from app.models.course_model import CourseModel
+    from app.models.enrollment_model import EnrollmentModel  # noqa: F401 (registro del modelo)
+    from app.models.professor_model import ProfessorModel
+    from app.models.student_model import StudentModel
+    from app.models.waitlist_model import WaitlistEntryModel  # noqa: F401 (registro del modelo)
+
+    Base.metadata.create_all(engine)
+
+    with SessionLocal() as db:
+        db.add(ProfessorModel(name="Professor 1", email="professor1@university.com"))
+        db.add_all([StudentModel(name=f"Student {i}", email=f"student{i}@university.com", degree="Ingeniería") for i in range(rows)])
+        db.flush()
+        db.add_all([
+            CourseModel(code=f"C{i}", name=f"Course {i}", description="Lorem ipsum dolor sit amet. " * 20, professor_id=1)
+            for i in range(rows)
+        ])
+        db.commit()
+
+
+def main():
+    args = parse_args()
+    tmpdir = tempfile.mkdtemp(prefix="academic-fields-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmpdir, 'fields.db')}"
+    os.environ["CACHE_BACKEND"] = "none"
+
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from benchmarks.query_counter import QueryCounter
+
+    seed(args.rows)
+    client = TestClient(app)
+    limit = min(args.rows, 500)
+
+    cases = [
+        ("/courses/", None),
+        ("/courses/", "id,name,code"),
+        ("/students/", None),
+        ("/students/", "id,name"),
+    ]
+    for path, fields in cases:
+        url = f"{path}?limit={limit}" + (f"&fields={fields}" if fields else "")
+
+        with QueryCounter() as counter:
+            response = client.get(url)
+        response.raise_for_status()
+        select = next(s for s in counter.statements if s.lstrip().upper().startswith("SELECT"))
+        columns = select.upper().split(" FROM ")[0].count(" AS ")
+
+        samples = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            client.get(url)
+            samples.append((time.perf_counter() - started) * 1000)
+
+        print(
+            f"{path:<11} fields={fields or '(all)':<14} bytes={len(response.content):<8} "
+            f"columns={columns:<3} p50={statistics.median(samples):6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Benchmark: varios workers de uvicorn sobre un mismo archivo SQLite.
+
+Levanta la API con `uvicorn --workers N` (procesos reales, como en
+producción) apuntando al mismo archivo y la golpea con una carga mixta
+de lecturas y escrituras:
+
+    60 %  GET  /students/{id}
+    25 %  PUT  /students/{id}
+    15 %  POST /enrollments/course/{id}   (400 por cupo/duplicado es válido)
+
+Cada combinación se corre con el perfil de SQLite apagado
+(SQLITE_PROFILE=false: journal DELETE, sin busy_timeout ni BEGIN
+IMMEDIATE) y encendido, y reporta req/s, p50/p99 y errores 5xx
+("database is locked"). Sale con código 1 si alguna corrida tuvo
+errores 5xx (muestra el primero para diagnosticarlo).
+
+La caché de entidades se desactiva para que las lecturas lleguen a SQLite.
+
+Uso:
+    python -m benchmarks.sqlite_workers --workers 1,2,4 --requests 3000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="SQLite throughput with several uvicorn workers.")
+    parser.add_argument("--workers", default="1,2,4", help="Comma separated worker counts")
+    parser.add_argument("--requests", type=int, default=3000, help="Requests per run")
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent in-flight requests")
+    parser.add_argument("--students", type=int, default=2000, help="Students to seed")
+    parser.add_argument("--courses", type=int, default=50, help="Courses to seed")
+    return parser.parse_args()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def seed(path, n_students, n_courses):
+    """Fresh database file (default rollback journal) with the benchmark rows."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.core import search  # noqa: F401 (crea las tablas FTS5 con create_all)
+    from app.database.connection import Base
+    from app.models.course_model import CourseModel
+    from app.models.enrollment_model import EnrollmentModel  # noqa: F401 (registro del modelo)
+    from app.models.professor_model import ProfessorModel
+    from app.models.student_model import StudentModel
+    from app.models.waitlist_model import WaitlistEntryModel  # noqa: F401 (registro del modelo)
+
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    # Engine sin perfil: el modo de journal lo decide cada servidor
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        db.add(ProfessorModel(name="Bench Professor", email="bench.professor@university.com"))
+        db.add_all([StudentModel(name=f"Student {i}", email=f"student{i}@university.com") for i in range(n_students)])
+        db.flush()
+        db.add_all([
+            CourseModel(code=f"C{i}", name=f"Course {i}", professor_id=1, maximum_capacity=n_students)
+            for i in range(n_courses)
+        ])
+        db.commit()
+    engine.dispose()
+
+
+def start_server(path, workers, profile):
+    port = free_port()
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{path}",
+        SQLITE_PROFILE="true" if profile else "false",
+        CACHE_BACKEND="none",
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        env=env,
+    )
+
+    import httpx
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/", timeout=1).status_code == 200:
+                return process, port
+        except httpx.HTTPError:
+            time.sleep(0.2)
+
+    process.terminate()
+    raise RuntimeError("uvicorn did not start")
+
+
+async def run_load(port, args):
+    import httpx
+
+    rng = random.Random(7)
+    latencies, errors, first_error = [], 0, None
+    semaphore = asyncio.Semaphore(args.concurrency)
+    limits = httpx.Limits(max_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60) as client:
+
+        def request(i):
+            roll = rng.random()
+            student_id = rng.randint(1, args.students)
+
+            if roll < 0.60:
+                return client.get(f"/students/{student_id}")
+            if roll < 0.85:
+                return client.put(
+                    f"/students/{student_id}",
+                    json={"name": f"Student {student_id} r{i}", "email": f"student{student_id - 1}@university.com"},
+                )
+            course_id = rng.randint(1, args.courses)
+            return client.post(
+                f"/enrollments/course/{course_id}",
+                json={"course_id": course_id, "student_id": student_id},
+            )
+
+        async def one(i):
+            nonlocal errors, first_error
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await request(i)
+                except httpx.TransportError as error:
+                    # Conexión cortada por el servidor (worker caído o saturado)
+                    errors += 1
+                    first_error = first_error or f"{type(error).__name__}: {error}"
+                    return
+                latencies.append(time.perf_counter() - started)
+                if response.status_code >= 500:
+                    errors += 1
+                    first_error = first_error or (
+                        f"{response.request.method} {response.request.url.path} -> "
+                        f"{response.status_code} {response.text[:200]}"
+                    )
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(args.requests)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "rps": round(args.requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "errors": errors,
+        "first_error": first_error,
+    }
+
+
+def main():
+    args = parse_args()
+    path = os.path.join(tempfile.mkdtemp(prefix="academic-workers-"), "workers.db")
+
+    print(f"requests: {args.requests}  concurrency: {args.concurrency}")
+    print(f"{'profile':<8} {'workers':>7} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'5xx':>6}")
+    failed = False
+    for profile in (False, True):
+        for workers in (int(w) for w in args.workers.split(",")):
+            seed(path, args.students, args.courses)
+            process, port = start_server(path, workers, profile)
+            try:
+                r = asyncio.run(run_load(port, args))
+            finally:
+                process.terminate()
+                process.wait(timeout=30)
+
+            label = "on" if profile else "off"
+            print(f"{label:<8} {workers:>7} {r['rps']:>9} {r['p50_ms']:>9} {r['p99_ms']:>9} {r['errors']:>6}")
+            if r["errors"]:
+                failed = True
+                print(f"         first 5xx: {r['first_error']}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
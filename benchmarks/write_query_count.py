@@ -0,0 +1,116 @@
+"""
+Chequeo de número de sentencias en create/update.
+
+Las altas y modificaciones de estudiantes, profesores y cursos se apoyan
+en las restricciones UNIQUE de la base: un solo INSERT o UPDATE ...
+RETURNING por petición, también cuando hay conflicto (correo o código
+repetido), sin SELECT previo ni db.refresh() posterior. La existencia
+del profesor va dentro de la misma sentencia (INSERT ... SELECT ...
+WHERE EXISTS / UPDATE ... WHERE EXISTS), así que no depende de PRAGMA
+foreign_keys.
+
+Se cuentan las sentencias SQL de cada petición (sin BEGIN) por la API:
+
+    endpoint                               antes   después
+    POST /students/                          3        1
+    PUT  /students/{id} (nuevo email)        4        1
+    PUT  /students/{id} (email en uso)       2        1
+    POST /professors/                        3        1
+    PUT  /professors/{id} (nuevo email)      4        1
+    POST /courses/                           4        1
+    POST /courses/ (profesor inexistente)    2        1
+    PUT  /courses/{id} (código + profesor)   5        1
+    PUT  /courses/{id} (profesor inexist.)   2        2
+
+Más el BEGIN y el COMMIT de la transacción, que no cambian. Las
+escrituras que terminan bien suman el INSERT OR REPLACE al índice de
+búsqueda FTS5 (app/core/search.py), en la misma transacción. El UPDATE
+de un curso que no devuelve fila añade un SELECT del id para separar
+curso inexistente (404) de profesor inexistente (400).
+
+Uso:
+    python -m benchmarks.write_query_count
+
+Sale con código 1 si alguna petición supera su presupuesto.
+"""
+
+import os
+import sys
+import tempfile
+
+
+# Sentencias máximas por petición (+1 del índice de búsqueda si la
+# escritura se aplica)
+BUDGET = 1
+SEARCH_INDEX_WRITE = 1
+
+# El UPDATE de cursos que no devuelve fila hace un SELECT para distinguir
+# curso inexistente (404) de profesor inexistente (400)
+MISS_LOOKUP = {"PUT /courses/2 (unknown professor)": 1}
+
+
+def main():
+    tmpdir = tempfile.mkdtemp(prefix="academic-writes-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmpdir, 'writes.db')}"
+    os.environ["CACHE_BACKEND"] = "none"
+
+    from fastapi.testclient import TestClient
+
+    from app.database.connection import Base, engine
+    from app.main import app
+    from app.models import course_model, enrollment_model, professor_model, student_model, waitlist_model  # noqa: F401
+    from benchmarks.query_counter import QueryCounter
+
+    Base.metadata.create_all(engine)
+
+    client = TestClient(app)
+    client.post("/professors/", json={"name": "Professor 1", "email": "professor1@university.com"}).raise_for_status()
+    client.post("/students/", json={"name": "Student 1", "email": "student1@university.com"}).raise_for_status()
+    client.post("/courses/", json={"code": "C1", "name": "Course 1", "professor_id": 1}).raise_for_status()
+
+    checks = [
+        ("POST /students/", "post", "/students/",
+         {"name": "Student 2", "email": "student2@university.com"}, 201),
+        ("POST /students/ (duplicate email)", "post", "/students/",
+         {"name": "Student 3", "email": "student1@university.com"}, 400),
+        ("PUT /students/2 (new email)", "put", "/students/2",
+         {"name": "Student 2", "email": "student2b@university.com"}, 200),
+        ("PUT /students/2 (email in use)", "put", "/students/2",
+         {"name": "Student 2", "email": "student1@university.com"}, 400),
+        ("PUT /students/99 (not found)", "put", "/students/99",
+         {"name": "Nobody", "email": "nobody@university.com"}, 404),
+        ("POST /professors/", "post", "/professors/",
+         {"name": "Professor 2", "email": "professor2@university.com"}, 201),
+        ("PUT /professors/2 (new email)", "put", "/professors/2",
+         {"name": "Professor 2", "email": "professor2b@university.com"}, 200),
+        ("POST /courses/", "post", "/courses/",
+         {"code": "C2", "name": "Course 2", "professor_id": 1}, 201),
+        ("POST /courses/ (duplicate code)", "post", "/courses/",
+         {"code": "C1", "name": "Course 1 again", "professor_id": 1}, 400),
+        ("POST /courses/ (unknown professor)", "post", "/courses/",
+         {"code": "C3", "name": "Course 3", "professor_id": 99}, 400),
+        ("PUT /courses/2 (new code + professor)", "put", "/courses/2",
+         {"code": "C2b", "name": "Course 2", "professor_id": 2}, 200),
+        ("PUT /courses/2 (unknown professor)", "put", "/courses/2",
+         {"code": "C2b", "name": "Course 2", "professor_id": 99}, 400),
+    ]
+
+    failed = False
+    for label, method, path, payload, expected_status in checks:
+        with QueryCounter() as counter:
+            response = getattr(client, method)(path, json=payload)
+
+        statements = [s for s in counter.statements if s.strip().upper() not in ("BEGIN", "BEGIN IMMEDIATE")]
+        budget = BUDGET + (SEARCH_INDEX_WRITE if expected_status < 300 else 0) + MISS_LOOKUP.get(label, 0)
+        ok = response.status_code == expected_status and 0 < len(statements) <= budget
+        failed = failed or not ok
+        print(f"{label:<40} status={response.status_code} statements={len(statements)} budget={budget} -> {'OK' if ok else 'FAIL'}")
+        if not ok:
+            for statement in statements:
+                print(f"    {' '.join(statement.split())[:160]}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()